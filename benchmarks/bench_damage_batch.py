@@ -0,0 +1,50 @@
+"""
+Benchmark batched damage against one calculate_damage call per combination.
+
+Times the scalar calculator on a sample of attacker/defender/move triples,
+extrapolates it to the whole dex, and times the batch calculator on the whole
+dex against every damaging move. Run from the repository root:
+
+    python benchmarks/bench_damage_batch.py [--sample 20000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sample", type=int, default=20000, help="scalar calls to time")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    moves = [move for move in client.moves_client.get_all() if move.get("category") != "status"]
+    combinations = len(revomon) ** 2 * len(moves)
+
+    rng = random.Random(args.seed)
+    triples = [(rng.choice(revomon), rng.choice(revomon), rng.choice(moves)) for _ in range(args.sample)]
+    start = time.perf_counter()
+    for attacker, defender, move in triples:
+        client.calculate_damage(attacker, defender, move, stab=client._calculate_stab(move, attacker))
+    scalar = (time.perf_counter() - start) / len(triples) * combinations
+
+    start = time.perf_counter()
+    tensor = client.calculate_damage_batch(revomon, revomon, moves)
+    batched = time.perf_counter() - start
+
+    shape = " x ".join(str(size) for size in tensor["max_damage"].shape)
+    print(f"combinations: {shape} = {combinations}")
+    print(f"scalar (extrapolated): {scalar:8.2f} s")
+    print(f"batch:                 {batched:8.3f} s  ({scalar / batched:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Report import-time cost of the package entry points using ``python -X importtime``.
+
+Each statement runs in a fresh interpreter, so module caches don't hide
+regressions. Run from the repository root:
+
+    python benchmarks/bench_import_time.py [--top N] [--budget-ms MS]
+
+With ``--budget-ms`` the script exits non-zero when any statement's own
+import cost (excluding the interpreter's startup imports) goes over budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+STATEMENTS = [
+    "import revomonauto.data.gradex_clients",
+    "from revomonauto.data.gradex_clients import MovesClient",
+    "from revomonauto.data.gradex_clients import BattleMechanicsClient",
+    "from revomonauto.data.gradex_clients import *",
+    "from revomonauto.models.revomon_app import RevomonApp",
+]
+
+
+def measure(statement):
+    """Run a statement under -X importtime and return {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    error = result.stderr.strip().splitlines()[-1] if result.returncode else None
+    return timings, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=8, help="slowest modules to list per statement")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if a statement exceeds this")
+    args = parser.parse_args()
+
+    baseline, _ = measure("pass")
+    over_budget = []
+
+    for statement in STATEMENTS:
+        timings, error = measure(statement)
+        own = {module: t for module, t in timings.items() if module not in baseline}
+        total_ms = sum(self_us for self_us, _ in own.values()) / 1000
+
+        print(f"\n{statement}")
+        if error:
+            print(f"  failed: {error}")
+            continue
+        print(f"  {len(own)} modules, {total_ms:.1f} ms")
+        for module, (_, cumulative_us) in sorted(own.items(), key=lambda item: -item[1][1])[: args.top]:
+            print(f"    {cumulative_us / 1000:8.2f} ms  {module}")
+
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(statement)
+
+    if over_budget:
+        print(f"\nOver the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
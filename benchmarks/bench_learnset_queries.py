@@ -0,0 +1,77 @@
+"""
+Benchmark RevomonMovesClient learnset queries against full scans of revomon_moves.json.
+
+The scan column reproduces the per-query row scans the client used before
+the learnset index. Run from the repository root:
+
+    python benchmarks/bench_learnset_queries.py [--repeat N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import RevomonMovesClient  # noqa: E402
+
+
+def per_query_us(repeat, func, args_list):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        timings.append((time.perf_counter() - start) / len(args_list))
+    return statistics.median(timings) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="runs per measurement")
+    args = parser.parse_args()
+
+    client = RevomonMovesClient(read_only=True)
+    records = client.get_all()
+    client.get_learnset_index()
+
+    dex_ids = sorted({record["mon_dex_id"] for record in records})
+    move_names = sorted({record["move_name"] for record in records})
+    schedule = [(dex_id, 20) for dex_id in dex_ids]
+
+    def scan_moves_by_id(dex_id):
+        return [record for record in records if record.get("mon_dex_id") == dex_id]
+
+    def scan_revomon_with_move(move_name):
+        return [record for record in records if record.get("move_name") == move_name]
+
+    def scan_levelup_by_level(dex_id, level):
+        return [
+            record
+            for record in records
+            if record.get("mon_dex_id") == dex_id
+            and record.get("method") == "levelup"
+            and record.get("level") == level
+        ]
+
+    cases = [
+        ("get_moves_by_revomon_id", scan_moves_by_id, client.get_moves_by_revomon_id,
+         [(dex_id,) for dex_id in dex_ids]),
+        ("get_revomon_with_move", scan_revomon_with_move, client.get_revomon_with_move,
+         [(name,) for name in move_names]),
+        ("get_revomon_levelup_moves_by_level", scan_levelup_by_level,
+         client.get_revomon_levelup_moves_by_level, schedule),
+    ]
+
+    print(f"{len(records)} learnset rows")
+    print(f"{'query':<38}{'scan us':>10}{'index us':>11}{'speedup':>10}")
+    for name, scan, indexed, args_list in cases:
+        assert [scan(*a) for a in args_list] == [indexed(*a) for a in args_list]
+        scan_us = per_query_us(args.repeat, scan, args_list)
+        index_us = per_query_us(args.repeat, indexed, args_list)
+        print(f"{name:<38}{scan_us:>10.1f}{index_us:>11.1f}{scan_us / index_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark fuzzy name resolution against a linear edit-distance scan.
+
+Generates OCR-like corruptions of move and species names and reports the
+mean lookup time and accuracy of each method. Run from the repository root:
+
+    python benchmarks/bench_name_resolver.py [--queries 500] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import MovesClient, RevomonClient  # noqa: E402
+from revomonauto.data.gradex_clients.name_resolver import edit_distance, normalize  # noqa: E402
+
+CONFUSIONS = "olsbi0158 "
+
+
+def corrupt(name, rng):
+    chars = list(name)
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(chars))
+        roll = rng.random()
+        if roll < 0.5:
+            chars[position] = rng.choice(CONFUSIONS)
+        elif roll < 0.75 and len(chars) > 1:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice(CONFUSIONS))
+    return "".join(chars)
+
+
+def linear_scan(names, keys, text):
+    key = normalize(text)
+    distances = [edit_distance(key, other) for other in keys]
+    best = min(distances)
+    return names[distances.index(best)] if best <= max(1, len(key) // 3) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=500, help="queries per vocabulary")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'vocabulary':<12}{'names':>7}{'scan us':>10}{'index us':>10}{'speedup':>9}{'accuracy':>10}")
+    for label, client in (("moves", MovesClient(read_only=True)), ("revomon", RevomonClient(read_only=True))):
+        names = [record["name"] for record in client.get_all()]
+        keys = [normalize(name) for name in names]
+        resolver = client.get_name_resolver()
+        truth = [rng.choice(names) for _ in range(args.queries)]
+        queries = [corrupt(name, rng) for name in truth]
+
+        start = time.perf_counter()
+        scanned = [linear_scan(names, keys, query) for query in queries]
+        scan = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        resolved = [resolver.resolve(query) for query in queries]
+        indexed = (time.perf_counter() - start) / len(queries)
+
+        assert [match[0] if match else None for match in resolved] == scanned
+        accuracy = sum(match is not None and match[0] == name for match, name in zip(resolved, truth))
+        print(f"{label:<12}{len(names):>7}{scan * 1e6:>10.0f}{indexed * 1e6:>10.0f}"
+              f"{scan / indexed:>8.1f}x{accuracy / len(queries):>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
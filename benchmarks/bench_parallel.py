@@ -0,0 +1,64 @@
+"""
+Benchmark process-pool execution of bulk analytics against a single process.
+
+Computes the damage tables and simulates random matchups, first in this
+process and then on a ParallelRunner, and checks the results agree. Run
+from the repository root:
+
+    python benchmarks/bench_parallel.py [--workers N] [--matchups 200] [--samples 10000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient, ParallelRunner  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (defaults to the CPU count)")
+    parser.add_argument("--matchups", type=int, default=200, help="matchups to simulate")
+    parser.add_argument("--samples", type=int, default=10000, help="turns sampled per matchup")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    client = BattleMechanicsClient()
+    revomon = list(client.revomon_client.get_all())
+    rng = random.Random(args.seed)
+    matchups = []
+    while len(matchups) < args.matchups:
+        attacker, defender = rng.sample(revomon, 2)
+        ranked = client.find_optimal_moves(attacker, defender, top_k=1)
+        if ranked:
+            matchups.append((attacker["name"], defender["name"], ranked[0]["move"]["name"]))
+
+    with tempfile.TemporaryDirectory() as tables_dir, ParallelRunner(args.workers) as runner:
+        start = time.perf_counter()
+        client.precompute_damage_tables(tables_dir=Path(tables_dir) / "serial")
+        serial_tables = time.perf_counter() - start
+
+        start = time.perf_counter()
+        client.precompute_damage_tables(tables_dir=Path(tables_dir) / "parallel", runner=runner)
+        parallel_tables = time.perf_counter() - start
+
+        start = time.perf_counter()
+        serial = client.simulate_matchups(matchups, samples=args.samples, seed=args.seed)
+        serial_matchups = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = client.simulate_matchups(matchups, samples=args.samples, seed=args.seed, runner=runner)
+        parallel_matchups = time.perf_counter() - start
+
+    assert parallel == serial, "parallel results differ from serial"
+    print(f"workers: {runner.max_workers}")
+    print(f"damage tables      serial: {serial_tables:8.3f} s  parallel: {parallel_tables:8.3f} s")
+    print(f"{args.matchups} matchups  serial: {serial_matchups:8.3f} s  parallel: {parallel_matchups:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark cold JSON parsing against compiled snapshot loading for each dataset.
+
+Run from the repository root:
+
+    python benchmarks/bench_snapshot_load.py [--repeat N]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    AbilitiesClient,
+    CapsulesClient,
+    CounterdexClient,
+    FruitysClient,
+    ItemsClient,
+    MovesClient,
+    NaturesClient,
+    RevomonClient,
+    RevomonMovesClient,
+    TypesClient,
+)
+from revomonauto.data.gradex_clients.dataset_registry import DatasetRegistry  # noqa: E402
+from revomonauto.data.gradex_clients.snapshot_cache import SnapshotCache  # noqa: E402
+
+CLIENTS = [
+    AbilitiesClient,
+    CapsulesClient,
+    CounterdexClient,
+    FruitysClient,
+    ItemsClient,
+    MovesClient,
+    NaturesClient,
+    RevomonClient,
+    RevomonMovesClient,
+    TypesClient,
+]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SnapshotCache(cache_dir)
+        print(f"{'dataset':<22}{'records':>9}{'json+index ms':>16}{'snapshot ms':>14}{'speedup':>10}")
+
+        for client_class in CLIENTS:
+            client = client_class()
+            path = client.data_file.resolve()
+            fields = (client.get_primary_key_field(), *client.indexed_fields)
+
+            def cold_json_load():
+                with open(path, "r", encoding="utf-8") as f:
+                    client._data = json.load(f)
+                client._indexes = {}
+                for field in fields:
+                    index = client._build_index(field)
+                    if index is not None:
+                        client._indexes[field] = index
+
+            def snapshot_load():
+                DatasetRegistry(cache).get(path)
+
+            cold_json_load()
+            cache.save(path, path.stat().st_mtime_ns, client._data, client._indexes)
+
+            json_best, _ = best_of(args.repeat, cold_json_load)
+            snapshot_best, _ = best_of(args.repeat, snapshot_load)
+            print(
+                f"{path.name:<22}{len(client._data):>9}"
+                f"{json_best * 1000:>16.2f}{snapshot_best * 1000:>14.2f}"
+                f"{json_best / snapshot_best:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark streamed record iteration against loading the whole file first.
+
+Reports time to the first match, time to all matches and peak traced memory
+for a filtered, projected query over a dataset. Run from the repository root:
+
+    python benchmarks/bench_streaming_load.py [--file revomon_moves.json] [--move earthquake]
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients.streaming import iter_json_array, project  # noqa: E402
+
+JSON_DIR = Path(__file__).resolve().parents[1] / "src" / "revomonauto" / "data" / "gradex_jsons"
+
+
+def measure(query):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    matches = 0
+    for _ in query():
+        if first is None:
+            first = time.perf_counter() - start
+        matches += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first or total, total, peak, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file", default="revomon_moves.json", help="dataset file name or path")
+    parser.add_argument("--move", default="earthquake", help="move_name to filter on")
+    args = parser.parse_args()
+
+    path = Path(args.file)
+    if not path.exists():
+        path = JSON_DIR / args.file
+    fields = ("mon_name", "level")
+
+    def matches(record):
+        return record.get("move_name") == args.move
+
+    def full_load():
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        return (project(record, fields) for record in records if matches(record))
+
+    def streamed():
+        return (project(record, fields) for record in iter_json_array(path) if matches(record))
+
+    print(f"{path.name}: {path.stat().st_size / 1024:.0f} KiB")
+    print(f"{'loader':<12}{'first ms':>10}{'all ms':>10}{'peak KiB':>11}{'matches':>9}")
+    for name, query in (("json.load", full_load), ("streamed", streamed)):
+        first, total, peak, count = measure(query)
+        print(f"{name:<12}{first * 1000:>10.2f}{total * 1000:>10.2f}{peak / 1024:>11.0f}{count:>9}")
+
+
+if __name__ == "__main__":
+    main()
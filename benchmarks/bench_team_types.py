@@ -0,0 +1,48 @@
+"""
+Benchmark bitmask team type scoring against analyze_type_coverage.
+
+Draws random six-member teams from the dex, times analyze_type_coverage on
+each, then times score_team_types on the whole batch. Run from the
+repository root:
+
+    python benchmarks/bench_team_types.py [--teams 10000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=10000, help="teams to score")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    client = BattleMechanicsClient()
+    revomon = list(client.revomon_client.get_all())
+    rng = random.Random(args.seed)
+    teams = [rng.sample(revomon, 6) for _ in range(args.teams)]
+    client.score_team_types(teams[:1])
+
+    start = time.perf_counter()
+    for team in teams:
+        client.analyze_type_coverage(team)
+    per_team = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client.score_team_types(teams)
+    batched = time.perf_counter() - start
+
+    print(f"teams: {args.teams}")
+    print(f"analyze_type_coverage: {per_team:8.3f} s  ({args.teams / per_team:,.0f} teams/s)")
+    print(f"score_team_types:      {batched:8.3f} s  ({args.teams / batched:,.0f} teams/s)")
+
+
+if __name__ == "__main__":
+    main()
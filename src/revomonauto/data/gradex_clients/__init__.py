@@ -1,37 +1,97 @@
 # Clients module for Revomon data access
+#
+# Clients are imported on first attribute access (PEP 562), so a bot that only
+# needs one client doesn't pay for importing the rest.
 
-from .base_client import BaseDataClient
-from .types_client import TypesClient
-from .abilities_client import AbilitiesClient
-from .revomon_client import RevomonClient
-from .moves_client import MovesClient
-from .items_client import ItemsClient
-from .capsules_client import CapsulesClient
-from .natures_client import NaturesClient
-from .counterdex_client import CounterdexClient
-from .fruitys_client import FruitysClient
-from .revomon_moves_client import RevomonMovesClient
-from .locations_client import LocationsClient
-from .battle_mechanics_client import BattleMechanicsClient
-from .evolution_client import EvolutionClient
-from .weather_client import WeatherClient
-from .status_effects_client import StatusEffectsClient
-
-__all__ = [
-    "BaseDataClient",
-    "TypesClient",
-    "AbilitiesClient",
-    "RevomonClient",
-    "MovesClient",
-    "ItemsClient",
-    "CapsulesClient",
-    "NaturesClient",
-    "CounterdexClient",
-    "FruitysClient",
-    "RevomonMovesClient",
-    "LocationsClient",
-    "BattleMechanicsClient",
-    "EvolutionClient",
-    "WeatherClient",
-    "StatusEffectsClient",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> module that defines it
+_LAZY_ATTRS = {
+    "BaseDataClient": ".base_client",
+    "DatasetRegistry": ".dataset_registry",
+    "DamageTables": ".damage_tables",
+    "FrozenRecord": ".records",
+    "Field": ".query",
+    "Query": ".query",
+    "TextIndex": ".text_index",
+    "LearnsetIndex": ".learnset_index",
+    "NameResolver": ".name_resolver",
+    "shared_registry": ".dataset_registry",
+    "SpawnIndex": ".spawn_index",
+    "TypesClient": ".types_client",
+    "TypeChart": ".type_chart",
+    "TypeProfiles": ".type_profiles",
+    "AbilitiesClient": ".abilities_client",
+    "RevomonClient": ".revomon_client",
+    "RevomonColumns": ".revomon_columns",
+    "MovesClient": ".moves_client",
+    "ItemsClient": ".items_client",
+    "CapsulesClient": ".capsules_client",
+    "NaturesClient": ".natures_client",
+    "CounterdexClient": ".counterdex_client",
+    "CounterdexIndex": ".counterdex_index",
+    "FruitysClient": ".fruitys_client",
+    "RevomonMovesClient": ".revomon_moves_client",
+    "LocationsClient": ".locations_client",
+    "BattleMechanicsClient": ".battle_mechanics_client",
+    "EvolutionClient": ".evolution_client",
+    "EvolutionChains": ".evolution_chains",
+    "EvolutionGraph": ".evolution_graph",
+    "EffectTable": ".effect_tables",
+    "WeatherClient": ".weather_client",
+    "StatusEffectsClient": ".status_effects_client",
+    "TeamBuilder": ".team_builder",
+    "ParallelRunner": ".parallel",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .abilities_client import AbilitiesClient
+    from .base_client import BaseDataClient
+    from .battle_mechanics_client import BattleMechanicsClient
+    from .capsules_client import CapsulesClient
+    from .counterdex_client import CounterdexClient
+    from .counterdex_index import CounterdexIndex
+    from .damage_tables import DamageTables
+    from .dataset_registry import DatasetRegistry, shared_registry
+    from .effect_tables import EffectTable
+    from .evolution_client import EvolutionClient
+    from .evolution_chains import EvolutionChains
+    from .evolution_graph import EvolutionGraph
+    from .fruitys_client import FruitysClient
+    from .items_client import ItemsClient
+    from .learnset_index import LearnsetIndex
+    from .locations_client import LocationsClient
+    from .moves_client import MovesClient
+    from .name_resolver import NameResolver
+    from .natures_client import NaturesClient
+    from .parallel import ParallelRunner
+    from .query import Field, Query
+    from .records import FrozenRecord
+    from .revomon_client import RevomonClient
+    from .revomon_columns import RevomonColumns
+    from .revomon_moves_client import RevomonMovesClient
+    from .spawn_index import SpawnIndex
+    from .status_effects_client import StatusEffectsClient
+    from .team_builder import TeamBuilder
+    from .text_index import TextIndex
+    from .type_chart import TypeChart
+    from .type_profiles import TypeProfiles
+    from .types_client import TypesClient
+    from .weather_client import WeatherClient
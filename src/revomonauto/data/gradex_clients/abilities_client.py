@@ -3,12 +3,13 @@ Client for accessing Revomon abilities data
 """
 from typing import Dict, List, Optional, Any
 from .base_client import BaseDataClient
+from .effect_tables import EffectTablesMixin
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 
-class AbilitiesClient(BaseDataClient):
+class AbilitiesClient(EffectTablesMixin, BaseDataClient):
     """
     Client for accessing Revomon abilities data.
 
@@ -17,8 +18,8 @@ class AbilitiesClient(BaseDataClient):
     - description: Detailed description of the ability's effects
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json")
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "name"
@@ -55,10 +56,7 @@ class AbilitiesClient(BaseDataClient):
         Returns:
             List of abilities containing the search term
         """
-        self.load_data()
-        search_term = search_term.lower()
-        return [record.copy() for record in self._data
-                if search_term in record["description"].lower()]
+        return self.find_by_keywords([search_term])
 
     def get_abilities_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
         """
@@ -70,14 +68,7 @@ class AbilitiesClient(BaseDataClient):
         Returns:
             List of matching abilities
         """
-        self.load_data()
-        keyword = keyword.lower()
-        matches = []
-        for record in self._data:
-            if (keyword in record["name"].lower() or
-                keyword in record["description"].lower()):
-                matches.append(record.copy())
-        return matches
+        return self.find_by_keywords([keyword], fields=("name", "description"))
 
     def get_abilities_with_stat_modification(self) -> List[Dict[str, Any]]:
         """
@@ -132,15 +123,4 @@ class AbilitiesClient(BaseDataClient):
         Returns:
             List of matching abilities
         """
-        self.load_data()
-        matches = []
-        keywords = [kw.lower() for kw in keywords]
-
-        for record in self._data:
-            description = record["description"].lower()
-            for keyword in keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break  # Don't add duplicates if multiple keywords match
-
-        return matches
+        return self.find_by_keywords(keywords)
@@ -4,9 +4,14 @@ Base client for Revomon data access
 import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from logging import getLogger
 
+from .dataset_registry import Dataset, shared_registry
+from .query import Query, SortedIndex
+from .streaming import iter_json_array, project
+from .text_index import TextIndex
+
 logger = getLogger(__name__)
 
 
@@ -15,18 +20,38 @@ class BaseDataClient(ABC):
     Abstract base class for Revomon data clients.
 
     Provides common functionality for loading and accessing JSON data files.
+    Parsed data is shared through the process-wide dataset registry, so
+    clients reading the same file reuse one copy of its records and indexes.
+
+    Lookups are served from hash indexes built when the data loads. The
+    primary key is always indexed; subclasses may declare additional fields
+    in ``indexed_fields`` and any other field is indexed on first lookup.
+
+    By default every query returns mutable copies of the matching records. In
+    read-only mode the shared FrozenRecords are returned instead, so lookups
+    allocate nothing per record; callers that need to modify one call
+    ``record.copy()``.
     """
 
-    def __init__(self, data_file: Union[str, Path]):
+    # Fields to index on load in addition to the primary key
+    indexed_fields: Tuple[str, ...] = ()
+    # Fields queries may range-scan through a sorted index, built on first use
+    sorted_index_fields: Tuple[str, ...] = ()
+
+    def __init__(self, data_file: Union[str, Path], read_only: bool = False):
         """
         Initialize the data client.
 
         Args:
             data_file: Path to the JSON data file
+            read_only: If True, return shared read-only records instead of copies
         """
         self.data_file = Path(data_file)
-        self._data: List[Dict[str, Any]] = []
+        self.read_only = read_only
+        self._data: Sequence[Dict[str, Any]] = ()
         self._loaded = False
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._dataset: Optional[Dataset] = None
 
     def load_data(self, force_reload: bool = False) -> bool:
         """
@@ -46,24 +71,31 @@ class BaseDataClient(ABC):
             return False
 
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
-            self._loaded = True
-            logger.info(f"Loaded {len(self._data)} records from {self.data_file}")
-            return True
+            dataset = shared_registry.get(self.data_file, force_reload=force_reload)
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Error loading data from {self.data_file}: {e}")
             return False
 
+        self._dataset = dataset
+        self._data = dataset.records
+        self._indexes = dataset.indexes
+        self._loaded = True
+        self._build_indexes()
+        shared_registry.save_snapshot(dataset)
+        return True
+
     def get_all(self) -> List[Dict[str, Any]]:
         """
         Get all data records.
 
         Returns:
-            List of all data records
+            New list of all data records, holding the shared records in
+            read-only mode and mutable copies otherwise
         """
         self.load_data()
-        return self._data.copy()
+        if self.read_only:
+            return list(self._data)
+        return [record.copy() for record in self._data]
 
     def get_by_index(self, index: int) -> Optional[Dict[str, Any]]:
         """
@@ -77,7 +109,7 @@ class BaseDataClient(ABC):
         """
         self.load_data()
         if 0 <= index < len(self._data):
-            return self._data[index].copy()
+            return self._emit(self._data[index])
         return None
 
     def find_by_field(self, field: str, value: Any) -> List[Dict[str, Any]]:
@@ -92,7 +124,10 @@ class BaseDataClient(ABC):
             List of matching records
         """
         self.load_data()
-        return [record.copy() for record in self._data if record.get(field) == value]
+        positions = self._lookup(field, value)
+        if positions is None:
+            return [self._emit(record) for record in self._data if record.get(field) == value]
+        return [self._emit(self._data[position]) for position in positions]
 
     def find_first_by_field(self, field: str, value: Any) -> Optional[Dict[str, Any]]:
         """
@@ -106,10 +141,267 @@ class BaseDataClient(ABC):
             The first matching record, or None if not found
         """
         self.load_data()
-        for record in self._data:
-            if record.get(field) == value:
-                return record.copy()
-        return None
+        positions = self._lookup(field, value)
+        if positions is None:
+            for record in self._data:
+                if record.get(field) == value:
+                    return self._emit(record)
+            return None
+        return self._emit(self._data[positions[0]]) if positions else None
+
+    def iter_records(
+        self,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        load: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over records, streaming them from the file if it isn't loaded.
+
+        When the data isn't loaded yet, records are parsed incrementally and
+        filtered and projected as they arrive, so the first matches are
+        available before the file is fully parsed. By default the streamed
+        records aren't kept, which bounds memory to the largest record; with
+        ``load=True`` they are kept and indexed as they arrive, and the client
+        is loaded once the stream is consumed to the end.
+
+        Args:
+            where: Predicate records must satisfy, or None for every record
+            fields: Fields to keep in each yielded record, or None for all fields
+            limit: Maximum number of records to yield, or None for no limit
+            load: If True, load the data while streaming it
+
+        Yields:
+            Matching records in file order
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        # Streamed records that aren't kept are fresh dicts and need no copy
+        shared = True
+        if self._loaded:
+            records = self._data
+        elif not self.data_file.exists():
+            logger.error(f"Data file not found: {self.data_file}")
+            return
+        else:
+            dataset = shared_registry.get_current(self.data_file)
+            if dataset is not None:
+                records = dataset.records
+            elif load:
+                fields_to_index = (self.get_primary_key_field(), *self.indexed_fields)
+                records = shared_registry.stream(self.data_file, fields_to_index)
+            else:
+                records = iter_json_array(self.data_file)
+                shared = False
+        count = 0
+        try:
+            for record in records:
+                if where is not None and not where(record):
+                    continue
+                if fields is not None:
+                    yield project(record, fields)
+                else:
+                    yield self._emit(record) if shared else record
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Error streaming data from {self.data_file}: {e}")
+            return
+
+        if load and not self._loaded:
+            self.load_data()
+
+    def _emit(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepare a stored record to be returned to a caller.
+
+        Args:
+            record: A record from the loaded data
+
+        Returns:
+            The shared record in read-only mode, a mutable copy otherwise
+        """
+        return record if self.read_only else record.copy()
+
+    def create_index(self, field: str) -> bool:
+        """
+        Build a hash index on a field so lookups on it become O(1).
+
+        Args:
+            field: The field name to index
+
+        Returns:
+            True if the field is indexed, False if its values are unhashable
+        """
+        self.load_data()
+        if field not in self._indexes:
+            index = self._build_index(field)
+            if index is None:
+                return False
+            self._store_index(field, index)
+        return True
+
+    def create_sorted_index(self, field: str) -> bool:
+        """
+        Build a sorted index on a field so range queries on it use binary search.
+
+        Args:
+            field: The field name to index
+
+        Returns:
+            True if the field is indexed, False if its values can't be ordered
+        """
+        self.load_data()
+        if self._dataset is None:
+            return False
+        name = f"sorted_index:{field}"
+        return self._dataset.derived(name, lambda dataset: SortedIndex.build(dataset.records, field)) is not None
+
+    def get_sorted_index(self, field: str) -> Optional[SortedIndex]:
+        """
+        Get the sorted index on a field, building it if the field is declared.
+
+        Args:
+            field: The field name
+
+        Returns:
+            The sorted index, or None if the field has none
+        """
+        self.load_data()
+        if self._dataset is None:
+            return None
+        if field in self.sorted_index_fields:
+            self.create_sorted_index(field)
+        return self._dataset.derived(f"sorted_index:{field}")
+
+    def get_text_index(self, *fields: str) -> TextIndex:
+        """
+        Get the inverted text index over some fields, building it on first use.
+
+        Indexes are cached per loaded dataset, so every client reading the
+        same file shares them.
+
+        Args:
+            *fields: Text fields to index (defaults to "description")
+
+        Returns:
+            The text index
+        """
+        fields = fields or ("description",)
+        self.load_data()
+        if self._dataset is None:
+            return TextIndex(self._data, fields)
+        return self._dataset.derived(
+            "text_index:" + ",".join(fields), lambda dataset: TextIndex(dataset.records, fields)
+        )
+
+    def find_by_keywords(
+        self, keywords: Sequence[str], fields: Sequence[str] = ("description",)
+    ) -> List[Dict[str, Any]]:
+        """
+        Find records containing any of several keywords in any of some text fields.
+
+        Keywords match case-insensitively anywhere in the text, as with
+        ``keyword.lower() in text.lower()``.
+
+        Args:
+            keywords: Keywords to search for
+            fields: Text fields to search in
+
+        Returns:
+            List of matching records, in dataset order
+        """
+        positions = self.get_text_index(*fields).contains_any(keywords)
+        return [self._emit(self._data[position]) for position in positions]
+
+    def query(self) -> Query:
+        """
+        Start a query over this client's records.
+
+        Returns:
+            An empty query matching every record
+
+        Example:
+            >>> client.query().where(Field("power") >= 90).order_by("power").limit(5).all()
+        """
+        return Query(self)
+
+    def has_index(self, field: str) -> bool:
+        """
+        Check if a hash index exists for a field.
+
+        Args:
+            field: The field name
+
+        Returns:
+            True if the field is indexed, False otherwise
+        """
+        return field in self._indexes
+
+    def _build_indexes(self) -> None:
+        """Build the primary key and declared field indexes missing from the dataset."""
+        for field in (self.get_primary_key_field(), *self.indexed_fields):
+            if field not in self._indexes:
+                index = self._build_index(field)
+                if index is not None:
+                    self._store_index(field, index)
+
+    def _store_index(self, field: str, index: Dict[Any, List[int]]) -> None:
+        """
+        Store a field index on the shared dataset.
+
+        Args:
+            field: The indexed field
+            index: The index
+        """
+        if self._dataset is None:
+            self._indexes[field] = index
+        else:
+            shared_registry.add_index(self._dataset, field, index)
+
+    def _build_index(self, field: str) -> Optional[Dict[Any, List[int]]]:
+        """
+        Map each value of a field to the positions of the records holding it.
+
+        Args:
+            field: The field name to index
+
+        Returns:
+            The index, or None if the field holds unhashable values
+        """
+        index: Dict[Any, List[int]] = {}
+        try:
+            for position, record in enumerate(self._data):
+                value = record.get(field)
+                if value in index:
+                    index[value].append(position)
+                else:
+                    index[value] = [position]
+        except TypeError:
+            logger.debug(f"Field '{field}' in {self.data_file} holds unhashable values, not indexing")
+            return None
+        return index
+
+    def _lookup(self, field: str, value: Any) -> Optional[List[int]]:
+        """
+        Get the record positions matching a field value from its index.
+
+        Args:
+            field: The field name to search in
+            value: The value to match
+
+        Returns:
+            Matching positions in load order, or None if an index can't be used
+        """
+        if field not in self._indexes and not self.create_index(field):
+            return None
+        try:
+            return self._indexes[field].get(value, [])
+        except TypeError:
+            return None
 
     def count(self) -> int:
         """
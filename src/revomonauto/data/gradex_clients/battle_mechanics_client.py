@@ -9,16 +9,59 @@ This client provides comprehensive battle mechanics including:
 - Priority system resolution
 - Battle simulation and optimization
 """
-from typing import Dict, List, Any
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+from .battle_simulation import (
+    DuelSide,
+    RandomSource,
+    critical_hit_rate,
+    hit_chance,
+    probability,
+    sample_damage,
+    sample_duels,
+)
+from .damage_batch import (
+    Combatants,
+    MoveArrays,
+    damage_tensor,
+    expected_damage,
+    pre_roll_damage,
+    weather_multiplier,
+)
+from .damage_distribution import hit_distribution, hits_to_ko, ko_chances, roll_damage
+from .damage_tables import (
+    LEVEL_BUCKETS,
+    DamageTables,
+    compute_damage_rows,
+    compute_damage_tables,
+    default_tables_dir,
+    learnable_mask,
+    open_damage_tables,
+    tables_key,
+    write_damage_tables,
+)
+from .parallel import ParallelRunner, process_instance
+from .revomon_columns import STAT_FIELDS
+from .type_profiles import team_codes
 from .types_client import TypesClient
 from .moves_client import MovesClient
 from .revomon_client import RevomonClient
 from .abilities_client import AbilitiesClient
 from logging import getLogger
+import heapq
 import math
 
+import numpy as np
+
 logger = getLogger(__name__)
 
+# Attackers per task when damage tables are computed in parallel
+DAMAGE_ROWS_PER_TASK = 8
+
+# Scored learnsets find_optimal_moves keeps, oldest dropped first
+OPTIMAL_MOVES_CACHE_SIZE = 4096
+
 
 class BattleMechanicsClient:
     """
@@ -33,10 +76,10 @@ class BattleMechanicsClient:
 
     def __init__(self):
         """Initialize the battle mechanics client with all required data clients."""
-        self.types_client = TypesClient()
-        self.moves_client = MovesClient()
-        self.revomon_client = RevomonClient()
-        self.abilities_client = AbilitiesClient()
+        self.types_client = TypesClient(read_only=True)
+        self.moves_client = MovesClient(read_only=True)
+        self.revomon_client = RevomonClient(read_only=True)
+        self.abilities_client = AbilitiesClient(read_only=True)
 
         # Load all data
         self.types_client.load_data()
@@ -44,6 +87,15 @@ class BattleMechanicsClient:
         self.revomon_client.load_data()
         self.abilities_client.load_data()
 
+        # (level buckets, source file states) -> damage table directory
+        self._damage_table_dirs: Dict[Tuple, Path] = {}
+        # (attacker, defender, levels) -> scored learnset, see find_optimal_moves
+        self._optimal_moves: Dict[Tuple, Tuple] = {}
+        # Inputs of the damage tables, see _damage_table_inputs
+        self._damage_inputs: Optional[Tuple] = None
+        # Datasets the two caches above were computed from, see _refresh_caches
+        self._sources: Optional[Tuple] = None
+
         logger.info("BattleMechanicsClient initialized with all data clients")
 
     def calculate_damage(
@@ -137,22 +189,20 @@ class BattleMechanicsClient:
         # Critical hit
         critical_multiplier = 2.0 if critical_hit else 1.0
 
-        # Weather effects (TODO: implement specific weather effects)
+        # Weather effects
         weather_multiplier = self._calculate_weather_multiplier(move, weather)
 
         # Random factor (typically 0.85-1.0)
         random_multiplier = random_factor
 
         # Calculate final damage
-        final_damage = (base_damage * type_effectiveness * stab_multiplier *
-                       critical_multiplier * weather_multiplier * random_multiplier * other_modifiers)
+        pre_roll = base_damage * type_effectiveness * stab_multiplier * critical_multiplier * weather_multiplier
+        final_damage = math.floor(pre_roll * random_multiplier * other_modifiers)
 
-        # Apply damage variance (85%-100% typically)
-        final_damage = math.floor(final_damage)
-
-        # Calculate min/max possible damage for this calculation
-        min_damage = math.floor(final_damage * 0.85)
-        max_damage = math.floor(final_damage * 1.0)
+        # Min/max possible damage over the 16 damage rolls
+        rolls = roll_damage(pre_roll, other_modifiers)
+        min_damage = int(rolls[0])
+        max_damage = int(rolls[-1])
 
         return {
             "damage": final_damage,
@@ -172,6 +222,260 @@ class BattleMechanicsClient:
             }
         }
 
+    def calculate_damage_distribution(
+        self,
+        attacker: Dict[str, Any],
+        defender: Dict[str, Any],
+        move: Dict[str, Any],
+        attacker_level: int = 100,
+        defender_level: int = 100,
+        weather: str = None,
+        burn: bool = False,
+        stab: Optional[bool] = None,
+        other_modifiers: float = 1.0,
+        defender_hp: Optional[int] = None,
+        max_hits: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Calculate the exact distribution of a move's damage and its knockout chances.
+
+        Enumerates the 16 damage rolls with and without a critical hit,
+        weighted by the move's accuracy and critical hit rate, and convolves
+        that distribution with itself for repeated hits. No sampling is
+        involved, so the chances are exact.
+
+        Args:
+            attacker: Attacking Revomon data
+            defender: Defending Revomon data
+            move: Move data
+            attacker_level: Attacker's level
+            defender_level: Defender's level
+            weather: Current weather condition
+            burn: Whether attacker is burned
+            stab: Whether STAB applies, or None to check the attacker's types
+            other_modifiers: Additional modifiers
+            defender_hp: Defender's current HP (defaults to full HP)
+            max_hits: Largest number of hits to compute knockout chances for
+
+        Returns:
+            Dict with the damage distribution (damage -> probability), its
+            expected value, the chance of knocking out within 1..max_hits
+            hits and the number of hits that guarantees a knockout (0 if
+            none of them does)
+        """
+        if defender_hp is None:
+            defender_hp = self._get_effective_stats(defender, defender_level)["hp"]
+        accuracy = hit_chance(move)
+        crit_rate = critical_hit_rate(move)
+        pmf = hit_distribution(
+            self._pre_roll(attacker, defender, move, attacker_level, defender_level, weather, burn, stab),
+            accuracy,
+            crit_rate,
+            other_modifiers,
+        )
+        chances = ko_chances(pmf, defender_hp, max_hits)
+        damage = np.flatnonzero(pmf)
+
+        return {
+            "distribution": dict(zip(damage.tolist(), pmf[damage].tolist())),
+            "expected_damage": float(np.arange(len(pmf)) @ pmf),
+            "hit_chance": accuracy,
+            "critical_hit_chance": crit_rate,
+            "defender_hp": defender_hp,
+            "ko_chances": {hits: float(chance) for hits, chance in enumerate(chances, start=1)},
+            "hits_to_ko": hits_to_ko(chances)
+        }
+
+    def calculate_damage_batch(
+        self,
+        attackers: Sequence[Dict[str, Any]],
+        defenders: Sequence[Dict[str, Any]],
+        moves: Sequence[Dict[str, Any]],
+        attacker_levels: Union[int, Sequence[int]] = 100,
+        defender_levels: Union[int, Sequence[int]] = 100,
+        weather: str = None,
+        critical_hit: bool = False,
+        burn: Union[bool, Sequence[bool]] = False,
+        stab: Optional[bool] = None,
+        other_modifiers: float = 1.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate damage for every attacker, defender and move combination at once.
+
+        Uses the same formula as ``calculate_damage``, evaluated element-wise
+        over NumPy arrays: ``max_damage[i, j, k]`` equals
+        ``calculate_damage(attackers[i], defenders[j], moves[k], ...)["damage"]``
+        with ``random_factor=1.0``, and ``min_damage`` the same with 0.85.
+
+        Args:
+            attackers: N attacking Revomon
+            defenders: M defending Revomon
+            moves: K moves
+            attacker_levels: Level of every attacker, or one per attacker
+            defender_levels: Level of every defender, or one per defender
+            weather: Current weather condition
+            critical_hit: Whether every hit is critical
+            burn: Whether the attackers are burned, for all or per attacker
+            stab: Same-type attack bonus for every combination, or None
+                (default) to apply it where the move's type matches the attacker
+            other_modifiers: Additional modifiers
+
+        Returns:
+            Dict with "min_damage", "max_damage" and "expected_damage" arrays
+            of shape (N, M, K); expected damage averages the 16 damage rolls
+        """
+        chart = self.types_client.get_type_chart()
+        return damage_tensor(
+            Combatants(attackers, chart, attacker_levels),
+            Combatants(defenders, chart, defender_levels),
+            MoveArrays(moves, chart),
+            chart,
+            weather=weather,
+            critical_hit=critical_hit,
+            burn=np.asarray(burn, dtype=bool),
+            stab=stab,
+            other_modifiers=other_modifiers,
+        )
+
+    def precompute_damage_tables(
+        self,
+        level_buckets: Sequence[int] = LEVEL_BUCKETS,
+        tables_dir: Union[str, Path, None] = None,
+        force: bool = False,
+        runner: Optional[ParallelRunner] = None
+    ) -> Path:
+        """
+        Compute best-move and expected-damage tables for every species matchup and write them to disk.
+
+        Tables cover every (attacker, defender, level bucket) with both sides
+        at the bucket's level and the attacker using its learnable moves.
+        They are stored under a directory named after a hash of the data
+        files, so edited data gets new tables and unchanged data is never
+        recomputed.
+
+        Args:
+            level_buckets: Levels to compute the tables at
+            tables_dir: Parent directory (defaults to ``default_tables_dir()``)
+            force: Recompute even if the tables already exist
+            runner: Runner to compute attacker rows on in parallel, or None
+                to compute them in this process
+
+        Returns:
+            Directory holding the tables
+        """
+        directory = self._damage_tables_dir(level_buckets, tables_dir)
+        if (directory / "meta.json").exists() and not force:
+            return directory
+
+        species, moves, learnable, chart = self._damage_table_inputs()
+        if runner is None or not len(species):
+            best, damage = compute_damage_tables(species, moves, learnable, chart, level_buckets)
+        else:
+            # Attacker rows are independent; workers compute ranges of them
+            bounds = [
+                (start, min(start + DAMAGE_ROWS_PER_TASK, len(species)))
+                for start in range(0, len(species), DAMAGE_ROWS_PER_TASK)
+            ]
+            rows = runner.map(partial(_damage_table_rows, tuple(level_buckets)), bounds)
+            best = np.concatenate([row_best for row_best, _ in rows])
+            damage = np.concatenate([row_damage for _, row_damage in rows])
+        write_damage_tables(directory, best, damage, {
+            "species": [record.get("name") for record in species],
+            "moves": [move.get("name") for move in moves],
+            "level_buckets": list(level_buckets),
+        }, replace=force)
+        logger.info(f"Wrote damage tables to {directory}")
+        return directory
+
+    def _damage_table_inputs(self) -> Tuple[Sequence[Dict[str, Any]], Sequence[Dict[str, Any]], np.ndarray, Any]:
+        """
+        Get what the damage tables are computed from.
+
+        The inputs are kept until one of the source datasets is reloaded, so
+        workers computing many row ranges build the learnable mask once.
+
+        Returns:
+            Tuple of (species, moves, learnable mask, type chart)
+        """
+        from .revomon_moves_client import RevomonMovesClient
+
+        self._refresh_caches()
+        if self._damage_inputs is None:
+            species = self.revomon_client.get_all()
+            moves = self.moves_client.get_all()
+            learnable = learnable_mask(species, moves, RevomonMovesClient(read_only=True).get_all())
+            self._damage_inputs = (species, moves, learnable, self.types_client.get_type_chart())
+        return self._damage_inputs
+
+    def _refresh_caches(self) -> None:
+        """Drop the cached damage table inputs and move scores if a source dataset was reloaded."""
+        from .revomon_moves_client import RevomonMovesClient
+
+        clients = (self.revomon_client, self.moves_client, RevomonMovesClient(read_only=True), self.types_client)
+        for client in clients:
+            client.load_data()
+        sources = tuple(client._dataset for client in clients)
+        if self._sources is None or any(cached is not source for cached, source in zip(self._sources, sources)):
+            self._sources = sources
+            self._damage_inputs = None
+            self._optimal_moves.clear()
+
+    def get_damage_tables(
+        self,
+        level_buckets: Sequence[int] = LEVEL_BUCKETS,
+        tables_dir: Union[str, Path, None] = None,
+        build: bool = True
+    ) -> Optional[DamageTables]:
+        """
+        Get the memory-mapped damage tables for the current data.
+
+        The arrays are mapped read-only and shared by every client in the
+        process; other processes mapping the same files share the pages
+        through the OS page cache.
+
+        Args:
+            level_buckets: Levels the tables were computed at
+            tables_dir: Parent directory (defaults to ``default_tables_dir()``)
+            build: Compute the tables if they don't exist yet
+
+        Returns:
+            The tables, or None if they don't exist and ``build`` is False
+        """
+        directory = self._damage_tables_dir(level_buckets, tables_dir)
+        tables = open_damage_tables(directory)
+        if tables is None and build:
+            tables = open_damage_tables(self.precompute_damage_tables(level_buckets, tables_dir))
+        return tables
+
+    def _damage_tables_dir(self, level_buckets: Sequence[int], tables_dir: Union[str, Path, None]) -> Path:
+        """
+        Get the directory of the damage tables for the current data files.
+
+        Sources are only re-hashed when one of their sizes or mtimes changes.
+
+        Args:
+            level_buckets: Levels the tables are computed at
+            tables_dir: Parent directory, or None for the default
+
+        Returns:
+            Directory path
+        """
+        from .revomon_moves_client import RevomonMovesClient
+
+        sources = [
+            client.data_file.resolve()
+            for client in (self.revomon_client, self.moves_client, self.types_client)
+        ]
+        sources.append(RevomonMovesClient(read_only=True).data_file.resolve())
+        parent = Path(tables_dir) if tables_dir is not None else default_tables_dir()
+        states = tuple((str(source), source.stat().st_size, source.stat().st_mtime_ns) for source in sources)
+        memo_key = (tuple(level_buckets), str(parent), states)
+        directory = self._damage_table_dirs.get(memo_key)
+        if directory is None:
+            directory = parent / tables_key(sources, level_buckets)
+            self._damage_table_dirs[memo_key] = directory
+        return directory
+
     def _get_effective_stats(self, revomon: Dict[str, Any], level: int) -> Dict[str, int]:
         """
         Calculate effective stats for a Revomon at a given level.
@@ -210,6 +514,25 @@ class BattleMechanicsClient:
 
         return effective_stats
 
+    def get_all_effective_stats(self, level: int = 100) -> Dict[str, Dict[str, int]]:
+        """
+        Calculate effective stats for every Revomon at a given level.
+
+        Computed in one vectorized pass with the same formula as
+        ``_get_effective_stats``.
+
+        Args:
+            level: Level to scale every Revomon to
+
+        Returns:
+            Dict mapping Revomon names to their effective stats
+        """
+        stats = self.revomon_client.get_columns().effective_stats(level).tolist()
+        return {
+            record["name"]: dict(zip(STAT_FIELDS, row))
+            for record, row in zip(self.revomon_client.get_all(), stats)
+        }
+
     def _calculate_type_effectiveness(self, move: Dict[str, Any], defender: Dict[str, Any]) -> float:
         """
         Calculate type effectiveness multiplier.
@@ -221,19 +544,10 @@ class BattleMechanicsClient:
         Returns:
             Type effectiveness multiplier
         """
-        move_type = move.get("type")
-        defender_type1 = defender.get("type1")
-        defender_type2 = defender.get("type2")
-
-        # Get effectiveness against primary type
-        effectiveness = self.types_client.get_effectiveness_against(move_type, defender_type1) or 1.0
-
-        # If dual type, multiply by secondary type effectiveness
-        if defender_type2 and defender_type2 != defender_type1:
-            secondary_effectiveness = self.types_client.get_effectiveness_against(move_type, defender_type2) or 1.0
-            effectiveness *= secondary_effectiveness
-
-        return effectiveness
+        # Product of the move type's multipliers against each defending type
+        return self.types_client.get_type_chart().multiplier(
+            move.get("type"), defender.get("type1"), defender.get("type2")
+        )
 
     def _calculate_weather_multiplier(self, move: Dict[str, Any], weather: str) -> float:
         """
@@ -246,9 +560,8 @@ class BattleMechanicsClient:
         Returns:
             Weather multiplier
         """
-        # TODO: Implement weather effects based on abilities and moves
-        # For now, return 1.0 (no effect)
-        return 1.0
+        # Shared with the batch calculator so both agree
+        return weather_multiplier(move.get("type"), weather)
 
     def _calculate_stab(self, move: Dict[str, Any], attacker: Dict[str, Any]) -> bool:
         """
@@ -273,7 +586,8 @@ class BattleMechanicsClient:
         defender: Dict[str, Any],
         move_name: str,
         attacker_level: int = 100,
-        defender_level: int = 100
+        defender_level: int = 100,
+        rng: RandomSource = None
     ) -> Dict[str, Any]:
         """
         Simulate a complete battle turn.
@@ -284,6 +598,8 @@ class BattleMechanicsClient:
             move_name: Name of move to use
             attacker_level: Attacker level
             defender_level: Defender level
+            rng: Seed or ``numpy.random.Generator`` to draw from; the same
+                seed always gives the same turn
 
         Returns:
             Complete turn simulation results
@@ -293,8 +609,10 @@ class BattleMechanicsClient:
         if not move:
             return {"error": f"Move '{move_name}' not found"}
 
+        rng = np.random.default_rng(rng)
+
         # Check accuracy
-        accuracy_check = self._check_accuracy(move)
+        accuracy_check = self._check_accuracy(move, rng)
         if not accuracy_check["hit"]:
             return {
                 "hit": False,
@@ -303,7 +621,7 @@ class BattleMechanicsClient:
             }
 
         # Calculate if critical hit
-        critical_hit = self._calculate_critical_hit(move, attacker)
+        critical_hit = self._calculate_critical_hit(move, attacker, rng)
 
         # Check STAB
         stab = self._calculate_stab(move, attacker)
@@ -325,15 +643,16 @@ class BattleMechanicsClient:
             "stab": stab,
             "damage": damage_result["damage"],
             "damage_breakdown": damage_result["breakdown"],
-            "move_info": move
+            "move_info": move.copy()
         }
 
-    def _check_accuracy(self, move: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_accuracy(self, move: Dict[str, Any], rng: RandomSource = None) -> Dict[str, Any]:
         """
         Check if a move hits based on accuracy.
 
         Args:
             move: Move data
+            rng: Seed or ``numpy.random.Generator`` to draw from
 
         Returns:
             Dict with hit result and reason
@@ -344,94 +663,349 @@ class BattleMechanicsClient:
         if accuracy == 0.0:
             return {"hit": True, "reason": "Status move"}
 
-        # Simulate accuracy check (would be random in actual game)
-        # For now, assume it hits if accuracy > 0.5
-        import random
-        hit_chance = random.random()
-        hits = hit_chance <= accuracy
+        hit_roll = np.random.default_rng(rng).random()
+        hits = hit_roll < hit_chance(move)
 
         return {
             "hit": hits,
-            "reason": "Accuracy check" if hits else f"Missed (needed {accuracy:.2f}, got {hit_chance:.2f})"
+            "reason": "Accuracy check" if hits else f"Missed (needed {accuracy:.2f}, got {hit_roll:.2f})"
         }
 
-    def _calculate_critical_hit(self, move: Dict[str, Any], attacker: Dict[str, Any]) -> bool:
+    def _calculate_critical_hit(
+        self,
+        move: Dict[str, Any],
+        attacker: Dict[str, Any],
+        rng: RandomSource = None
+    ) -> bool:
         """
         Calculate if move is a critical hit.
 
         Args:
             move: Move data
             attacker: Attacker Revomon
+            rng: Seed or ``numpy.random.Generator`` to draw from
 
         Returns:
             True if critical hit
         """
-        # Base critical hit rate is typically 1/16 (6.25%)
-        # Some moves have higher rates (e.g., karate chop, razor leaf)
-        base_crit_rate = 0.0625
+        # 1/16 base rate, doubled for high-crit moves (e.g., karate chop, razor leaf)
+        return bool(np.random.default_rng(rng).random() < critical_hit_rate(move))
+
+    def simulate_turns(
+        self,
+        attacker: Dict[str, Any],
+        defender: Dict[str, Any],
+        move_name: str,
+        attacker_level: int = 100,
+        defender_level: int = 100,
+        samples: int = 10000,
+        rng: RandomSource = None,
+        defender_hp: Optional[int] = None,
+        confidence: float = 0.95
+    ) -> Dict[str, Any]:
+        """
+        Simulate many uses of a move at once.
+
+        Every sample draws an accuracy check, a critical hit check and one of
+        the 16 damage rolls from ``rng``, so the same seed always gives the
+        same result.
+
+        Args:
+            attacker: Attacking Revomon
+            defender: Defending Revomon
+            move_name: Name of move to use
+            attacker_level: Attacker level
+            defender_level: Defender level
+            samples: Number of turns to simulate
+            rng: Seed or ``numpy.random.Generator`` to draw from
+            defender_hp: Defender's current HP (defaults to full HP)
+            confidence: Confidence level of the intervals
+
+        Returns:
+            Dict with hit, critical hit and KO probabilities (each an estimate
+            with its confidence interval) and the damage's mean and standard
+            deviation
+        """
+        move = self.moves_client.get_move_by_name(move_name)
+        if not move:
+            return {"error": f"Move '{move_name}' not found"}
+
+        rng = np.random.default_rng(rng)
+        if defender_hp is None:
+            defender_hp = self._get_effective_stats(defender, defender_level)["hp"]
+        damage, hit, critical = sample_damage(
+            self._pre_roll(attacker, defender, move, attacker_level, defender_level),
+            hit_chance(move),
+            critical_hit_rate(move),
+            samples,
+            rng,
+        )
+
+        return {
+            "move": move_name,
+            "samples": samples,
+            "hit": probability(int(hit.sum()), samples, confidence),
+            "critical_hit": probability(int(critical.sum()), samples, confidence),
+            "ko": probability(int((damage >= defender_hp).sum()), samples, confidence),
+            "mean_damage": float(damage.mean()) if samples else 0.0,
+            "damage_std": float(damage.std()) if samples else 0.0,
+            "defender_hp": defender_hp
+        }
+
+    def simulate_duel(
+        self,
+        attacker: Dict[str, Any],
+        defender: Dict[str, Any],
+        attacker_move: str,
+        defender_move: str,
+        attacker_level: int = 100,
+        defender_level: int = 100,
+        samples: int = 10000,
+        rng: RandomSource = None,
+        max_turns: int = 50,
+        confidence: float = 0.95
+    ) -> Dict[str, Any]:
+        """
+        Simulate many one-on-one battles where each side repeats one move.
+
+        The faster Revomon attacks first each turn (speed ties are decided
+        at random) and the battle ends when one side faints.
+
+        Args:
+            attacker: First Revomon
+            defender: Second Revomon
+            attacker_move: Move the first Revomon uses
+            defender_move: Move the second Revomon uses
+            attacker_level: First Revomon's level
+            defender_level: Second Revomon's level
+            samples: Number of battles to simulate
+            rng: Seed or ``numpy.random.Generator`` to draw from
+            max_turns: Turns after which a battle counts as unfinished
+            confidence: Confidence level of the intervals
+
+        Returns:
+            Dict with the probabilities of the first Revomon winning, losing
+            and the battle not finishing (each an estimate with its
+            confidence interval) and the mean length of finished battles
+        """
+        moves = {}
+        for move_name in (attacker_move, defender_move):
+            moves[move_name] = self.moves_client.get_move_by_name(move_name)
+            if not moves[move_name]:
+                return {"error": f"Move '{move_name}' not found"}
+
+        sides = []
+        for own, other, move_name, level, other_level in (
+            (attacker, defender, attacker_move, attacker_level, defender_level),
+            (defender, attacker, defender_move, defender_level, attacker_level),
+        ):
+            move = moves[move_name]
+            stats = self._get_effective_stats(own, level)
+            sides.append(DuelSide(
+                self._pre_roll(own, other, move, level, other_level),
+                hit_chance(move),
+                critical_hit_rate(move),
+                stats["hp"],
+                stats["spe"],
+            ))
+
+        winner, turns = sample_duels(sides[0], sides[1], samples, np.random.default_rng(rng), max_turns)
+        finished = winner != 0
+        return {
+            "samples": samples,
+            "win": probability(int((winner == 1).sum()), samples, confidence),
+            "loss": probability(int((winner == 2).sum()), samples, confidence),
+            "unfinished": probability(int((~finished).sum()), samples, confidence),
+            "mean_turns": float(turns[finished].mean()) if finished.any() else None
+        }
+
+    def simulate_matchups(
+        self,
+        matchups: Sequence[Tuple[str, str, str]],
+        attacker_level: int = 100,
+        defender_level: int = 100,
+        samples: int = 10000,
+        seed: Union[int, np.random.SeedSequence, None] = None,
+        runner: Optional[ParallelRunner] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run ``simulate_turns`` for many matchups, optionally across processes.
+
+        Every matchup draws from its own stream spawned from ``seed``, so a
+        seed reproduces the results exactly with or without a runner and
+        for any number of workers.
+
+        Args:
+            matchups: (attacker name, defender name, move name) triples
+            attacker_level: Attackers' level
+            defender_level: Defenders' level
+            samples: Turns to simulate per matchup
+            seed: Root seed (fresh entropy if None)
+            runner: Runner to shard the matchups across, or None to run them
+                in this process
 
-        move_name = move.get("name", "").lower()
-        if "karate chop" in move_name or "razor" in move_name or "slash" in move_name:
-            base_crit_rate *= 2  # High crit moves
+        Returns:
+            One ``simulate_turns`` result per matchup, in order
+        """
+        items = [
+            (attacker, defender, move_name, attacker_level, defender_level, samples)
+            for attacker, defender, move_name in matchups
+        ]
+        return (runner or ParallelRunner(max_workers=1)).map(_simulate_matchup, items, seed=seed, seeded=True)
 
-        # Simulate critical hit (would be random in actual game)
-        import random
-        return random.random() < base_crit_rate
+    def _pre_roll(
+        self,
+        attacker: Dict[str, Any],
+        defender: Dict[str, Any],
+        move: Dict[str, Any],
+        attacker_level: int,
+        defender_level: int,
+        weather: str = None,
+        burn: bool = False,
+        stab: Optional[bool] = None
+    ) -> Tuple[float, float]:
+        """
+        Get a move's damage before the random factor.
+
+        Args:
+            attacker: Attacking Revomon
+            defender: Defending Revomon
+            move: Move data
+            attacker_level: Attacker level
+            defender_level: Defender level
+            weather: Current weather condition
+            burn: Whether attacker is burned
+            stab: Whether STAB applies, or None to check the attacker's types
+
+        Returns:
+            Tuple of pre-roll damage without and with a critical hit
+        """
+        chart = self.types_client.get_type_chart()
+        attackers = Combatants([attacker], chart, attacker_level)
+        defenders = Combatants([defender], chart, defender_level)
+        moves = MoveArrays([move], chart)
+        if stab is None:
+            stab = self._calculate_stab(move, attacker)
+        return tuple(
+            float(pre_roll_damage(
+                attackers, defenders, moves, chart,
+                weather=weather, critical_hit=critical_hit, burn=burn, stab=stab
+            )[0, 0, 0])
+            for critical_hit in (False, True)
+        )
 
     def find_optimal_moves(
         self,
         attacker: Dict[str, Any],
         defender: Dict[str, Any],
         attacker_level: int = 100,
-        defender_level: int = 100
+        defender_level: int = 100,
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Find optimal moves against a specific defender.
 
+        Every damaging move in the attacker's learnset is scored in one
+        vectorized pass by its expected damage: the mean over the 16 damage
+        rolls, weighted by the move's accuracy and critical hit rate. Scores
+        are cached per (attacker, defender, levels), keyed on the types and
+        stats the calculation reads, so repeated calls only pick the top
+        moves. The cache holds ``OPTIMAL_MOVES_CACHE_SIZE`` entries and is
+        dropped when a source dataset is reloaded.
+
         Args:
             attacker: Attacking Revomon
             defender: Defending Revomon
             attacker_level: Attacker level
             defender_level: Defender level
+            top_k: Number of moves to return, or None for all
 
         Returns:
-            List of moves sorted by effectiveness
+            List of moves sorted by expected damage; ties keep learnset order
         """
-        # Get attacker's available moves (this would need RevomonMovesClient integration)
-        # For now, use a sample of common moves
-        sample_moves = [
-            "pound", "tackle", "scratch", "ember", "water gun", "thunder shock",
-            "razor leaf", "gust", "earthquake", "psychic", "shadow ball"
+        self._refresh_caches()
+        key = (_combatant_key(attacker), _combatant_key(defender), attacker_level, defender_level)
+        scored = self._optimal_moves.get(key)
+        if scored is None:
+            scored = self._score_learnset(attacker, defender, attacker_level, defender_level)
+            if len(self._optimal_moves) >= OPTIMAL_MOVES_CACHE_SIZE:
+                del self._optimal_moves[next(iter(self._optimal_moves))]
+            self._optimal_moves[key] = scored
+
+        moves, expected, damage, stab, effectiveness = scored
+        count = len(moves) if top_k is None else max(top_k, 0)
+        best = heapq.nlargest(count, range(len(moves)), key=expected.__getitem__)
+        return [
+            {
+                "move": moves[k].copy(),
+                "damage": damage[k],
+                "expected_damage": expected[k],
+                "stab": stab[k],
+                "type_effectiveness": effectiveness[k]
+            }
+            for k in best
         ]
 
-        move_effectiveness = []
+    def _score_learnset(
+        self,
+        attacker: Dict[str, Any],
+        defender: Dict[str, Any],
+        attacker_level: int,
+        defender_level: int
+    ) -> Tuple[List[Dict[str, Any]], List[float], List[int], List[bool], List[float]]:
+        """
+        Score every damaging move an attacker can learn against a defender.
 
-        for move_name in sample_moves:
-            move = self.moves_client.get_move_by_name(move_name)
-            if not move:
-                continue
+        Args:
+            attacker: Attacking Revomon
+            defender: Defending Revomon
+            attacker_level: Attacker level
+            defender_level: Defender level
 
-            # Skip status moves for damage comparison
-            if move.get("category") == "status":
+        Returns:
+            Tuple of aligned lists: the moves, their expected damage, their
+            damage on a full-strength non-critical hit, whether STAB applies
+            and their type effectiveness
+        """
+        from .revomon_moves_client import RevomonMovesClient
+
+        learnset = RevomonMovesClient(read_only=True).get_moves_by_revomon_id(attacker.get("dex_id"))
+        moves = []
+        seen = set()
+        for row in learnset:
+            move_name = row.get("move_name")
+            if move_name in seen:
                 continue
+            seen.add(move_name)
+            move = self.moves_client.get_move_by_name(move_name)
+            if move:
+                moves.append(move)
+
+        chart = self.types_client.get_type_chart()
+        candidates = MoveArrays(moves, chart)
+        moves = [move for move, damaging in zip(moves, candidates.damaging.tolist()) if damaging]
+        if not moves:
+            return [], [], [], [], []
+        candidates = MoveArrays(moves, chart)
+
+        attackers = Combatants([attacker], chart, attacker_level)
+        defenders = Combatants([defender], chart, defender_level)
+        normal = pre_roll_damage(attackers, defenders, candidates, chart)
+        critical = pre_roll_damage(attackers, defenders, candidates, chart, critical_hit=True)
+        crit_rates = np.array([critical_hit_rate(move) for move in moves])
+        accuracies = np.array([hit_chance(move) for move in moves])
+        expected = accuracies * (
+            (1 - crit_rates) * expected_damage(normal, candidates.damaging, 1.0)[0, 0]
+            + crit_rates * expected_damage(critical, candidates.damaging, 1.0)[0, 0]
+        )
 
-            result = self.simulate_battle_turn(
-                attacker, defender, move_name, attacker_level, defender_level
-            )
-
-            if result.get("hit", False):
-                move_effectiveness.append({
-                    "move": move,
-                    "damage": result["damage"],
-                    "critical_hit": result.get("critical_hit", False),
-                    "stab": result.get("stab", False),
-                    "type_effectiveness": self._calculate_type_effectiveness(move, defender)
-                })
-
-        # Sort by damage (descending)
-        move_effectiveness.sort(key=lambda x: x["damage"], reverse=True)
-
-        return move_effectiveness
+        return (
+            moves,
+            expected.tolist(),
+            np.floor(normal[0, 0]).astype(np.int64).tolist(),
+            [self._calculate_stab(move, attacker) for move in moves],
+            [self._calculate_type_effectiveness(move, defender) for move in moves],
+        )
 
     def analyze_type_coverage(self, team: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -443,33 +1017,16 @@ class BattleMechanicsClient:
         Returns:
             Type coverage analysis
         """
-        # Get all types in the game
-        all_types = set()
-        for record in self.types_client.get_all():
-            type_data = self.types_client.get_type_effectiveness(record["types_str"])
-            if type_data:
-                for key in type_data.keys():
-                    if key not in ["types_str", "img_url", "type1", "type2"]:
-                        all_types.add(key)
+        profiles = self.types_client.get_type_profiles()
+        all_types = profiles.chart.attacking_types
 
-        all_types = list(all_types)
+        # OR of every member's super-effective targets
+        covered = int(profiles.coverage(*profiles.encode(team)))
 
         # Calculate coverage for each type
         coverage = {}
-        for target_type in all_types:
-            # Find a team member that can hit this type super effectively
-            super_effective_found = False
-            for revomon in team:
-                # Check each of revomon's types
-                for revomon_type in [revomon.get("type1"), revomon.get("type2")]:
-                    if revomon_type:
-                        effectiveness = self.types_client.get_effectiveness_against(revomon_type, target_type)
-                        if effectiveness and effectiveness >= 2.0:
-                            super_effective_found = True
-                            break
-                if super_effective_found:
-                    break
-
+        for code, target_type in enumerate(all_types):
+            super_effective_found = bool(covered >> code & 1)
             coverage[target_type] = {
                 "covered": super_effective_found,
                 "super_effective": super_effective_found
@@ -487,6 +1044,27 @@ class BattleMechanicsClient:
             "weaknesses": self._find_team_weaknesses(team)
         }
 
+    def score_team_types(
+        self,
+        teams: Sequence[Sequence[Dict[str, Any]]],
+        min_members: int = 2
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score the type matchups of many candidate teams at once.
+
+        Args:
+            teams: Teams of Revomon
+            min_members: Weak members for a weakness to count as shared
+
+        Returns:
+            Dict of arrays with one entry per team: "coverage" (types hit
+            super effectively by a STAB move), "shared_weaknesses" (types at
+            least ``min_members`` members are weak to) and "unresisted"
+            (types no member resists)
+        """
+        profiles = self.types_client.get_type_profiles()
+        return profiles.score_teams(*team_codes(profiles, teams), min_members=min_members)
+
     def _find_team_weaknesses(self, team: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """
         Find common weaknesses in a team.
@@ -499,38 +1077,18 @@ class BattleMechanicsClient:
         """
         weaknesses = {}
 
-        # Get all types in the game
-        all_types = set()
-        for record in self.types_client.get_all():
-            type_data = self.types_client.get_type_effectiveness(record["types_str"])
-            if type_data:
-                for key in type_data.keys():
-                    if key not in ["types_str", "img_url", "type1", "type2"]:
-                        all_types.add(key)
-
-        all_types = list(all_types)
-
-        for type_name in all_types:
-            weak_revomon = []
-            for revomon in team:
-                # Check if this type is super effective against the revomon
-                revomon_type1 = revomon.get("type1")
-                revomon_type2 = revomon.get("type2")
-
-                # Check effectiveness against type1
-                if revomon_type1:
-                    effectiveness1 = self.types_client.get_effectiveness_against(type_name, revomon_type1)
-                    if effectiveness1 and effectiveness1 >= 2.0:
-                        weak_revomon.append(revomon["name"])
-
-                # Check effectiveness against type2
-                if revomon_type2 and revomon_type2 != revomon_type1:
-                    effectiveness2 = self.types_client.get_effectiveness_against(type_name, revomon_type2)
-                    if effectiveness2 and effectiveness2 >= 2.0:
-                        weak_revomon.append(revomon["name"])
+        if not team:
+            return weaknesses
+
+        # Attacking types each member is weak to through either of its types
+        profiles = self.types_client.get_type_profiles()
+        type1, type2 = profiles.encode(team)
+        weak = profiles.weak[type1, type2].tolist()
 
+        for code, type_name in enumerate(profiles.chart.attacking_types):
+            weak_revomon = [revomon["name"] for revomon, mask in zip(team, weak) if mask >> code & 1]
             if weak_revomon:
-                weaknesses[type_name] = list(set(weak_revomon))  # Remove duplicates
+                weaknesses[type_name] = list(dict.fromkeys(weak_revomon))  # Remove duplicates
 
         return weaknesses
 
@@ -567,3 +1125,57 @@ class BattleMechanicsClient:
         }
 
         return analysis
+
+
+def _combatant_key(revomon: Dict[str, Any]) -> Tuple:
+    """
+    Get the fields of a Revomon that damage calculations read.
+
+    Args:
+        revomon: Revomon record
+
+    Returns:
+        Tuple of its dex id (which selects the learnset), types and stats
+    """
+    return (
+        revomon.get("dex_id"), revomon.get("type1"), revomon.get("type2"),
+        *(revomon.get(stat) for stat in STAT_FIELDS),
+    )
+
+
+def _damage_table_rows(level_buckets: Tuple[int, ...], bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a range of attacker rows of the damage tables.
+
+    Args:
+        level_buckets: Levels to compute at
+        bounds: (first, after last) attacker positions
+
+    Returns:
+        Tuple of (best move, expected damage) rows
+    """
+    species, moves, learnable, chart = process_instance(BattleMechanicsClient)._damage_table_inputs()
+    return compute_damage_rows(species, moves, learnable, chart, level_buckets, *bounds)
+
+
+def _simulate_matchup(item: Tuple[str, str, str, int, int, int], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Simulate one matchup of ``simulate_matchups``.
+
+    Args:
+        item: (attacker, defender, move, attacker level, defender level, samples)
+        rng: The matchup's random generator
+
+    Returns:
+        The ``simulate_turns`` result, or an error if a Revomon is unknown
+    """
+    attacker_name, defender_name, move_name, attacker_level, defender_level, samples = item
+    client = process_instance(BattleMechanicsClient)
+    attacker = client.revomon_client.get_revomon_by_name(attacker_name)
+    defender = client.revomon_client.get_revomon_by_name(defender_name)
+    for name, revomon in ((attacker_name, attacker), (defender_name, defender)):
+        if not revomon:
+            return {"error": f"Revomon '{name}' not found"}
+    return client.simulate_turns(
+        attacker, defender, move_name, attacker_level, defender_level, samples=samples, rng=rng
+    )
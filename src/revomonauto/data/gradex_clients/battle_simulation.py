@@ -0,0 +1,206 @@
+"""
+Seeded, vectorized Monte Carlo sampling of battle turns
+"""
+import math
+from statistics import NormalDist
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+
+from .damage_batch import DAMAGE_ROLLS
+
+# Anything numpy.random.default_rng accepts: a seed, a SeedSequence or a Generator
+RandomSource = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+# Base critical hit rate, doubled for high-crit moves
+BASE_CRIT_RATE = 0.0625
+HIGH_CRIT_KEYWORDS = ("karate chop", "razor", "slash")
+
+
+def critical_hit_rate(move: Dict[str, Any]) -> float:
+    """
+    Get the chance of a move landing a critical hit.
+
+    Args:
+        move: Move data
+
+    Returns:
+        Probability from 0 to 1
+    """
+    move_name = (move.get("name") or "").lower()
+    if any(keyword in move_name for keyword in HIGH_CRIT_KEYWORDS):
+        return BASE_CRIT_RATE * 2
+    return BASE_CRIT_RATE
+
+
+def hit_chance(move: Dict[str, Any]) -> float:
+    """
+    Get the chance of a move hitting.
+
+    Args:
+        move: Move data
+
+    Returns:
+        Probability from 0 to 1; moves with accuracy 0.0 never miss
+    """
+    accuracy = move.get("accuracy", 1.0)
+    if accuracy == 0.0:
+        return 1.0
+    return min(max(accuracy, 0.0), 1.0)
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        confidence: Confidence level
+
+    Returns:
+        Tuple of (low, high) bounds, (0.0, 1.0) when there are no trials
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    proportion = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (proportion + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(proportion * (1 - proportion) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def probability(successes: int, trials: int, confidence: float = 0.95) -> Dict[str, float]:
+    """
+    Estimate a probability with its confidence interval.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        confidence: Confidence level
+
+    Returns:
+        Dict with "estimate", "low" and "high"
+    """
+    low, high = wilson_interval(successes, trials, confidence)
+    return {"estimate": successes / trials if trials else 0.0, "low": low, "high": high}
+
+
+def sample_damage(
+    pre_roll: Tuple[float, float],
+    accuracy: float,
+    crit_rate: float,
+    samples: int,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw the outcome of many uses of a move at once.
+
+    Each sample draws, in order, an accuracy check, a critical hit check and
+    a damage roll, so results depend only on the generator's state.
+
+    Args:
+        pre_roll: Damage before the random factor without and with a critical hit
+        accuracy: Chance of hitting
+        crit_rate: Chance of a critical hit
+        samples: Number of samples
+        rng: Random generator
+
+    Returns:
+        Tuple of (damage, hit, critical) arrays; damage is zero on a miss
+    """
+    hit = rng.random(samples) < accuracy
+    critical = rng.random(samples) < crit_rate
+    rolls = DAMAGE_ROLLS[rng.integers(0, len(DAMAGE_ROLLS), samples)]
+    damage = np.floor(np.where(critical, pre_roll[1], pre_roll[0]) * rolls).astype(np.int64)
+    damage[~hit] = 0
+    return damage, hit, critical & hit
+
+
+class DuelSide:
+    """
+    One side of a simulated duel: a Revomon repeatedly using one move.
+    """
+
+    def __init__(
+        self,
+        pre_roll: Tuple[float, float],
+        accuracy: float,
+        crit_rate: float,
+        hp: int,
+        speed: int,
+    ):
+        """
+        Describe the side.
+
+        Args:
+            pre_roll: Damage its move does to the opponent before the random
+                factor, without and with a critical hit
+            accuracy: Chance of its move hitting
+            crit_rate: Chance of a critical hit
+            hp: Starting HP
+            speed: Speed stat, deciding who moves first
+        """
+        self.pre_roll = pre_roll
+        self.accuracy = accuracy
+        self.crit_rate = crit_rate
+        self.hp = hp
+        self.speed = speed
+
+
+def sample_duels(
+    first: DuelSide,
+    second: DuelSide,
+    samples: int,
+    rng: np.random.Generator,
+    max_turns: int = 50,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Play many duels at once until one side faints.
+
+    Every turn the faster side attacks first (a speed tie is a coin flip per
+    sample) and the slower side only attacks if it is still standing.
+
+    Args:
+        first: First side
+        second: Second side
+        samples: Number of duels
+        rng: Random generator
+        max_turns: Turns after which an undecided duel is abandoned
+
+    Returns:
+        Tuple of (winner, turns) arrays: winner is 1 or 2 for the side that
+        won and 0 for an undecided duel, turns the turn it ended on
+    """
+    hp_first = np.full(samples, first.hp, dtype=np.int64)
+    hp_second = np.full(samples, second.hp, dtype=np.int64)
+    winner = np.zeros(samples, dtype=np.int8)
+    turns = np.zeros(samples, dtype=np.int64)
+
+    for turn in range(1, max_turns + 1):
+        active = np.flatnonzero(winner == 0)
+        if not active.size:
+            break
+        count = active.size
+        if first.speed == second.speed:
+            first_moves_first = rng.random(count) < 0.5
+        else:
+            first_moves_first = np.full(count, first.speed > second.speed)
+        damage_by_first = sample_damage(first.pre_roll, first.accuracy, first.crit_rate, count, rng)[0]
+        damage_by_second = sample_damage(second.pre_roll, second.accuracy, second.crit_rate, count, rng)[0]
+
+        second_left = hp_second[active] - damage_by_first
+        first_left = hp_first[active] - damage_by_second
+        # A side that faints before its turn doesn't attack
+        first_attacks = first_moves_first | (first_left > 0)
+        second_attacks = ~first_moves_first | (second_left > 0)
+        hp_second[active] = np.where(first_attacks, second_left, hp_second[active])
+        hp_first[active] = np.where(second_attacks, first_left, hp_first[active])
+
+        first_wins = first_attacks & (second_left <= 0) & (first_moves_first | (first_left > 0))
+        second_wins = second_attacks & (first_left <= 0) & (~first_moves_first | (second_left > 0))
+        winner[active[first_wins]] = 1
+        winner[active[second_wins]] = 2
+        turns[active[first_wins | second_wins]] = turn
+    return winner, turns
@@ -18,8 +18,10 @@ class CapsulesClient(BaseDataClient):
     - move_name: Name of the move in the capsule
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/capsules.json")
+    indexed_fields = ("move_id", "move_name")
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/capsules.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "cap_num"
@@ -82,5 +84,5 @@ class CapsulesClient(BaseDataClient):
         """
         self.load_data()
         pattern = pattern.lower()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if pattern in record["move_name"].lower()]
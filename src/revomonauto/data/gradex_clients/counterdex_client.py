@@ -6,9 +6,13 @@ from logging import getLogger
 from typing import Any, Dict, List, Optional
 
 from .base_client import BaseDataClient
+from .counterdex_index import CounterdexIndex, build_counterdex_index
 
 logger = getLogger(__name__)
 
+# Competitive tiers from best to worst, as comparable values
+TIER_VALUES = {"s": 5, "a": 4, "b": 3, "c": 2, "d": 1}
+
 
 class CounterdexClient(BaseDataClient):
     """
@@ -24,14 +28,88 @@ class CounterdexClient(BaseDataClient):
     - tips: Competitive tips and strategies
     - counters: Revomon that counter this one
     - weakness: Type weaknesses
+
+    The newline-delimited fields are parsed once per loaded dataset into a
+    ``CounterdexIndex``, which also holds the counter graph.
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/counterdex.json")
+    indexed_fields = ("name", "tier")
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/counterdex.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "dex_id"
 
+    def get_counterdex_index(self) -> CounterdexIndex:
+        """
+        Get the parsed counterdex fields and counter graph.
+
+        The index is built once per loaded dataset and shared by every
+        CounterdexClient.
+
+        Returns:
+            The counterdex index
+        """
+        self.load_data()
+        if self._dataset is None:
+            return CounterdexIndex(self._data)
+        return self._dataset.derived("counterdex_index", build_counterdex_index)
+
+    def get_parsed_entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the structured counters, weaknesses, metamoves and metabuilds of a Revomon.
+
+        Args:
+            name: The Revomon name
+
+        Returns:
+            Dict with "counters" (list of lines), "weaknesses" (list of
+            (type, multiplier) pairs), "metamoves" (list of movesets) and
+            "metabuilds" (list of builds with abilities, evs and natures),
+            or None if the Revomon isn't in the counterdex
+        """
+        entry = self.get_counterdex_index().entry(name)
+        if entry is None:
+            return None
+        return {
+            "counters": list(entry["counters"]),
+            "weaknesses": list(entry["weaknesses"]),
+            "metamoves": [
+                {"label": moveset["label"], "slots": [list(slot) for slot in moveset["slots"]]}
+                for moveset in entry["metamoves"]
+            ],
+            "metabuilds": [
+                {**build, "abilities": list(build["abilities"]), "evs": dict(build["evs"]),
+                 "natures": list(build["natures"]), "notes": list(build["notes"])}
+                for build in entry["metabuilds"]
+            ],
+        }
+
+    def get_counters_of(self, name: str) -> List[str]:
+        """
+        Get the Revomon that counter a Revomon.
+
+        Args:
+            name: The Revomon name
+
+        Returns:
+            Names of the Revomon in its counters list
+        """
+        return self.get_counterdex_index().counters_of(name)
+
+    def get_countered_by(self, name: str) -> List[str]:
+        """
+        Get the Revomon that a Revomon counters.
+
+        Args:
+            name: The counter's name
+
+        Returns:
+            Names of the Revomon listing it as a counter
+        """
+        return self.get_counterdex_index().countered_by(name)
+
     def get_counterdex_entry(self, dex_id: int) -> Optional[Dict[str, Any]]:
         """
         Get counterdex data by Revodex ID.
@@ -78,14 +156,13 @@ class CounterdexClient(BaseDataClient):
         Returns:
             List of high-tier Revomon
         """
-        tier_hierarchy = {"s": 5, "a": 4, "b": 3, "c": 2, "d": 1}
-        min_value = tier_hierarchy.get(min_tier.lower(), 0)
+        min_value = TIER_VALUES.get(min_tier.lower(), 0)
 
         self.load_data()
         return [
-            record.copy()
+            self._emit(record)
             for record in self._data
-            if tier_hierarchy.get(record.get("tier", "").lower(), 0) >= min_value
+            if TIER_VALUES.get(record.get("tier", "").lower(), 0) >= min_value
         ]
 
     def get_revomon_with_specific_counters(
@@ -100,18 +177,11 @@ class CounterdexClient(BaseDataClient):
         Returns:
             List of Revomon countered by the specified counters
         """
-        self.load_data()
-        matches = []
-        for record in self._data:
-            counters = record.get("counters", "")
-            if counters:
-                # Split counters by newline and check if any match
-                record_counters = [c.strip() for c in counters.split("\n") if c.strip()]
-                for counter_name in counter_names:
-                    if counter_name.lower() in [c.lower() for c in record_counters]:
-                        matches.append(record.copy())
-                        break
-        return matches
+        by_counter_line = self.get_counterdex_index().by_counter_line
+        positions = set()
+        for counter_name in counter_names:
+            positions.update(by_counter_line.get(counter_name.lower(), ()))
+        return [self._emit(self._data[position]) for position in sorted(positions)]
 
     def get_revomon_by_weakness_count(
         self, min_weaknesses: int = 4
@@ -125,16 +195,12 @@ class CounterdexClient(BaseDataClient):
         Returns:
             List of Revomon with many weaknesses
         """
-        self.load_data()
-        matches = []
-        for record in self._data:
-            weakness_text = record.get("weakness", "")
-            if weakness_text:
-                # Count weaknesses by splitting on newlines
-                weaknesses = [w.strip() for w in weakness_text.split("\n") if w.strip()]
-                if len(weaknesses) >= min_weaknesses:
-                    matches.append(record.copy())
-        return matches
+        entries = self.get_counterdex_index().entries
+        return [
+            self._emit(record)
+            for record, entry in zip(self._data, entries)
+            if entry["weaknesses"] and len(entry["weaknesses"]) >= min_weaknesses
+        ]
 
     def get_tank_revomon(self) -> List[Dict[str, Any]]:
         """
@@ -181,17 +247,4 @@ class CounterdexClient(BaseDataClient):
         Returns:
             List of matching Revomon
         """
-        self.load_data()
-        matches = []
-        keywords = [kw.lower() for kw in keywords]
-
-        for record in self._data:
-            description = record.get("description", "").lower()
-            tips = record.get("tips", "").lower()
-
-            for keyword in keywords:
-                if keyword in description or keyword in tips:
-                    matches.append(record.copy())
-                    break  # Don't add duplicates if multiple keywords match
-
-        return matches
+        return self.find_by_keywords(keywords, fields=("description", "tips"))
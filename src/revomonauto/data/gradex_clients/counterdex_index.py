@@ -0,0 +1,286 @@
+"""
+Structured counterdex fields and the counter graph, parsed once per dataset
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# EV stat spellings used in metabuilds -> the stat fields used by revomon.json
+_STAT_ALIASES = {
+    "hp": "hp",
+    "atk": "atk", "attack": "atk",
+    "def": "def", "defense": "def",
+    "spa": "spa", "sp.atk": "spa", "sp.attack": "spa", "spatk": "spa",
+    "spd": "spd", "sp.def": "spd", "sp.defense": "spd", "spdef": "spd",
+    "spe": "spe", "speed": "spe", "sped": "spe",
+}
+
+# "252 hp" or "spa 252"
+_EV = re.compile(r"(\d+)\s*([a-z.]+)|([a-z.]+)\s*(\d+)")
+# "fire 2x", optionally followed by a note
+_WEAKNESS = re.compile(r"([a-z]+)\s+(\d+(?:\.\d+)?)x")
+# A "(label)" line naming one of several builds
+_LABEL = re.compile(r"^\((.*)\)$")
+# A parenthetical note after a counter's name
+_NOTE = re.compile(r"\s*\(.*\)\s*$")
+
+
+def split_lines(text: Optional[str]) -> List[str]:
+    """
+    Split a newline-delimited field into stripped, non-empty lines.
+
+    Args:
+        text: Field value, possibly None
+
+    Returns:
+        List of lines
+    """
+    if not text:
+        return []
+    return [line.strip() for line in text.split("\n") if line.strip()]
+
+
+def _alternatives(text: str) -> List[str]:
+    return [part.strip() for part in text.split("/") if part.strip()]
+
+
+def _blocks(text: Optional[str]) -> List[Tuple[Optional[str], List[str]]]:
+    """
+    Split a field into labelled blocks.
+
+    A "(label)" line starts a new block; lines before any label form an
+    unlabelled block.
+
+    Args:
+        text: Field value
+
+    Returns:
+        List of (label, lines) pairs
+    """
+    blocks: List[Tuple[Optional[str], List[str]]] = []
+    for line in split_lines(text):
+        label = _LABEL.match(line)
+        if label:
+            blocks.append((label.group(1).strip(), []))
+        else:
+            if not blocks:
+                blocks.append((None, []))
+            blocks[-1][1].append(line)
+    return blocks
+
+
+def parse_weaknesses(text: Optional[str]) -> List[Tuple[str, float]]:
+    """
+    Parse a weakness field such as "fire 2x\\nice 4x".
+
+    Args:
+        text: Field value
+
+    Returns:
+        List of (type, multiplier) pairs in listed order
+    """
+    weaknesses = []
+    for line in split_lines(text):
+        match = _WEAKNESS.match(line)
+        if match:
+            weaknesses.append((match.group(1), float(match.group(2))))
+    return weaknesses
+
+
+def parse_metamoves(text: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Parse a metamoves field into movesets.
+
+    Each "- a / b" line is one move slot with its alternatives.
+
+    Args:
+        text: Field value
+
+    Returns:
+        List of {"label": str or None, "slots": [[move, ...], ...]} dicts
+    """
+    movesets = []
+    for label, lines in _blocks(text):
+        slots = [_alternatives(line.lstrip("-").strip()) for line in lines if line.startswith("-")]
+        if slots:
+            movesets.append({"label": label, "slots": slots})
+    return movesets
+
+
+def parse_evs(text: str) -> Dict[str, int]:
+    """
+    Parse an EV spread such as "252 atk / 4 def / 252 speed".
+
+    Args:
+        text: The spread
+
+    Returns:
+        Dict mapping stat field (hp, atk, def, spa, spd, spe) to EVs;
+        unrecognised parts are skipped
+    """
+    evs: Dict[str, int] = {}
+    for part in re.split(r"[/,]", text):
+        match = _EV.search(part.strip())
+        if not match:
+            continue
+        value, stat = (match.group(1), match.group(2)) if match.group(1) else (match.group(4), match.group(3))
+        stat = _STAT_ALIASES.get(stat)
+        if stat:
+            evs[stat] = int(value)
+    return evs
+
+
+def parse_metabuilds(text: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Parse a metabuilds field into builds.
+
+    Args:
+        text: Field value
+
+    Returns:
+        List of {"label", "abilities", "evs", "natures", "notes"} dicts, where
+        abilities and natures list the alternatives and notes holds lines
+        that aren't ability, EV or nature lines
+    """
+    builds = []
+    for label, lines in _blocks(text):
+        build = {"label": label, "abilities": [], "evs": {}, "natures": [], "notes": []}
+        for line in lines:
+            key, _, value = line.partition(":")
+            key = key.strip()
+            if key == "ability":
+                build["abilities"] = _alternatives(value)
+            elif key == "evs":
+                build["evs"] = parse_evs(value)
+            elif key == "nature":
+                build["natures"] = _alternatives(value)
+            else:
+                build["notes"].append(line)
+        builds.append(build)
+    return builds
+
+
+class CounterdexIndex:
+    """
+    Parsed counterdex fields and a directed counter graph.
+
+    ``entries`` holds the structured fields of each record by position. The
+    graph has an edge from a counter to every Revomon whose ``counters``
+    list names it, so both directions are O(degree) lookups. Counter lines
+    that aren't a Revomon name (e.g. "any fire type moves") are kept in the
+    entries but add no edge; a trailing parenthetical note such as
+    "opawan (with insomnia)" is ignored when matching names.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Parse the records.
+
+        Args:
+            records: counterdex.json records
+        """
+        self.entries: List[Dict[str, Any]] = []
+        self.positions: Dict[str, int] = {}
+        # Lower-cased counter line -> positions of the records listing it
+        self.by_counter_line: Dict[str, List[int]] = {}
+        for position, record in enumerate(records):
+            counters = split_lines(record.get("counters"))
+            self.entries.append({
+                "counters": counters,
+                "counter_set": frozenset(counter.lower() for counter in counters),
+                "weaknesses": parse_weaknesses(record.get("weakness")),
+                "metamoves": parse_metamoves(record.get("metamoves")),
+                "metabuilds": parse_metabuilds(record.get("metabuilds")),
+            })
+            name = record.get("name")
+            if isinstance(name, str):
+                self.positions.setdefault(name.lower(), position)
+            for line in self.entries[-1]["counter_set"]:
+                self.by_counter_line.setdefault(line, []).append(position)
+
+        names = [record.get("name") for record in records]
+        self._counters: Dict[str, List[str]] = {}
+        self._countered: Dict[str, List[str]] = {}
+        for name, entry in zip(names, self.entries):
+            if not isinstance(name, str):
+                continue
+            name = name.lower()
+            for line in entry["counters"]:
+                counter = self.resolve(line)
+                if counter is None:
+                    continue
+                targets = self._countered.setdefault(counter, [])
+                if name not in targets:
+                    targets.append(name)
+                    self._counters.setdefault(name, []).append(counter)
+
+    def resolve(self, line: str) -> Optional[str]:
+        """
+        Get the Revomon a counter line names.
+
+        Args:
+            line: A line of a counters field
+
+        Returns:
+            The Revomon name, or None if the line doesn't name one
+        """
+        name = _NOTE.sub("", line).strip().lower()
+        return name if name in self.positions else None
+
+    def entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed fields of a Revomon.
+
+        Args:
+            name: The Revomon name
+
+        Returns:
+            Dict of parsed fields, or None if the Revomon isn't in the counterdex
+        """
+        position = self.positions.get(name.lower())
+        return None if position is None else self.entries[position]
+
+    def counters_of(self, name: str) -> List[str]:
+        """
+        Get the Revomon that counter a Revomon.
+
+        Args:
+            name: The countered Revomon
+
+        Returns:
+            Counter names, in listed order
+        """
+        return list(self._counters.get(name.lower(), ()))
+
+    def countered_by(self, name: str) -> List[str]:
+        """
+        Get the Revomon a Revomon counters.
+
+        Args:
+            name: The counter
+
+        Returns:
+            Names of the Revomon listing it as a counter, in dataset order
+        """
+        return list(self._countered.get(name.lower(), ()))
+
+    def edges(self) -> List[Tuple[str, str]]:
+        """
+        Get every edge of the counter graph.
+
+        Returns:
+            List of (counter, countered) pairs
+        """
+        return [(counter, name) for counter, names in self._countered.items() for name in names]
+
+
+def build_counterdex_index(dataset) -> CounterdexIndex:
+    """
+    Build the counterdex index for a counterdex.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Index over the dataset's records
+    """
+    return CounterdexIndex(dataset.records)
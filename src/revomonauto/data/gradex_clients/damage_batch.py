@@ -0,0 +1,246 @@
+"""
+Vectorized damage for every combination of attackers, defenders and moves
+"""
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .revomon_columns import STAT_FIELDS, scale_stats
+from .type_chart import NO_TYPE, TypeChart
+
+# Values of the random damage factor, each equally likely
+DAMAGE_ROLLS = np.arange(85, 101) / 100
+
+# Weather -> {move type: multiplier}; other types are unaffected
+WEATHER_MULTIPLIERS: Dict[str, Dict[str, float]] = {
+    "sunny": {"fire": 1.5, "water": 0.5},
+    "rain": {"water": 1.5, "fire": 0.5},
+}
+
+_ATK, _DEF, _SPA, _SPD = (STAT_FIELDS.index(stat) for stat in ("atk", "def", "spa", "spd"))
+
+
+def weather_multiplier(move_type: Optional[str], weather: Optional[str]) -> float:
+    """
+    Get the weather multiplier for a move type.
+
+    Args:
+        move_type: The move's type
+        weather: Current weather condition, None for no weather
+
+    Returns:
+        The multiplier
+    """
+    if not weather:
+        return 1.0
+    return WEATHER_MULTIPLIERS.get(weather.lower(), {}).get(move_type, 1.0)
+
+
+class Combatants:
+    """
+    Level-scaled stats and type codes of a batch of Revomon, as arrays.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        chart: TypeChart,
+        levels: Union[int, Sequence[int], np.ndarray] = 100,
+    ):
+        """
+        Encode the Revomon.
+
+        Args:
+            records: Revomon records
+            chart: Type chart used to encode types
+            levels: Level of every Revomon, or one level per Revomon
+        """
+        self.size = len(records)
+        self.levels = np.broadcast_to(np.asarray(levels, dtype=np.int64), (self.size,))
+        base_stats = np.array(
+            [[record.get(stat) or 0 for stat in STAT_FIELDS] for record in records], dtype=np.int64
+        ).reshape(self.size, len(STAT_FIELDS))
+        self.stats = scale_stats(base_stats, self.levels)
+        self.type1 = chart.encode(record.get("type1") for record in records)
+        self.type2 = chart.encode(record.get("type2") for record in records)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class MoveArrays:
+    """
+    Power, category, accuracy and type codes of a batch of moves, as arrays.
+    """
+
+    def __init__(self, moves: Sequence[Dict[str, Any]], chart: TypeChart):
+        """
+        Encode the moves.
+
+        Args:
+            moves: Move records
+            chart: Type chart used to encode types
+        """
+        self.size = len(moves)
+        self.types = [move.get("type") for move in moves]
+        self.type_codes = chart.encode(self.types)
+        self.power = np.fromiter((move.get("power") or 0 for move in moves), dtype=np.int64, count=self.size)
+        self.accuracy = np.fromiter(
+            (move.get("accuracy", 1.0) for move in moves), dtype=np.float64, count=self.size
+        )
+        categories = [move.get("category") for move in moves]
+        self.physical = np.array([category == "physical" for category in categories], dtype=bool)
+        self.special = np.array([category == "special" for category in categories], dtype=bool)
+        # Status moves and moves without power deal no damage
+        self.damaging = (self.physical | self.special) & (self.power != 0)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def pre_roll_damage(
+    attackers: Combatants,
+    defenders: Combatants,
+    moves: MoveArrays,
+    chart: TypeChart,
+    weather: Optional[str] = None,
+    critical_hit: bool = False,
+    burn: Union[bool, np.ndarray] = False,
+    stab: Optional[bool] = None,
+) -> np.ndarray:
+    """
+    Compute damage before the random factor for every combination.
+
+    Follows ``BattleMechanicsClient.calculate_damage`` operation by
+    operation, so multiplying by a roll and the other modifiers and flooring
+    gives exactly its result.
+
+    Args:
+        attackers: N attackers
+        defenders: M defenders
+        moves: K moves
+        chart: Type chart the combatants and moves were encoded with
+        weather: Current weather condition
+        critical_hit: Whether every hit is critical
+        burn: Whether the attackers are burned, for all or per attacker
+        stab: Same-type attack bonus for every combination, or None to apply
+            it where the move's type is one of the attacker's types
+
+    Returns:
+        Float array of shape (N, M, K), zero where no damage is dealt
+    """
+    stats = attackers.stats
+    burned = np.broadcast_to(np.asarray(burn, dtype=bool), (len(attackers),))
+    physical_attack = np.where(burned, stats[:, _ATK] // 2, stats[:, _ATK])
+    physical = moves.physical[np.newaxis, :]
+    attack = np.where(physical, physical_attack[:, np.newaxis], stats[:, _SPA, np.newaxis])
+    defense = np.where(physical, defenders.stats[:, _DEF, np.newaxis], defenders.stats[:, _SPD, np.newaxis])
+
+    level_factor = (2 * attackers.levels) / 5 + 2
+    scaled_attack = level_factor[:, np.newaxis] * attack * moves.power[np.newaxis, :]
+    damage = (scaled_attack[:, np.newaxis, :] / defense[np.newaxis, :, :]) / 50 + 2
+
+    effectiveness = chart.multipliers(
+        moves.type_codes[np.newaxis, :], defenders.type1[:, np.newaxis], defenders.type2[:, np.newaxis]
+    )
+    damage *= effectiveness[np.newaxis, :, :]
+
+    if stab is None:
+        typed = moves.type_codes != NO_TYPE
+        same_type = (
+            (attackers.type1[:, np.newaxis] == moves.type_codes[np.newaxis, :])
+            | (attackers.type2[:, np.newaxis] == moves.type_codes[np.newaxis, :])
+        ) & typed[np.newaxis, :]
+        damage *= np.where(same_type, 1.5, 1.0)[:, np.newaxis, :]
+    else:
+        damage *= 1.5 if stab else 1.0
+
+    damage *= 2.0 if critical_hit else 1.0
+    damage *= np.array([weather_multiplier(move_type, weather) for move_type in moves.types])
+    damage[:, :, ~moves.damaging] = 0.0
+    return damage
+
+
+def damage_tensor(
+    attackers: Combatants,
+    defenders: Combatants,
+    moves: MoveArrays,
+    chart: TypeChart,
+    weather: Optional[str] = None,
+    critical_hit: bool = False,
+    burn: Union[bool, np.ndarray] = False,
+    stab: Optional[bool] = None,
+    other_modifiers: float = 1.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute min, max and expected damage for every combination.
+
+    Args:
+        attackers: N attackers
+        defenders: M defenders
+        moves: K moves
+        chart: Type chart the combatants and moves were encoded with
+        weather: Current weather condition
+        critical_hit: Whether every hit is critical
+        burn: Whether the attackers are burned, for all or per attacker
+        stab: Same-type attack bonus for every combination, or None to apply
+            it where the move's type is one of the attacker's types
+        other_modifiers: Additional multiplier
+
+    Returns:
+        Dict with (N, M, K) arrays: "min_damage" and "max_damage" (integers,
+        the lowest and highest roll) and "expected_damage" (mean over the
+        equally likely rolls)
+    """
+    damage = pre_roll_damage(attackers, defenders, moves, chart, weather, critical_hit, burn, stab)
+    return {
+        "min_damage": _rolled(damage, DAMAGE_ROLLS[0], other_modifiers).astype(np.int64),
+        "max_damage": _rolled(damage, DAMAGE_ROLLS[-1], other_modifiers).astype(np.int64),
+        "expected_damage": expected_damage(damage, moves.damaging, other_modifiers),
+    }
+
+
+def _rolled(damage: np.ndarray, roll: float, other_modifiers: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Apply a damage roll and the other modifiers, then floor.
+
+    Args:
+        damage: Pre-roll damage
+        roll: Random factor
+        other_modifiers: Additional multiplier
+        out: Optional array to write the result to
+
+    Returns:
+        Floored damage as floats
+    """
+    out = np.multiply(damage, roll, out=out)
+    if other_modifiers != 1.0:
+        np.multiply(out, other_modifiers, out=out)
+    return np.floor(out, out=out)
+
+
+def expected_damage(damage: np.ndarray, damaging: np.ndarray, other_modifiers: float) -> np.ndarray:
+    """
+    Average the floored damage over every roll.
+
+    Args:
+        damage: Pre-roll damage of shape (N, M, K)
+        damaging: Which of the K moves deal damage
+        other_modifiers: Additional multiplier
+
+    Returns:
+        Float array of shape (N, M, K)
+    """
+    expected = np.zeros_like(damage)
+    columns = np.flatnonzero(damaging)
+    if not columns.size:
+        return expected
+    # Only damaging moves need rolling; the rest stay zero
+    subset = damage[:, :, columns] if columns.size < damage.shape[2] else damage
+    total = np.zeros_like(subset)
+    buffer = np.empty_like(subset)
+    for roll in DAMAGE_ROLLS:
+        total += _rolled(subset, roll, other_modifiers, out=buffer)
+    total /= len(DAMAGE_ROLLS)
+    expected[:, :, columns] = total
+    return expected
@@ -0,0 +1,128 @@
+"""
+Exact damage distributions and knockout chances, computed in closed form
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .damage_batch import DAMAGE_ROLLS
+
+# Probabilities this close to 1 count as a guaranteed knockout
+GUARANTEED = 1 - 1e-9
+
+
+def roll_damage(pre_roll: float, other_modifiers: float = 1.0) -> np.ndarray:
+    """
+    Enumerate the damage of every roll.
+
+    Args:
+        pre_roll: Damage before the random factor
+        other_modifiers: Additional multiplier
+
+    Returns:
+        Integer array with the damage of each of the 16 equally likely rolls
+    """
+    # Same operation order as BattleMechanicsClient.calculate_damage
+    damage = pre_roll * DAMAGE_ROLLS
+    if other_modifiers != 1.0:
+        damage = damage * other_modifiers
+    return np.floor(damage).astype(np.int64)
+
+
+def hit_distribution(
+    pre_roll: Tuple[float, float],
+    accuracy: float,
+    crit_rate: float,
+    other_modifiers: float = 1.0,
+) -> np.ndarray:
+    """
+    Get the exact distribution of one use of a move's damage.
+
+    Args:
+        pre_roll: Damage before the random factor without and with a critical hit
+        accuracy: Chance of hitting
+        crit_rate: Chance of a critical hit
+        other_modifiers: Additional multiplier
+
+    Returns:
+        Float array where entry ``d`` is the probability of dealing exactly
+        ``d`` damage; a miss deals 0
+    """
+    normal = roll_damage(pre_roll[0], other_modifiers)
+    critical = roll_damage(pre_roll[1], other_modifiers)
+    roll_chance = accuracy / len(DAMAGE_ROLLS)
+    pmf = np.bincount(
+        np.concatenate((normal, critical)),
+        weights=np.repeat((roll_chance * (1 - crit_rate), roll_chance * crit_rate), len(DAMAGE_ROLLS)),
+        minlength=1,
+    )
+    pmf[0] += 1 - accuracy
+    return pmf
+
+
+def ko_chances(pmf: np.ndarray, hp: int, max_hits: int = 4) -> np.ndarray:
+    """
+    Get the chance of a knockout within each number of hits.
+
+    Damage of successive hits is independent, so the distribution of total
+    damage after ``n`` hits is the ``n``-fold convolution of ``pmf``. Totals
+    of ``hp`` or more are folded into one absorbing knockout state, which
+    keeps every convolution at most ``hp + 1`` long.
+
+    Args:
+        pmf: Distribution of one hit's damage, as from ``hit_distribution``
+        hp: Defender's current HP
+        max_hits: Largest number of hits to consider
+
+    Returns:
+        Float array whose entry ``n - 1`` is the chance of knocking out
+        within ``n`` hits (the nHKO chance)
+    """
+    chances = np.zeros(max_hits)
+    if hp <= 0:
+        chances[:] = 1.0
+        return chances
+    # Damage past hp only matters as a knockout, so cap the step's length
+    step = _fold(pmf, hp) if len(pmf) > hp + 1 else pmf
+    remaining = np.zeros(hp + 1)
+    remaining[0] = 1.0
+    for hit in range(max_hits):
+        # Only totals below hp can still change; knockouts stay knockouts
+        knocked_out = remaining[hp]
+        remaining = _fold(np.convolve(remaining[:hp], step), hp)
+        remaining[hp] += knocked_out
+        chances[hit] = min(remaining[hp], 1.0)
+    return chances
+
+
+def hits_to_ko(chances: np.ndarray) -> int:
+    """
+    Get the number of hits that guarantees a knockout.
+
+    Args:
+        chances: nHKO chances, as from ``ko_chances``
+
+    Returns:
+        The smallest number of hits with a certain knockout, or 0 if none of
+        the considered numbers is certain
+    """
+    certain = np.flatnonzero(chances >= GUARANTEED)
+    return int(certain[0]) + 1 if certain.size else 0
+
+
+def _fold(pmf: np.ndarray, hp: int) -> np.ndarray:
+    """
+    Merge the probability of every total of ``hp`` or more into entry ``hp``.
+
+    Args:
+        pmf: Damage distribution
+        hp: Knockout threshold
+
+    Returns:
+        Float array of length ``hp + 1``
+    """
+    folded = np.zeros(hp + 1)
+    head = pmf[:hp]
+    folded[:len(head)] = head
+    folded[hp] = pmf[hp:].sum()
+    return folded
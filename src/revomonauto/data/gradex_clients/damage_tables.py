@@ -0,0 +1,339 @@
+"""
+Precomputed species x species damage tables, memory-mapped from disk
+"""
+import hashlib
+import json
+import os
+import shutil
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .damage_batch import Combatants, MoveArrays, expected_damage, pre_roll_damage
+from .snapshot_cache import file_sha256
+from .type_chart import TypeChart
+
+logger = getLogger(__name__)
+
+# Bump when the table layout or damage formula changes so stale tables are ignored
+DAMAGE_TABLE_FORMAT = 1
+
+# Levels the tables are computed at; a lookup uses the first bucket at or above its level
+LEVEL_BUCKETS: Tuple[int, ...] = (25, 50, 75, 100)
+
+# Best-move entry of a matchup where the attacker has no damaging move
+NO_MOVE = -1
+
+# Tables mapped by this process, by directory
+_open_tables: Dict[Path, "DamageTables"] = {}
+
+
+def default_tables_dir() -> Path:
+    """
+    Get the directory damage tables are stored in.
+
+    Returns:
+        ``$REVOMONAUTO_CACHE_DIR/damage_tables`` when set, otherwise
+        ``~/.cache/revomonauto/damage_tables``
+    """
+    cache_dir = os.environ.get("REVOMONAUTO_CACHE_DIR")
+    base = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "revomonauto"
+    return base / "damage_tables"
+
+
+def tables_key(sources: Sequence[Path], level_buckets: Sequence[int] = LEVEL_BUCKETS) -> str:
+    """
+    Hash the inputs of a set of damage tables.
+
+    Args:
+        sources: Data files the tables are computed from
+        level_buckets: Levels the tables are computed at
+
+    Returns:
+        Hex digest that changes whenever any source's content does
+    """
+    digest = hashlib.sha256(f"{DAMAGE_TABLE_FORMAT}:{list(level_buckets)}".encode("utf-8"))
+    for source in sources:
+        digest.update(file_sha256(Path(source)).encode("ascii"))
+    return digest.hexdigest()[:24]
+
+
+def learnable_mask(
+    species: Sequence[Dict[str, Any]],
+    moves: Sequence[Dict[str, Any]],
+    learnsets: Sequence[Dict[str, Any]],
+) -> np.ndarray:
+    """
+    Mark the moves each species can learn, by any method.
+
+    Args:
+        species: revomon.json records
+        moves: moves.json records
+        learnsets: revomon_moves.json records
+
+    Returns:
+        Boolean array of shape (species, moves)
+    """
+    species_positions: Dict[Any, int] = {}
+    for position, record in enumerate(species):
+        species_positions.setdefault(record.get("dex_id"), position)
+    move_positions: Dict[Any, int] = {}
+    for position, move in enumerate(moves):
+        move_positions.setdefault(move.get("name"), position)
+
+    mask = np.zeros((len(species), len(moves)), dtype=bool)
+    for row in learnsets:
+        species_position = species_positions.get(row.get("mon_dex_id"))
+        move_position = move_positions.get(row.get("move_name"))
+        if species_position is not None and move_position is not None:
+            mask[species_position, move_position] = True
+    return mask
+
+
+def compute_damage_tables(
+    species: Sequence[Dict[str, Any]],
+    moves: Sequence[Dict[str, Any]],
+    learnable: np.ndarray,
+    chart: TypeChart,
+    level_buckets: Sequence[int] = LEVEL_BUCKETS,
+    chunk_size: int = 16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the best move of every attacker against every defender.
+
+    Both sides are at the bucket's level. The best move is the learnable
+    move with the highest expected damage, with STAB applied where the
+    move's type matches the attacker.
+
+    Args:
+        species: S Revomon records
+        moves: K move records
+        learnable: Boolean array of shape (S, K)
+        chart: Type chart
+        level_buckets: L levels to compute at
+        chunk_size: Attackers evaluated per vectorized pass, bounding memory
+
+    Returns:
+        Tuple of (best move, expected damage) arrays of shape (S, S, L):
+        move indexes as int32 (``NO_MOVE`` if no learnable move does damage)
+        and damage as float32
+    """
+    return compute_damage_rows(species, moves, learnable, chart, level_buckets, 0, len(species), chunk_size)
+
+
+def compute_damage_rows(
+    species: Sequence[Dict[str, Any]],
+    moves: Sequence[Dict[str, Any]],
+    learnable: np.ndarray,
+    chart: TypeChart,
+    level_buckets: Sequence[int],
+    start: int,
+    stop: int,
+    chunk_size: int = 16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the damage table rows of a range of attackers.
+
+    Rows are independent, so ranges can be computed in separate processes
+    and stacked.
+
+    Args:
+        species: S Revomon records
+        moves: K move records
+        learnable: Boolean array of shape (S, K)
+        chart: Type chart
+        level_buckets: L levels to compute at
+        start: First attacker
+        stop: Attacker after the last
+        chunk_size: Attackers evaluated per vectorized pass, bounding memory
+
+    Returns:
+        Tuple of (best move, expected damage) arrays of shape (stop - start, S, L)
+    """
+    size = len(species)
+    rows = max(stop - start, 0)
+    best = np.full((rows, size, len(level_buckets)), NO_MOVE, dtype=np.int32)
+    damage = np.zeros((rows, size, len(level_buckets)), dtype=np.float32)
+
+    usable = learnable & MoveArrays(moves, chart).damaging[np.newaxis, :]
+    columns = np.flatnonzero(usable.any(axis=0))
+    if not rows or not size or not columns.size:
+        return best, damage
+    candidates = MoveArrays([moves[column] for column in columns.tolist()], chart)
+    usable = usable[:, columns]
+
+    for bucket, level in enumerate(level_buckets):
+        defenders = Combatants(species, chart, level)
+        for first in range(start, stop, chunk_size):
+            last = min(first + chunk_size, stop)
+            attackers = Combatants(species[first:last], chart, level)
+            expected = expected_damage(
+                pre_roll_damage(attackers, defenders, candidates, chart), candidates.damaging, 1.0
+            )
+            expected[~np.broadcast_to(usable[first:last, np.newaxis, :], expected.shape)] = -1.0
+            choice = expected.argmax(axis=2)
+            value = np.take_along_axis(expected, choice[:, :, np.newaxis], axis=2)[:, :, 0]
+            best[first - start:last - start, :, bucket] = np.where(value >= 0, columns[choice], NO_MOVE)
+            damage[first - start:last - start, :, bucket] = np.maximum(value, 0)
+    return best, damage
+
+
+def write_damage_tables(
+    directory: Path,
+    best: np.ndarray,
+    damage: np.ndarray,
+    metadata: Dict[str, Any],
+    replace: bool = False,
+) -> None:
+    """
+    Atomically write a set of damage tables.
+
+    The tables are written to a temporary directory that is renamed into
+    place, so readers never see a partial set. If another process finished
+    first its tables are kept.
+
+    Args:
+        directory: Destination directory
+        best: Best-move array
+        damage: Expected-damage array
+        metadata: JSON-serializable description of the axes
+        replace: Delete existing tables in the directory first
+    """
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir()
+    try:
+        np.save(tmp_dir / "best_move.npy", best)
+        np.save(tmp_dir / "expected_damage.npy", damage)
+        (tmp_dir / "meta.json").write_text(json.dumps(metadata), encoding="utf-8")
+        if replace:
+            _open_tables.pop(directory, None)
+            shutil.rmtree(directory, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            if not directory.exists():
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class DamageTables:
+    """
+    Read-only, memory-mapped best-move and expected-damage tables.
+
+    ``best_move[a, d, b]`` is the index into ``moves`` of attacker ``a``'s
+    best move against defender ``d`` at level bucket ``b`` and
+    ``expected_damage[a, d, b]`` its expected damage. The arrays are mapped
+    read-only, so every process opening the same tables shares their pages.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Map a set of tables.
+
+        Args:
+            directory: Directory written by ``write_damage_tables``
+        """
+        self.directory = Path(directory)
+        metadata = json.loads((self.directory / "meta.json").read_text(encoding="utf-8"))
+        self.species: Tuple[str, ...] = tuple(metadata["species"])
+        self.moves: Tuple[str, ...] = tuple(metadata["moves"])
+        self.level_buckets: Tuple[int, ...] = tuple(metadata["level_buckets"])
+        self.best_move = np.load(self.directory / "best_move.npy", mmap_mode="r")
+        self.expected_damage = np.load(self.directory / "expected_damage.npy", mmap_mode="r")
+        self._species_positions = {name: position for position, name in enumerate(self.species)}
+
+    def bucket(self, level: int) -> int:
+        """
+        Get the level bucket used for a level.
+
+        Args:
+            level: Revomon level
+
+        Returns:
+            Index of the first bucket at or above the level (the last bucket
+            for higher levels)
+        """
+        for bucket, bucket_level in enumerate(self.level_buckets):
+            if level <= bucket_level:
+                return bucket
+        return len(self.level_buckets) - 1
+
+    def lookup(self, attacker: str, defender: str, level: int = 100) -> Optional[Tuple[str, float]]:
+        """
+        Get the best move of one Revomon against another.
+
+        Args:
+            attacker: Attacking Revomon name
+            defender: Defending Revomon name
+            level: Level of both Revomon
+
+        Returns:
+            Tuple of (move name, expected damage), or None if either Revomon
+            is unknown or the attacker has no damaging move
+        """
+        a = self._species_positions.get(attacker)
+        d = self._species_positions.get(defender)
+        if a is None or d is None:
+            return None
+        bucket = self.bucket(level)
+        move = int(self.best_move[a, d, bucket])
+        if move == NO_MOVE:
+            return None
+        return self.moves[move], float(self.expected_damage[a, d, bucket])
+
+    def best_attackers(self, defender: str, level: int = 100, top_k: int = 10) -> List[Tuple[str, str, float]]:
+        """
+        Rank every Revomon by the damage its best move does to a defender.
+
+        Args:
+            defender: Defending Revomon name
+            level: Level of both sides
+            top_k: Number of attackers to return
+
+        Returns:
+            List of (attacker, move, expected damage), highest damage first
+        """
+        d = self._species_positions.get(defender)
+        if d is None:
+            return []
+        bucket = self.bucket(level)
+        column = np.asarray(self.expected_damage[:, d, bucket])
+        moves = np.asarray(self.best_move[:, d, bucket])
+        order = np.argsort(-column, kind="stable")
+        ranked = []
+        for a in order.tolist():
+            if moves[a] == NO_MOVE:
+                continue
+            ranked.append((self.species[a], self.moves[moves[a]], float(column[a])))
+            if len(ranked) >= top_k:
+                break
+        return ranked
+
+
+def open_damage_tables(directory: Union[str, Path]) -> Optional[DamageTables]:
+    """
+    Map a set of tables once per process.
+
+    Args:
+        directory: Directory written by ``write_damage_tables``
+
+    Returns:
+        The shared tables, or None if the directory holds no complete set
+    """
+    directory = Path(directory)
+    tables = _open_tables.get(directory)
+    if tables is None:
+        if not (directory / "meta.json").exists():
+            return None
+        try:
+            tables = DamageTables(directory)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable damage tables {directory}: {e}")
+            return None
+        _open_tables[directory] = tables
+    return tables
@@ -0,0 +1,364 @@
+"""
+Process-wide registry of parsed Revomon datasets
+"""
+import json
+import os
+import sys
+import threading
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .records import FrozenRecord
+from .snapshot_cache import SnapshotCache
+from .streaming import IndexBuilder, iter_json_array
+
+logger = getLogger(__name__)
+
+
+class Dataset:
+    """
+    A parsed JSON data file and the indexes built over it.
+
+    Datasets are shared by every client reading the same file, so records are
+    stored as a tuple of FrozenRecords and the indexes must be treated as
+    read-only by their users.
+    """
+
+    def __init__(self, path: Path, mtime_ns: int, records: Sequence[Dict[str, Any]]):
+        """
+        Initialize the dataset.
+
+        Args:
+            path: Resolved path of the source JSON file
+            mtime_ns: Modification time of the source file when it was parsed
+            records: The parsed records
+        """
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.records = tuple(
+            record if type(record) is FrozenRecord else FrozenRecord(record)
+            for record in records
+        )
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {}
+        # Indexed fields already written to the on-disk snapshot, None if never written
+        self.snapshot_fields: Optional[FrozenSet[str]] = None
+        # Structures computed from the records, dropped along with the dataset
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def derived(self, name: str, build: Optional[Callable[["Dataset"], Any]] = None) -> Any:
+        """
+        Get a structure computed from this dataset, building it on first use.
+
+        Derived structures live as long as the dataset, so they are rebuilt
+        automatically when the source file changes and a new dataset is parsed.
+        They are shared by every client reading the dataset, so builders mark
+        any arrays they return read-only. The data clients import their
+        NumPy-backed builders inside the method that derives them, so
+        importing a data client alone doesn't import NumPy; analysis modules
+        such as the battle mechanics client and team builder import it at
+        module level.
+
+        Args:
+            name: Name the structure is cached under
+            build: Callable that builds the structure from the dataset, or None
+                to only return an already built structure
+
+        Returns:
+            The cached structure, or None if it isn't built and no builder was given
+        """
+        if name in self._derived or build is None:
+            return self._derived.get(name)
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = build(self)
+            return self._derived[name]
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Estimate the memory held by the records and indexes.
+
+        Returns:
+            Dictionary with byte counts for records, indexes and their total
+        """
+        seen = set()
+        records_bytes = _deep_sizeof(self.records, seen)
+        indexes_bytes = _deep_sizeof(self.indexes, seen)
+        return {
+            "records": records_bytes,
+            "indexes": indexes_bytes,
+            "total": records_bytes + indexes_bytes,
+        }
+
+
+class DatasetRegistry:
+    """
+    Cache of parsed datasets keyed by resolved file path and modification time.
+
+    Every client instance asks the registry for its data file, so a file is
+    parsed once per process no matter how many clients read it. A dataset is
+    re-parsed when its file changes on disk or a reload is forced.
+
+    With a snapshot cache, datasets are loaded from compiled snapshots that
+    include their indexes, and JSON is only parsed when no current snapshot
+    exists. ``enable_snapshots`` and ``disable_snapshots`` switch the cache
+    at run time.
+    """
+
+    def __init__(self, snapshot_cache: Optional[SnapshotCache] = None):
+        """
+        Initialize an empty registry.
+
+        Args:
+            snapshot_cache: Cache of compiled snapshots (disabled if None)
+        """
+        self._datasets: Dict[Path, Dataset] = {}
+        self._lock = threading.RLock()
+        self.snapshot_cache = snapshot_cache
+
+    def enable_snapshots(self, cache_dir: Union[str, Path, None] = None) -> None:
+        """
+        Load and save compiled snapshots from now on.
+
+        Args:
+            cache_dir: Directory to store snapshots in (see ``SnapshotCache``
+                for the default)
+        """
+        with self._lock:
+            self.snapshot_cache = SnapshotCache(cache_dir)
+
+    def disable_snapshots(self) -> None:
+        """Always parse the JSON files from now on."""
+        with self._lock:
+            self.snapshot_cache = None
+
+    def get(self, data_file: Union[str, Path], force_reload: bool = False) -> Dataset:
+        """
+        Get the parsed dataset for a data file, parsing it if needed.
+
+        Args:
+            data_file: Path to the JSON data file
+            force_reload: If True, parse the file again even if it is cached
+
+        Returns:
+            The shared dataset
+
+        Raises:
+            OSError: If the file can't be read
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        path = Path(data_file).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+
+        with self._lock:
+            dataset = self._datasets.get(path)
+            if dataset is not None and dataset.mtime_ns == mtime_ns and not force_reload:
+                return dataset
+
+            dataset = self._parse(path, mtime_ns, use_snapshot=not force_reload)
+            self._datasets[path] = dataset
+            return dataset
+
+    def stream(
+        self, data_file: Union[str, Path], index_fields: Iterable[str] = ()
+    ) -> Iterator[FrozenRecord]:
+        """
+        Yield a data file's records as they are parsed, loading it as a dataset.
+
+        Records are yielded as soon as they are parsed and indexed as they
+        arrive. If the stream is consumed to the end, the records and indexes
+        are registered as the file's dataset, so later ``get`` calls don't
+        parse it again. A cached dataset that is still current is streamed
+        from memory instead.
+
+        Args:
+            data_file: Path to the JSON data file
+            index_fields: Fields to index while parsing
+
+        Yields:
+            Each record, in file order
+
+        Raises:
+            OSError: If the file can't be read
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        path = Path(data_file).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+        dataset = self._datasets.get(path)
+        if dataset is not None and dataset.mtime_ns == mtime_ns:
+            yield from dataset.records
+            return
+
+        records = []
+        builder = IndexBuilder(index_fields)
+        for record in iter_json_array(path):
+            record = FrozenRecord(record)
+            records.append(record)
+            builder.add(record)
+            yield record
+
+        dataset = Dataset(path, mtime_ns, records)
+        dataset.indexes = builder.indexes
+        logger.info(f"Streamed {len(records)} records from {path}")
+        with self._lock:
+            current = self._datasets.get(path)
+            if current is None or current.mtime_ns != mtime_ns:
+                self._datasets[path] = dataset
+
+    def get_current(self, data_file: Union[str, Path]) -> Optional[Dataset]:
+        """
+        Get a cached dataset if it is still current, without parsing.
+
+        Args:
+            data_file: Path to the JSON data file
+
+        Returns:
+            The cached dataset, or None if it isn't cached or the file changed
+        """
+        path = Path(data_file).resolve()
+        dataset = self._datasets.get(path)
+        if dataset is None or dataset.mtime_ns != path.stat().st_mtime_ns:
+            return None
+        return dataset
+
+    def add_index(self, dataset: Dataset, field: str, index: Dict[Any, List[int]]) -> Dict[Any, List[int]]:
+        """
+        Store an index built over a dataset, unless another client stored one first.
+
+        Indexes are built outside the lock and stored under it, so snapshots
+        never see the dataset's indexes change mid-write.
+
+        Args:
+            dataset: The dataset the index was built over
+            field: The indexed field
+            index: The index
+
+        Returns:
+            The index stored for the field
+        """
+        with self._lock:
+            return dataset.indexes.setdefault(field, index)
+
+    def save_snapshot(self, dataset: Dataset) -> None:
+        """
+        Write a dataset's snapshot if it holds indexes the snapshot lacks.
+
+        Args:
+            dataset: The dataset to persist
+        """
+        if self.snapshot_cache is None:
+            return
+
+        with self._lock:
+            fields = frozenset(dataset.indexes)
+            if dataset.snapshot_fields is not None and fields <= dataset.snapshot_fields:
+                return
+            self.snapshot_cache.save(
+                dataset.path, dataset.mtime_ns, dataset.records, dataset.indexes
+            )
+            # Don't retry on every load if the cache directory isn't writable
+            dataset.snapshot_fields = fields
+
+    def _parse(self, path: Path, mtime_ns: int, use_snapshot: bool = True) -> Dataset:
+        """
+        Load a dataset from its snapshot, or parse the JSON data file.
+
+        Args:
+            path: Resolved path of the JSON file
+            mtime_ns: Modification time of the file
+            use_snapshot: If False, always parse the JSON file
+
+        Returns:
+            The loaded dataset
+        """
+        if use_snapshot and self.snapshot_cache is not None:
+            snapshot = self.snapshot_cache.load(path)
+            if snapshot is not None:
+                records, indexes = snapshot
+                dataset = Dataset(path, mtime_ns, records)
+                dataset.indexes = indexes
+                dataset.snapshot_fields = frozenset(indexes)
+                logger.info(f"Loaded {len(records)} records from snapshot of {path}")
+                return dataset
+
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        logger.info(f"Loaded {len(records)} records from {path}")
+        return Dataset(path, mtime_ns, records)
+
+    def invalidate(self, data_file: Union[str, Path]) -> None:
+        """
+        Drop a cached dataset so the next request parses it again.
+
+        Args:
+            data_file: Path to the JSON data file
+        """
+        with self._lock:
+            self._datasets.pop(Path(data_file).resolve(), None)
+
+    def clear(self) -> None:
+        """Drop all cached datasets."""
+        with self._lock:
+            self._datasets.clear()
+
+    def get_cached(self, data_file: Union[str, Path]) -> Optional[Dataset]:
+        """
+        Get a cached dataset without parsing or validating it.
+
+        Args:
+            data_file: Path to the JSON data file
+
+        Returns:
+            The cached dataset, or None if the file hasn't been loaded
+        """
+        return self._datasets.get(Path(data_file).resolve())
+
+    def memory_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the records, indexes and memory held by each cached dataset.
+
+        Returns:
+            Dictionary mapping dataset file names to their usage details
+        """
+        with self._lock:
+            datasets = list(self._datasets.values())
+
+        report = {}
+        for dataset in datasets:
+            report[str(dataset.path)] = {
+                "records": len(dataset.records),
+                "indexed_fields": sorted(dataset.indexes),
+                "bytes": dataset.memory_usage(),
+            }
+        return report
+
+
+def _deep_sizeof(obj: Any, seen: set) -> int:
+    """
+    Recursively sum the size of an object and everything it contains.
+
+    Args:
+        obj: The object to measure
+        seen: Ids of objects already counted
+
+    Returns:
+        Size in bytes
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+# Registry shared by every client in the process, set REVOMONAUTO_NO_SNAPSHOTS to
+# always parse the JSON files
+shared_registry = DatasetRegistry(
+    None if os.environ.get("REVOMONAUTO_NO_SNAPSHOTS") else SnapshotCache()
+)
@@ -0,0 +1,455 @@
+"""
+Weather and status effect tables, classified once per dataset
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+WEATHER_CONDITIONS = ("sunny", "rain", "sandstorm", "hail", "normal")
+
+STATUS_CONDITIONS = ("poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion", "flinch")
+
+# Types whose moves or Revomon benefit from each weather
+TYPE_WEATHER_BENEFITS: Dict[str, Tuple[str, ...]] = {
+    "sunny": ("fire", "forest"),      # Fire moves boosted, Water weakened
+    "rain": ("water", "electric"),    # Water moves boosted, Fire weakened
+    "sandstorm": ("stone", "earth"),  # Rock moves boosted
+    "hail": ("ice",),                 # Ice moves boosted
+}
+
+# Revomon fields naming the abilities a Revomon can have
+ABILITY_FIELDS = ("ability1", "ability2", "abilityh")
+
+# Classifiers take a record's lower-cased name and description and return
+# {effect: details} for every effect the record has
+Classifier = Callable[[str, str], Dict[str, Dict[str, Any]]]
+
+
+def ability_weather_generation(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the weather an ability summons.
+
+    Args:
+        name: Lower-cased ability name
+        description: Lower-cased ability description
+
+    Returns:
+        Dict mapping weather to {"duration", "conditions"}
+    """
+    effects = {}
+    if "drizzle" in name or "rain" in description:
+        effects["rain"] = {"duration": "indefinite", "conditions": ["summons rain when switched in"]}
+    if "drought" in name or "sun" in description:
+        effects["sunny"] = {"duration": "indefinite", "conditions": ["summons harsh sunlight when switched in"]}
+    if "sand stream" in name or "sandstorm" in description:
+        effects["sandstorm"] = {"duration": "indefinite", "conditions": ["summons sandstorm when switched in"]}
+    if "snow warning" in name or "hail" in description:
+        effects["hail"] = {"duration": "indefinite", "conditions": ["summons hail when switched in"]}
+    return effects
+
+
+def move_weather_generation(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the weather a move summons.
+
+    Args:
+        name: Lower-cased move name
+        description: Lower-cased move description
+
+    Returns:
+        Dict mapping weather to {"duration", "conditions"}
+    """
+    effects = {}
+    if "sunny day" in name:
+        effects["sunny"] = {"duration": "5 turns", "conditions": ["summons harsh sunlight"]}
+    if "rain dance" in name:
+        effects["rain"] = {"duration": "5 turns", "conditions": ["summons rain"]}
+    if "sandstorm" in name and "summons" in description:
+        effects["sandstorm"] = {"duration": "5 turns", "conditions": ["summons sandstorm"]}
+    if "hail" in name and "summons" in description:
+        effects["hail"] = {"duration": "5 turns", "conditions": ["summons hail"]}
+    return effects
+
+
+# Ability name keyword -> weather it benefits from
+_WEATHER_ABILITY_BENEFITS = (
+    ("chlorophyll", "sunny"),   # Speed boost in sun
+    ("solar power", "sunny"),   # Special attack boost in sun, HP drain
+    ("swift swim", "rain"),     # Speed boost in rain
+    ("rain dish", "rain"),      # HP recovery in rain
+    ("ice body", "hail"),       # HP recovery in hail
+    ("sand rush", "sandstorm"),  # Speed boost in sandstorm
+)
+
+# Move name keyword -> weather it benefits from
+_WEATHER_MOVE_BENEFITS = (
+    ("solar beam", "sunny"),  # Fires immediately in sun
+    ("thunder", "rain"),      # Accuracy increases in rain
+    ("blizzard", "hail"),     # Accuracy increases in hail
+)
+
+
+def ability_weather_benefits(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the weather an ability benefits from.
+
+    Args:
+        name: Lower-cased ability name
+        description: Lower-cased ability description
+
+    Returns:
+        Dict mapping weather to {}
+    """
+    return {weather: {} for keyword, weather in _WEATHER_ABILITY_BENEFITS if keyword in name}
+
+
+def move_weather_benefits(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the weather a move benefits from.
+
+    Args:
+        name: Lower-cased move name
+        description: Lower-cased move description
+
+    Returns:
+        Dict mapping weather to {}
+    """
+    # Weather Ball changes power and type with every weather
+    if "weather ball" in name:
+        return {weather: {} for weather in WEATHER_CONDITIONS}
+    return {weather: {} for keyword, weather in _WEATHER_MOVE_BENEFITS if keyword in name}
+
+
+def move_status_causes(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions a move causes.
+
+    Args:
+        name: Lower-cased move name
+        description: Lower-cased move description
+
+    Returns:
+        Dict mapping status to {"chance"}
+    """
+    effects = {}
+    if any(word in name for word in ("toxic", "poison", "smog", "acid")):
+        if "toxic" in name or "badly" in description:
+            effects["toxic"] = {"chance": 100}
+        else:
+            effects["poison"] = {"chance": 30}
+    if any(word in name for word in ("thunder", "stun", "glare", "nuzzle")):
+        effects["paralysis"] = {"chance": 30}
+    if any(word in name for word in ("sleep", "hypnosis", "sing", "spore")):
+        effects["sleep"] = {"chance": 100 if "spore" in name else 60}
+    if any(word in name for word in ("blizzard", "ice beam", "ice punch")):
+        effects["freeze"] = {"chance": 10}
+    if any(word in name for word in ("ember", "flamethrower", "fire punch", "will-o-wisp")):
+        effects["burn"] = {"chance": 100 if "will-o-wisp" in name else 10}
+    if any(word in name for word in ("confusion", "psybeam", "psychic", "confuse")):
+        effects["confusion"] = {"chance": 10}
+    return effects
+
+
+def ability_status_causes(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions an ability causes.
+
+    Args:
+        name: Lower-cased ability name
+        description: Lower-cased ability description
+
+    Returns:
+        Dict mapping status to {"trigger", "chance"}; Effect Spore's random
+        status is listed under "random" with the possible conditions
+    """
+    effects = {}
+    if "poison point" in name:
+        effects["poison"] = {"trigger": "contact", "chance": 30}
+    if "flame body" in name:
+        effects["burn"] = {"trigger": "contact", "chance": 30}
+    if "static" in name:
+        effects["paralysis"] = {"trigger": "contact", "chance": 30}
+    if "cute charm" in name:
+        # Gender-based
+        effects["infatuation"] = {"trigger": "contact", "chance": 30}
+    if "effect spore" in name:
+        effects["random"] = {"trigger": "contact", "chance": 10, "possible": ["poison", "paralysis", "sleep"]}
+    return effects
+
+
+# Status -> ability name keywords granting immunity to it
+_STATUS_IMMUNITY_ABILITIES = {
+    "poison": ("immunity", "poison heal"),
+    "toxic": ("immunity", "poison heal"),
+    "paralysis": ("limber",),
+    "sleep": ("insomnia", "vital spirit"),
+    "freeze": ("magma armor",),
+    "burn": ("water veil",),
+    "confusion": ("own tempo",),
+}
+
+
+def ability_status_immunities(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions an ability grants immunity to.
+
+    Args:
+        name: Lower-cased ability name
+        description: Lower-cased ability description
+
+    Returns:
+        Dict mapping status to {}
+    """
+    return {
+        status: {}
+        for status, keywords in _STATUS_IMMUNITY_ABILITIES.items()
+        if any(keyword in name for keyword in keywords)
+    }
+
+
+def ability_status_cures(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions an ability cures.
+
+    Hydration (in rain), Natural Cure (on switching out) and Shed Skin (each
+    turn, by chance) cure every condition.
+
+    Args:
+        name: Lower-cased ability name
+        description: Lower-cased ability description
+
+    Returns:
+        Dict mapping status to {}
+    """
+    if ("hydration" in name and "rain" in description) or "natural cure" in name or "shed skin" in name:
+        return {status: {} for status in STATUS_CONDITIONS}
+    return {}
+
+
+def item_status_cures(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions an item cures.
+
+    Args:
+        name: Lower-cased item name
+        description: Lower-cased item description
+
+    Returns:
+        Dict mapping status to {}
+    """
+    cured = []
+    if "antidote" in name or "poison" in description:
+        cured += ["poison", "toxic"]
+    if "burn" in name or "burn" in description:
+        cured.append("burn")
+    if "ice heal" in name or "freeze" in description:
+        cured.append("freeze")
+    if "awakening" in name or "sleep" in description:
+        cured.append("sleep")
+    if "paral" in name or "paralysis" in description:
+        cured.append("paralysis")
+    if "heal" in name or "cure" in description:
+        cured += ["poison", "toxic", "burn", "freeze", "sleep", "paralysis", "confusion"]
+    return {status: {} for status in cured}
+
+
+def move_status_cures(name: str, description: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Classify the status conditions a move cures.
+
+    Args:
+        name: Lower-cased move name
+        description: Lower-cased move description
+
+    Returns:
+        Dict mapping status to {}
+    """
+    if any(word in name for word in ("refresh", "heal bell", "aromatherapy", "purify")):
+        return {status: {} for status in ("poison", "toxic", "burn", "freeze", "sleep", "paralysis", "confusion")}
+    return {}
+
+
+# Table kind -> (classifier, names of the only records to classify, or None for all).
+# Restricted tables list their rows in the order of the names.
+EFFECT_TABLES: Dict[str, Tuple[Classifier, Optional[Tuple[str, ...]]]] = {
+    "ability_weather_generation": (ability_weather_generation, (
+        "drizzle", "drought", "sand stream", "snow warning",
+        "chlorophyll", "solar power", "rain dish", "ice body",
+        "sand rush", "sand veil", "swift swim", "hydration",
+    )),
+    "move_weather_generation": (move_weather_generation, (
+        "sunny day", "rain dance", "sandstorm", "hail",
+        "weather ball", "solar beam", "moonlight", "morning sun",
+        "synthesis", "thunder", "blizzard", "hydro pump",
+    )),
+    "ability_weather_benefits": (ability_weather_benefits, None),
+    "move_weather_benefits": (move_weather_benefits, None),
+    "move_status_causes": (move_status_causes, (
+        "toxic", "poison sting", "poison powder", "smog", "acid",
+        "thunder wave", "stun spore", "glare", "nuzzle",
+        "sleep powder", "hypnosis", "sing", "spore",
+        "blizzard", "ice beam", "ice punch", "powder snow",
+        "ember", "flamethrower", "fire punch", "will-o-wisp",
+        "confusion", "psybeam", "psychic", "confuse ray",
+        "bite", "headbutt", "stomp", "fake out", "rock slide",
+    )),
+    "ability_status_causes": (ability_status_causes, (
+        "poison point", "flame body", "static", "cute charm",
+        "effect spore", "synchronize", "trace", "stench",
+    )),
+    "ability_status_immunities": (ability_status_immunities, None),
+    "ability_status_cures": (ability_status_cures, None),
+    "item_status_cures": (item_status_cures, (
+        "antidote", "burn heal", "ice heal", "awakening", "paralyze heal",
+        "full heal", "full restore", "heal powder", "energy root",
+    )),
+    "move_status_cures": (move_status_cures, (
+        "refresh", "heal bell", "aromatherapy", "jungle healing",
+        "purify", "take heart", "sparkly swirl",
+    )),
+}
+
+
+class EffectTable:
+    """
+    The effects of a dataset's records, classified once.
+
+    ``rows`` maps each effect (a weather or status condition) to the
+    (position, details) pairs of the records having it, so "which records
+    cause X" is a dict lookup. ``join`` matches those rows against a team.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        classify: Classifier,
+        names: Optional[Iterable[str]] = None,
+    ):
+        """
+        Classify the records.
+
+        Args:
+            records: Records with "name" and "description" fields
+            classify: Classifier applied to each record
+            names: If given, only the first record with each of these names
+                is classified, in this order
+        """
+        if names is None:
+            positions: Iterable[int] = range(len(records))
+        else:
+            first: Dict[Any, int] = {}
+            for position, record in enumerate(records):
+                first.setdefault(record.get("name"), position)
+            positions = [first[name] for name in names if name in first]
+
+        self.rows: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for position in positions:
+            record = records[position]
+            effects = classify((record.get("name") or "").lower(), (record.get("description") or "").lower())
+            for effect, details in effects.items():
+                self.rows.setdefault(effect, []).append((position, details))
+
+    def get(self, effect: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Get the records with an effect.
+
+        Args:
+            effect: Weather or status condition
+
+        Returns:
+            List of (position, details) pairs
+        """
+        return self.rows.get(effect, [])
+
+    def join(
+        self,
+        records: Sequence[Dict[str, Any]],
+        team: Sequence[Dict[str, Any]],
+        effect: str,
+        fields: Sequence[str] = ABILITY_FIELDS,
+        first_only: bool = True,
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+        """
+        Match the records with an effect against a team.
+
+        A team member matches a record when one of its ``fields`` holds the
+        record's name.
+
+        Args:
+            records: The records the table was built from
+            team: Team of Revomon
+            effect: Weather or status condition
+            fields: Team member fields naming records
+            first_only: Keep only the first matching member of each record
+
+        Returns:
+            List of (member, record, details) triples in row order
+        """
+        members = team_members_by_value(team, fields)
+        joined = []
+        for position, details in self.get(effect):
+            record = records[position]
+            for member in members.get(record.get("name"), ()):
+                joined.append((member, record, details))
+                if first_only:
+                    break
+        return joined
+
+
+def team_members_by_value(
+    team: Sequence[Dict[str, Any]], fields: Sequence[str]
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Group team members by the values of some fields.
+
+    Args:
+        team: Team of Revomon
+        fields: Fields to group on
+
+    Returns:
+        Dict mapping each value to the members holding it, in team order
+    """
+    members: Dict[Any, List[Dict[str, Any]]] = {}
+    for member in team:
+        values = {member.get(field) for field in fields}
+        values.discard(None)
+        for value in values:
+            members.setdefault(value, []).append(member)
+    return members
+
+
+def build_effect_table(dataset, kind: str) -> EffectTable:
+    """
+    Build an effect table for a dataset.
+
+    Args:
+        dataset: The loaded dataset
+        kind: Key of ``EFFECT_TABLES``
+
+    Returns:
+        Table over the dataset's records
+    """
+    classify, names = EFFECT_TABLES[kind]
+    return EffectTable(dataset.records, classify, names)
+
+
+class EffectTablesMixin:
+    """
+    Adds weather and status effect tables to a data client.
+
+    Mixed into the clients whose records the tables classify (abilities,
+    moves and items) ahead of ``BaseDataClient``.
+    """
+
+    def get_effect_table(self, kind: str) -> EffectTable:
+        """
+        Get a weather or status effect table over this client's records, building it on first use.
+
+        Args:
+            kind: Table kind, a key of ``EFFECT_TABLES``
+
+        Returns:
+            The effect table
+        """
+        self.load_data()
+        if self._dataset is None:
+            return EffectTable(self._data, *EFFECT_TABLES[kind])
+        return self._dataset.derived(f"effect_table:{kind}", lambda dataset: build_effect_table(dataset, kind))
@@ -0,0 +1,127 @@
+"""
+Every evolution chain of revomon.json with its features stored as arrays
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .evolution_graph import EvolutionGraph
+from .revomon_columns import MISSING, RevomonColumns
+
+
+class EvolutionChains:
+    """
+    The forward evolution chain of every Revomon that can evolve.
+
+    Chains are enumerated once, in dataset order of their first member, and
+    their features (length, final form's stat total and type codes) are kept
+    in aligned arrays so any scoring is a single vectorized pass.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        graph: EvolutionGraph,
+        columns: RevomonColumns,
+    ):
+        """
+        Enumerate the chains.
+
+        Args:
+            records: revomon.json records
+            graph: Evolution graph over the records
+            columns: Columns over the records
+        """
+        self.columns = columns
+        self.chains: List[Tuple[int, ...]] = []
+        for position, record in enumerate(records):
+            if not record.get("evo"):
+                continue
+            # Follow the evolution forward, as RevomonClient.get_evolution_chain does
+            chain = [position]
+            seen = {position}
+            while graph.children[chain[-1]]:
+                child = graph.children[chain[-1]][0]
+                if child in seen:
+                    break
+                chain.append(child)
+                seen.add(child)
+            self.chains.append(tuple(chain))
+
+        finals = np.fromiter((chain[-1] for chain in self.chains), dtype=np.intp, count=len(self.chains))
+        self.lengths = np.fromiter((len(chain) for chain in self.chains), dtype=np.int64, count=len(self.chains))
+        self.final_stat_total = columns["stat_total"][finals]
+        self.final_type1 = columns["type1"][finals]
+        self.final_type2 = columns["type2"][finals]
+        for array in (self.lengths, self.final_stat_total, self.final_type1, self.final_type2):
+            array.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.chains)
+
+    def scores(
+        self,
+        target_stats: Optional[Dict[str, float]] = None,
+        target_types: Optional[Iterable[Optional[str]]] = None,
+    ) -> np.ndarray:
+        """
+        Score every chain against target criteria.
+
+        Same rules as scoring one chain at a time: up to 50 points for the
+        final form's stat total when target stats are given, 20 points per
+        final type in ``target_types``, 5 points per evolution, and 20 points
+        off when the final stat total is under 300.
+
+        Args:
+            target_stats: Target stat distribution
+            target_types: Target types
+
+        Returns:
+            Float array with one score per chain
+        """
+        totals = self.final_stat_total.astype(np.float64)
+        scores = np.zeros(len(self.chains))
+        if target_stats:
+            scores += np.minimum(totals / 10, 50)
+        if target_types:
+            target_types = list(target_types)
+            codes1 = [self.columns.code("type1", name) for name in target_types]
+            # A missing secondary type never matches
+            codes2 = [self.columns.code("type2", name) for name in target_types if name]
+            matches = np.isin(self.final_type1, [code for code in codes1 if code is not None]).astype(np.int64)
+            matches += np.isin(
+                self.final_type2, [code for code in codes2 if code is not None and code != MISSING]
+            )
+            scores += matches * 20
+        scores += (self.lengths - 1) * 5
+        scores[totals < 300] -= 20
+        return scores
+
+    def rank(
+        self,
+        target_stats: Optional[Dict[str, float]] = None,
+        target_types: Optional[Iterable[Optional[str]]] = None,
+        max_length: Optional[int] = None,
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank the chains with a positive score.
+
+        Args:
+            target_stats: Target stat distribution
+            target_types: Target types
+            max_length: Longest chain (in members) to consider
+            top_k: Number of chains to return, or None for all
+
+        Returns:
+            List of (chain index, score), best first; ties keep chain order
+        """
+        scores = self.scores(target_stats, target_types)
+        mask = scores > 0
+        if max_length is not None:
+            mask &= self.lengths <= max_length
+        candidates = np.flatnonzero(mask)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        if top_k is not None:
+            order = order[:max(top_k, 0)]
+        return [(int(index), float(scores[index])) for index in order]
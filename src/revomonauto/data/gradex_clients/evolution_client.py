@@ -34,8 +34,8 @@ class EvolutionClient:
     def __init__(self):
         """Initialize with Revomon data."""
         # Note: EvolutionClient doesn't inherit from BaseDataClient since it uses RevomonClient
-        self.revomon_client = RevomonClient()
-        self.natures_client = NaturesClient()
+        self.revomon_client = RevomonClient(read_only=True)
+        self.natures_client = NaturesClient(read_only=True)
 
         # Load all data
         self.revomon_client.load_data()
@@ -64,34 +64,23 @@ class EvolutionClient:
             "total_members": 1,
         }
 
-        # Build evolution tree using breadth-first search
-        to_process = [start_revomon]
-        processed = {start_dex_id}
-
-        while to_process:
-            current = to_process.pop(0)
-            current_id = current.get("dex_id")
-
-            # Find all Revomon that evolve FROM this one
-            children = self._find_evolution_children(current_id)
-
-            if children:
-                branch = {
-                    "parent": current.copy(),
-                    "children": children.copy(),
+        # Walk the precomputed descendants, which are already in breadth-first order
+        graph = self.revomon_client.get_evolution_graph()
+        records = self.revomon_client.get_all()
+        start = graph.position(start_dex_id)
+        for position in (start, *graph.descendants(start)):
+            if not graph.children[position]:
+                continue
+            children = [records[child].copy() for child in graph.children[position]]
+            tree["branches"].append(
+                {
+                    "parent": records[position].copy(),
+                    "children": children,
                     "branch_stats": self._calculate_branch_stats(children),
                 }
-
-                tree["branches"].append(branch)
-                tree["all_members"].extend(children)
-                tree["total_members"] += len(children)
-
-                # Add unprocessed children to queue
-                for child in children:
-                    child_id = child.get("dex_id")
-                    if child_id not in processed:
-                        to_process.append(child)
-                        processed.add(child_id)
+            )
+            tree["all_members"].extend(children)
+            tree["total_members"] += len(children)
 
         # Calculate tree statistics
         tree["tree_stats"] = self._calculate_tree_stats(tree["all_members"])
@@ -108,20 +97,7 @@ class EvolutionClient:
         Returns:
             List of child Revomon
         """
-        parent = self.revomon_client.get_revomon_by_id(parent_dex_id)
-        if not parent:
-            return []
-
-        children = []
-        parent_name = parent.get("name")
-
-        # Search through all Revomon to find those that evolve from this parent
-        for record in self.revomon_client.get_all():
-            # Check if this Revomon evolves from the parent
-            if record.get("evo") == parent_name:
-                children.append(record.copy())
-
-        return children
+        return self._related(parent_dex_id, "children")
 
     def _find_evolution_parents(self, child_dex_id: int) -> List[Dict[str, Any]]:
         """
@@ -133,19 +109,57 @@ class EvolutionClient:
         Returns:
             List of parent Revomon
         """
-        child = self.revomon_client.get_revomon_by_id(child_dex_id)
-        if not child:
-            return []
+        return self._related(child_dex_id, "parents")
 
-        parents = []
-        child_name = child.get("name")
+    def get_evolution_ancestors(self, dex_id: int) -> List[Dict[str, Any]]:
+        """
+        Get every Revomon that can evolve into a given Revomon.
 
-        # Search through all Revomon to find those that evolve TO this child
-        for record in self.revomon_client.get_all():
-            if record.get("evo") == child_name:
-                parents.append(record.copy())
+        Args:
+            dex_id: Revodex ID
+
+        Returns:
+            List of earlier forms, nearest first
+        """
+        return self._related(dex_id, "ancestors")
+
+    def get_evolution_descendants(self, dex_id: int) -> List[Dict[str, Any]]:
+        """
+        Get every Revomon a given Revomon can evolve into.
 
-        return parents
+        Args:
+            dex_id: Revodex ID
+
+        Returns:
+            List of later forms, nearest first
+        """
+        return self._related(dex_id, "descendants")
+
+    def _related(self, dex_id: int, relation: str) -> List[Dict[str, Any]]:
+        """
+        Get the Revomon related to one through the evolution graph.
+
+        Args:
+            dex_id: Revodex ID
+            relation: "children", "parents", "ancestors" or "descendants"
+
+        Returns:
+            List of Revomon copies, or an empty list if the ID is unknown
+        """
+        graph = self.revomon_client.get_evolution_graph()
+        position = graph.position(dex_id)
+        if position is None:
+            return []
+        if relation == "children":
+            positions = graph.children[position]
+        elif relation == "parents":
+            positions = graph.parents[position]
+        elif relation == "ancestors":
+            positions = graph.ancestors(position)
+        else:
+            positions = graph.descendants(position)
+        records = self.revomon_client.get_all()
+        return [records[related].copy() for related in positions]
 
     def get_evolution_path(
         self, start_dex_id: int, end_dex_id: int
@@ -160,33 +174,18 @@ class EvolutionClient:
         Returns:
             List of Revomon in evolution path, or None if no path exists
         """
-        # Use breadth-first search to find shortest path
-        start_revomon = self.revomon_client.get_revomon_by_id(start_dex_id)
-        end_revomon = self.revomon_client.get_revomon_by_id(end_dex_id)
-
-        if not start_revomon or not end_revomon:
+        graph = self.revomon_client.get_evolution_graph()
+        start = graph.position(start_dex_id)
+        end = graph.position(end_dex_id)
+        if start is None or end is None:
             return None
 
-        # BFS to find path
-        queue = [(start_revomon, [start_revomon])]
-        visited = {start_dex_id}
-
-        while queue:
-            current, path = queue.pop(0)
-
-            # Check if we reached the target
-            if current.get("dex_id") == end_dex_id:
-                return path
-
-            # Find children and add to queue
-            children = self._find_evolution_children(current.get("dex_id"))
-            for child in children:
-                child_id = child.get("dex_id")
-                if child_id not in visited:
-                    visited.add(child_id)
-                    queue.append((child, path + [child]))
-
-        return None  # No path found
+        # Shortest path by breadth-first search, skipped when end isn't a descendant
+        path = graph.path(start, end)
+        if path is None:
+            return None
+        records = self.revomon_client.get_all()
+        return [records[position].copy() for position in path]
 
     def analyze_evolution_efficiency(
         self, evolution_chain: List[Dict[str, Any]]
@@ -304,14 +303,19 @@ class EvolutionClient:
         target_stats: Dict[str, float] = None,
         target_types: List[str] = None,
         max_evolutions: int = 3,
+        top_k: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find evolution paths that lead to desired characteristics.
 
+        Every chain is scored in one vectorized pass over the cached chain
+        features; only the returned chains are copied and analyzed.
+
         Args:
             target_stats: Desired stat distribution (e.g., {"atk": 1.0, "spe": 0.8})
             target_types: Desired types
             max_evolutions: Maximum number of evolutions to consider
+            top_k: Number of paths to return, or None for all
 
         Returns:
             List of optimal evolution paths
@@ -319,31 +323,18 @@ class EvolutionClient:
         if not target_stats and not target_types:
             return []
 
+        chains = self.revomon_client.get_evolution_chains()
+        records = self.revomon_client.get_all()
         optimal_paths = []
-
-        # Get all Revomon as starting points
-        for start_revomon in self.revomon_client.get_all():
-            if start_revomon.get("evo"):  # Only consider Revomon that can evolve
-                # Get complete evolution chain
-                chain = self.revomon_client.get_evolution_chain(
-                    start_revomon.get("dex_id")
-                )
-                if len(chain) <= max_evolutions:
-                    # Score this evolution chain
-                    score = self._score_evolution_chain(
-                        chain, target_stats, target_types
-                    )
-                    if score > 0:
-                        optimal_paths.append(
-                            {
-                                "chain": chain,
-                                "score": score,
-                                "analysis": self.analyze_evolution_efficiency(chain),
-                            }
-                        )
-
-        # Sort by score (descending)
-        optimal_paths.sort(key=lambda x: x["score"], reverse=True)
+        for index, score in chains.rank(target_stats, target_types, max_evolutions, top_k):
+            chain = [records[position].copy() for position in chains.chains[index]]
+            optimal_paths.append(
+                {
+                    "chain": chain,
+                    "score": score,
+                    "analysis": self.analyze_evolution_efficiency(chain),
+                }
+            )
 
         return optimal_paths
 
@@ -369,10 +360,10 @@ class EvolutionClient:
 
         score = 0.0
         final_revomon = chain[-1]
+        final_stat_total = final_revomon.get("stat_total", 0)
 
         # Score based on target stats
         if target_stats:
-            final_stat_total = final_revomon.get("stat_total", 0)
             # Higher stat total gets higher score (up to a point)
             score += min(final_stat_total / 10, 50)  # Cap at 50 points
 
@@ -594,15 +585,11 @@ class EvolutionClient:
         Returns:
             Dict of evolution trees
         """
-        trees = {}
-
-        for revomon in self.revomon_client.get_all():
-            tree_name = revomon.get("evo_tree", "Unknown")
-            if tree_name not in trees:
-                trees[tree_name] = []
-            trees[tree_name].append(revomon.copy())
-
-        return trees
+        records = self.revomon_client.get_all()
+        return {
+            tree_name: [records[position].copy() for position in members]
+            for tree_name, members in self.revomon_client.get_evolution_graph().trees.items()
+        }
 
     def analyze_evolution_meta(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,163 @@
+"""
+Evolution DAG over revomon.json records with cached transitive closure
+"""
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class EvolutionGraph:
+    """
+    Parent/child adjacency between Revomon, built once per dataset.
+
+    Nodes are record positions. A record's ``evo`` field names the Revomon it
+    evolves into, which gives an edge from the record to that Revomon.
+    Traversals use a deque, and the descendants and ancestors of each node
+    are computed on first use and cached, so tree, path and ancestor queries
+    cost O(tree size).
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Build the graph.
+
+        Args:
+            records: revomon.json records
+        """
+        self.positions: Dict[Any, int] = {}
+        names: Dict[str, int] = {}
+        for position, record in enumerate(records):
+            self.positions.setdefault(record.get("dex_id"), position)
+            name = record.get("name")
+            if isinstance(name, str):
+                names.setdefault(name, position)
+
+        children: List[List[int]] = [[] for _ in records]
+        parents: List[List[int]] = [[] for _ in records]
+        for position, record in enumerate(records):
+            child = names.get(record.get("evo"))
+            if child is not None and child != position:
+                children[position].append(child)
+                parents[child].append(position)
+        self.children: List[Tuple[int, ...]] = [tuple(nodes) for nodes in children]
+        self.parents: List[Tuple[int, ...]] = [tuple(nodes) for nodes in parents]
+
+        # Members of each evo_tree, in dataset order
+        self.trees: Dict[Any, List[int]] = {}
+        for position, record in enumerate(records):
+            self.trees.setdefault(record.get("evo_tree", "Unknown"), []).append(position)
+
+        self._descendants: Dict[int, Tuple[int, ...]] = {}
+        self._ancestors: Dict[int, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.children)
+
+    def position(self, dex_id: Any) -> Optional[int]:
+        """
+        Get the node of a Revomon.
+
+        Args:
+            dex_id: Revodex ID
+
+        Returns:
+            Record position, or None if the ID is unknown
+        """
+        return self.positions.get(dex_id)
+
+    def descendants(self, position: int) -> Tuple[int, ...]:
+        """
+        Get every Revomon a node can evolve into.
+
+        Args:
+            position: Node
+
+        Returns:
+            Positions in breadth-first order, excluding the node itself
+        """
+        cached = self._descendants.get(position)
+        if cached is None:
+            cached = self._breadth_first(position, self.children)
+            self._descendants[position] = cached
+        return cached
+
+    def ancestors(self, position: int) -> Tuple[int, ...]:
+        """
+        Get every Revomon that can evolve into a node.
+
+        Args:
+            position: Node
+
+        Returns:
+            Positions nearest first, excluding the node itself
+        """
+        cached = self._ancestors.get(position)
+        if cached is None:
+            cached = self._breadth_first(position, self.parents)
+            self._ancestors[position] = cached
+        return cached
+
+    def path(self, start: int, end: int) -> Optional[List[int]]:
+        """
+        Find the shortest evolution path between two nodes.
+
+        Args:
+            start: First node
+            end: Last node
+
+        Returns:
+            Positions from start to end, or None if end isn't a descendant
+        """
+        if start == end:
+            return [start]
+        if end not in self.descendants(start):
+            return None
+        previous = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for child in self.children[node]:
+                if child in previous:
+                    continue
+                previous[child] = node
+                if child == end:
+                    path = [end]
+                    while previous[path[-1]] is not None:
+                        path.append(previous[path[-1]])
+                    return path[::-1]
+                queue.append(child)
+        return None
+
+    def _breadth_first(self, position: int, adjacency: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """
+        Get the nodes reachable from a node.
+
+        Args:
+            position: Starting node
+            adjacency: Neighbours of each node
+
+        Returns:
+            Reachable positions in breadth-first order, excluding the start
+        """
+        seen = {position}
+        order = []
+        queue = deque([position])
+        while queue:
+            for neighbour in adjacency[queue.popleft()]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    order.append(neighbour)
+                    queue.append(neighbour)
+        return tuple(order)
+
+
+def build_evolution_graph(dataset) -> EvolutionGraph:
+    """
+    Build the evolution graph for a revomon.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Graph over the dataset's records
+    """
+    return EvolutionGraph(dataset.records)
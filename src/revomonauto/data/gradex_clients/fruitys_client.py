@@ -18,8 +18,8 @@ class FruitysClient(BaseDataClient):
     - type: Fruity type (appears to be "held" for all)
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/fruitys.json")
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/fruitys.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "name"
@@ -43,16 +43,8 @@ class FruitysClient(BaseDataClient):
         Returns:
             List of damage-reducing fruitys
         """
-        self.load_data()
         damage_keywords = ["super-effective", "halve", "half damage", "reduce damage"]
-        matches = []
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in damage_keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break
-        return matches
+        return self.find_by_keywords(damage_keywords)
 
     def get_healing_fruitys(self) -> List[Dict[str, Any]]:
         """
@@ -61,16 +53,8 @@ class FruitysClient(BaseDataClient):
         Returns:
             List of healing fruitys
         """
-        self.load_data()
         heal_keywords = ["recover", "restore", "heal", "hp"]
-        matches = []
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in heal_keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break
-        return matches
+        return self.find_by_keywords(heal_keywords)
 
     def get_priority_fruitys(self) -> List[Dict[str, Any]]:
         """
@@ -79,16 +63,8 @@ class FruitysClient(BaseDataClient):
         Returns:
             List of priority-affecting fruitys
         """
-        self.load_data()
         priority_keywords = ["first", "priority", "go first"]
-        matches = []
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in priority_keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break
-        return matches
+        return self.find_by_keywords(priority_keywords)
 
     def get_fruitys_by_type_effect(self, type_name: str) -> List[Dict[str, Any]]:
         """
@@ -100,7 +76,4 @@ class FruitysClient(BaseDataClient):
         Returns:
             List of fruitys that respond to the specified type
         """
-        self.load_data()
-        type_name = type_name.lower()
-        return [record.copy() for record in self._data
-                if type_name in record.get("description", "").lower()]
+        return self.find_by_keywords([type_name])
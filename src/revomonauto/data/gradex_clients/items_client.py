@@ -3,12 +3,13 @@ Client for accessing Revomon items data
 """
 from typing import Dict, List, Optional, Any
 from .base_client import BaseDataClient
+from .effect_tables import EffectTablesMixin
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 
-class ItemsClient(BaseDataClient):
+class ItemsClient(EffectTablesMixin, BaseDataClient):
     """
     Client for accessing Revomon items data.
 
@@ -19,8 +20,10 @@ class ItemsClient(BaseDataClient):
     - cost: Item cost (null if not purchasable)
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/items.json")
+    indexed_fields = ("obtained_from",)
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/items.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "name"
@@ -45,7 +48,7 @@ class ItemsClient(BaseDataClient):
             List of purchasable items
         """
         self.load_data()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if record.get("cost") is not None]
 
     def get_free_items(self) -> List[Dict[str, Any]]:
@@ -56,7 +59,7 @@ class ItemsClient(BaseDataClient):
             List of free items
         """
         self.load_data()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if record.get("cost") is None]
 
     def get_items_by_source(self, source: str) -> List[Dict[str, Any]]:
@@ -83,7 +86,7 @@ class ItemsClient(BaseDataClient):
             List of items within the cost range
         """
         self.load_data()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if record.get("cost") is not None and
                 min_cost <= record.get("cost", 0) <= max_cost]
 
@@ -94,17 +97,9 @@ class ItemsClient(BaseDataClient):
         Returns:
             List of stat-boosting items
         """
-        self.load_data()
         stat_keywords = ["attack", "defense", "speed", "accuracy", "evasion",
                         "special attack", "special defense", "raises", "boost"]
-        matches = []
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in stat_keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break
-        return matches
+        return self.find_by_keywords(stat_keywords)
 
     def get_healing_items(self) -> List[Dict[str, Any]]:
         """
@@ -113,17 +108,9 @@ class ItemsClient(BaseDataClient):
         Returns:
             List of healing/curing items
         """
-        self.load_data()
         heal_keywords = ["heal", "cure", "restore", "recover", "burn", "poison",
                         "paralyze", "sleep", "freeze", "confusion"]
-        matches = []
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in heal_keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break
-        return matches
+        return self.find_by_keywords(heal_keywords)
 
     def get_battle_items(self) -> List[Dict[str, Any]]:
         """
@@ -155,15 +142,4 @@ class ItemsClient(BaseDataClient):
         Returns:
             List of matching items
         """
-        self.load_data()
-        matches = []
-        keywords = [kw.lower() for kw in keywords]
-
-        for record in self._data:
-            description = record.get("description", "").lower()
-            for keyword in keywords:
-                if keyword in description:
-                    matches.append(record.copy())
-                    break  # Don't add duplicates if multiple keywords match
-
-        return matches
+        return self.find_by_keywords(keywords)
@@ -0,0 +1,193 @@
+"""
+Compressed learnset index over revomon_moves.json
+"""
+from typing import Any, Dict, Hashable, Sequence, Tuple
+
+import numpy as np
+
+
+class _Grouping:
+    """
+    Record positions grouped by key in CSR layout.
+
+    ``positions[offsets[i]:offsets[i + 1]]`` holds the positions of every
+    record with the i-th key, in dataset order unless a sort key was given.
+    """
+
+    def __init__(self, keys: Sequence[Hashable], positions: np.ndarray, sort_by: np.ndarray = None):
+        """
+        Group positions by key.
+
+        Args:
+            keys: Group key of each position
+            positions: Record positions to group
+            sort_by: Optional values ordering positions within each group
+        """
+        self.slots: Dict[Hashable, int] = {}
+        key_slots = np.fromiter(
+            (self.slots.setdefault(key, len(self.slots)) for key in keys),
+            dtype=np.int64,
+            count=len(positions),
+        )
+        sort_keys = (positions, key_slots) if sort_by is None else (positions, sort_by, key_slots)
+        order = np.lexsort(sort_keys)
+        self.positions = positions[order]
+        self.values = None if sort_by is None else sort_by[order]
+        self.offsets = np.zeros(len(self.slots) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key_slots, minlength=len(self.slots)), out=self.offsets[1:])
+        for array in (self.positions, self.offsets) + (() if self.values is None else (self.values,)):
+            array.flags.writeable = False
+
+    def bounds(self, key: Hashable) -> Tuple[int, int]:
+        """
+        Get the slice of ``positions`` holding a key's records.
+
+        Args:
+            key: Group key
+
+        Returns:
+            Start and end offsets, equal if the key has no records
+        """
+        slot = self.slots.get(key)
+        if slot is None:
+            return 0, 0
+        return int(self.offsets[slot]), int(self.offsets[slot + 1])
+
+    def get(self, key: Hashable) -> np.ndarray:
+        """
+        Get the positions of a key's records.
+
+        Args:
+            key: Group key
+
+        Returns:
+            Record positions (empty if the key has no records)
+        """
+        start, end = self.bounds(key)
+        return self.positions[start:end]
+
+    def counts(self) -> Dict[Hashable, int]:
+        """
+        Count the records of every key.
+
+        Returns:
+            Dictionary mapping keys to record counts
+        """
+        sizes = np.diff(self.offsets).tolist()
+        return {key: sizes[slot] for key, slot in self.slots.items()}
+
+
+class LearnsetIndex:
+    """
+    Learnsets from revomon_moves.json, grouped for O(k) lookups.
+
+    Built once per dataset. Each grouping stores record positions in a
+    single array with per-key offsets, so a lookup is a dict probe and a
+    slice:
+
+    - by species (Revodex ID), in dataset order
+    - by move ID, in dataset order
+    - level-up moves by species, sorted by level
+    - all level-up moves, sorted by level
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            records: revomon_moves.json records, in dataset order
+        """
+        positions = np.arange(len(records), dtype=np.int64)
+        self.species = _Grouping([record.get("mon_dex_id") for record in records], positions)
+        self.moves = _Grouping([record.get("move_id") for record in records], positions)
+        self.methods = _Grouping([record.get("method") for record in records], positions)
+
+        self.move_ids: Dict[str, int] = {}
+        for record in records:
+            self.move_ids.setdefault(record.get("move_name"), record.get("move_id"))
+
+        levelup = self.methods.get("levelup")
+        levels = np.fromiter(
+            (records[position].get("level") or 0 for position in levelup.tolist()),
+            dtype=np.int64,
+            count=len(levelup),
+        )
+        self.levelup_by_species = _Grouping(
+            [records[position].get("mon_dex_id") for position in levelup.tolist()],
+            levelup,
+            sort_by=levels,
+        )
+        self.levelup_by_level = _Grouping([None] * len(levelup), levelup, sort_by=levels)
+
+    def species_positions(self, dex_id: int) -> np.ndarray:
+        """
+        Positions of every learnset row of a species.
+
+        Args:
+            dex_id: Revodex ID
+
+        Returns:
+            Record positions in dataset order
+        """
+        return self.species.get(dex_id)
+
+    def move_positions(self, move_id: int) -> np.ndarray:
+        """
+        Positions of every learnset row for a move.
+
+        Args:
+            move_id: Move ID
+
+        Returns:
+            Record positions in dataset order
+        """
+        return self.moves.get(move_id)
+
+    def levelup_schedule(self, dex_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Level-up moves of a species sorted by level.
+
+        Args:
+            dex_id: Revodex ID
+
+        Returns:
+            Tuple of (levels, record positions), aligned and sorted by level
+        """
+        start, end = self.levelup_by_species.bounds(dex_id)
+        grouping = self.levelup_by_species
+        return grouping.values[start:end], grouping.positions[start:end]
+
+    def levelup_positions_in_range(
+        self, dex_id: Any, min_level: int, max_level: int
+    ) -> np.ndarray:
+        """
+        Level-up rows of a species learned within an inclusive level range.
+
+        Args:
+            dex_id: Revodex ID, or None for every species
+            min_level: Lowest level
+            max_level: Highest level
+
+        Returns:
+            Record positions sorted by level
+        """
+        grouping = self.levelup_by_species if dex_id is not None else self.levelup_by_level
+        start, end = grouping.bounds(dex_id)
+        levels = grouping.values[start:end]
+        low = int(np.searchsorted(levels, min_level, side="left"))
+        high = int(np.searchsorted(levels, max_level, side="right"))
+        return grouping.positions[start + low:start + high]
+
+
+def build_learnset_index(dataset) -> LearnsetIndex:
+    """
+    Build the learnset index for a revomon_moves.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Index over the dataset's records
+    """
+    return LearnsetIndex(dataset.records)
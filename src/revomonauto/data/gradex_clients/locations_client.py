@@ -1,8 +1,9 @@
 """
 Client for accessing Revomon spawn location data
 """
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Union
 from .base_client import BaseDataClient
+from .spawn_index import SpawnIndex, build_spawn_index
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -16,32 +17,40 @@ class LocationsClient(BaseDataClient):
     providing specialized methods for location-based queries and analytics.
 
     Each Revomon can spawn in up to 3 locations with associated time periods and spawn rates.
+    Queries are served from a ``SpawnIndex`` built once per loaded dataset, which maps
+    locations to spawn entries and holds the parsed time windows in an interval index.
     """
 
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         # Use the same data source as RevomonClient since spawn data is embedded in Revomon records
-        super().__init__("src/revomonauto/data/gradex_jsons/revomon.json")
+        super().__init__("src/revomonauto/data/gradex_jsons/revomon.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "spawn_loc1"  # Not really a primary key, but required by base class
 
-    def get_all_spawn_locations(self) -> List[str]:
+    def get_spawn_index(self) -> SpawnIndex:
         """
-        Get all unique spawn locations across all Revomon.
+        Get the location and time-window index of spawn entries.
+
+        The index is built once per loaded dataset and shared by every
+        LocationsClient.
 
         Returns:
-            List of unique location names
+            The spawn index
         """
         self.load_data()
-        locations: Set[str] = set()
+        if self._dataset is None:
+            return SpawnIndex(self._data)
+        return self._dataset.derived("spawn_index", build_spawn_index)
 
-        for record in self._data:
-            for i in range(1, 4):  # spawn_loc1, spawn_loc2, spawn_loc3
-                loc = record.get(f"spawn_loc{i}")
-                if loc:
-                    locations.add(loc.lower())
+    def get_all_spawn_locations(self) -> List[str]:
+        """
+        Get all unique spawn locations across all Revomon.
 
-        return sorted(list(locations))
+        Returns:
+            List of unique location names
+        """
+        return sorted(self.get_spawn_index().by_location)
 
     def get_revomon_by_location(self, location: str) -> List[Dict[str, Any]]:
         """
@@ -53,24 +62,60 @@ class LocationsClient(BaseDataClient):
         Returns:
             List of Revomon that spawn in the specified location
         """
-        self.load_data()
-        location = location.lower()
-        matches = []
+        index = self.get_spawn_index()
+        # One entry per Revomon, from the first slot naming the location
+        return [self._spawn_info(entry_id) for entry_id in index.first_entries(location)]
 
-        for record in self._data:
-            # Check all spawn locations for this Revomon
-            for i in range(1, 4):
-                loc = record.get(f"spawn_loc{i}")
-                if loc and loc.lower() == location:
-                    # Get spawn details for this location
-                    spawn_info = record.copy()
-                    spawn_info["spawn_location"] = loc
-                    spawn_info["spawn_time"] = record.get(f"spawn_time{i}")
-                    spawn_info["spawn_rate"] = record.get("spawn_rate")
-                    matches.append(spawn_info)
-                    break  # Don't add the same Revomon multiple times
+    def get_spawns_at(self, location: str, time: Union[str, int]) -> List[Dict[str, Any]]:
+        """
+        Get the Revomon spawning at a location at a time of day.
+
+        Args:
+            location: The location name
+            time: Time of day as "H:MM", or minutes after midnight
+
+        Returns:
+            List of Revomon whose spawn window at the location covers the time,
+            with the same spawn fields as get_revomon_by_location
+
+        Raises:
+            ValueError: If the time can't be parsed
+        """
+        return [self._spawn_info(entry_id) for entry_id in self.get_spawn_index().active(time, location)]
 
-        return matches
+    def get_locations_at_time(self, time: Union[str, int]) -> List[str]:
+        """
+        Get the locations where something spawns at a time of day.
+
+        Args:
+            time: Time of day as "H:MM", or minutes after midnight
+
+        Returns:
+            Sorted list of lower-cased location names
+
+        Raises:
+            ValueError: If the time can't be parsed
+        """
+        index = self.get_spawn_index()
+        return sorted({index.entries[entry_id][2].lower() for entry_id in index.active(time)})
+
+    def _spawn_info(self, entry_id: int) -> Dict[str, Any]:
+        """
+        Copy a Revomon record with the spawn fields of one of its entries.
+
+        Args:
+            entry_id: Spawn index entry id
+
+        Returns:
+            The record with spawn_location, spawn_time and spawn_rate set
+        """
+        position, _, location, spawn_time = self.get_spawn_index().entries[entry_id]
+        record = self._data[position]
+        spawn_info = record.copy()
+        spawn_info["spawn_location"] = location
+        spawn_info["spawn_time"] = spawn_time
+        spawn_info["spawn_rate"] = record.get("spawn_rate")
+        return spawn_info
 
     def get_spawn_details(self, location: str) -> Dict[str, Any]:
         """
@@ -89,7 +134,8 @@ class LocationsClient(BaseDataClient):
 
         # Group by spawn time and rate
         time_slots = {}
-        spawn_rates = set()
+        # Dict keys keep the rates in first-seen order
+        spawn_rates = {}
 
         for revomon in revomon_in_location:
             time = revomon.get("spawn_time", "Unknown")
@@ -100,7 +146,7 @@ class LocationsClient(BaseDataClient):
             time_slots[time].append(revomon)
 
             if rate != "Unknown":
-                spawn_rates.add(rate)
+                spawn_rates[rate] = None
 
         return {
             "location": location,
@@ -122,18 +168,21 @@ class LocationsClient(BaseDataClient):
         Returns:
             List of locations with spawns during the specified time
         """
-        self.load_data()
+        index = self.get_spawn_index()
         time_period = time_period.lower()
-        locations: Set[str] = set()
+        positions: Set[int] = set()
+        # Match against the few distinct time strings rather than every record
+        for spawn_time, time_positions in index.by_time.items():
+            if time_period in spawn_time.lower():
+                positions.update(time_positions)
 
-        for record in self._data:
+        locations: Set[str] = set()
+        for position in positions:
+            record = self._data[position]
             for i in range(1, 4):
-                spawn_time = record.get(f"spawn_time{i}")
-                if spawn_time and time_period in spawn_time.lower():
-                    for j in range(1, 4):
-                        loc = record.get(f"spawn_loc{j}")
-                        if loc:
-                            locations.add(loc)
+                loc = record.get(f"spawn_loc{i}")
+                if loc:
+                    locations.add(loc)
 
         return sorted(list(locations))
 
@@ -147,20 +196,16 @@ class LocationsClient(BaseDataClient):
         Returns:
             Dictionary mapping time periods to lists of Revomon names
         """
-        self.load_data()
-        location = location.lower()
+        index = self.get_spawn_index()
         time_revomon = {}
 
-        for record in self._data:
-            for i in range(1, 4):
-                loc = record.get(f"spawn_loc{i}")
-                if loc and loc.lower() == location:
-                    spawn_time = record.get(f"spawn_time{i}", "Unknown")
-                    revomon_name = record.get("name", "Unknown")
+        for entry_id in index.by_location.get(location.lower(), ()):
+            position, _, _, spawn_time = index.entries[entry_id]
+            revomon_name = self._data[position].get("name", "Unknown")
 
-                    if spawn_time not in time_revomon:
-                        time_revomon[spawn_time] = []
-                    time_revomon[spawn_time].append(revomon_name)
+            if spawn_time not in time_revomon:
+                time_revomon[spawn_time] = []
+            time_revomon[spawn_time].append(revomon_name)
 
         # Remove duplicates and sort
         for time_period in time_revomon:
@@ -175,14 +220,7 @@ class LocationsClient(BaseDataClient):
         Returns:
             Dictionary mapping time periods to count of Revomon
         """
-        self.load_data()
-        time_counts = {}
-
-        for record in self._data:
-            for i in range(1, 4):
-                spawn_time = record.get(f"spawn_time{i}")
-                if spawn_time:
-                    time_counts[spawn_time] = time_counts.get(spawn_time, 0) + 1
+        time_counts = self.get_spawn_index().time_counts
 
         # Sort by frequency (most common first)
         return dict(sorted(time_counts.items(), key=lambda x: x[1], reverse=True))
@@ -194,16 +232,29 @@ class LocationsClient(BaseDataClient):
         Returns:
             Dictionary with location analytics
         """
+        index = self.get_spawn_index()
         all_locations = self.get_all_spawn_locations()
         location_stats = {}
 
+        # Same figures as get_spawn_details, read from the index without copying records
         for location in all_locations:
-            details = self.get_spawn_details(location)
+            entries = index.first_entries(location)
+            spawn_times = {}
+            spawn_rates = {}
+            names = set()
+            for entry_id in entries:
+                position, _, _, spawn_time = index.entries[entry_id]
+                record = self._data[position]
+                spawn_times[spawn_time] = None
+                rate = record.get("spawn_rate")
+                if rate != "Unknown":
+                    spawn_rates[rate] = None
+                names.add(record["name"])
             location_stats[location] = {
-                "total_revomon": details["revomon_count"],
-                "unique_revomon": details["unique_revomon"],
-                "spawn_times": details["spawn_times"],
-                "spawn_rates": details["spawn_rates"]
+                "total_revomon": len(entries),
+                "unique_revomon": len(names),
+                "spawn_times": list(spawn_times),
+                "spawn_rates": list(spawn_rates)
             }
 
         # Calculate summary statistics
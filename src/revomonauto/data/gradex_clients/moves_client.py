@@ -3,12 +3,15 @@ Client for accessing Revomon moves data
 """
 from typing import Dict, List, Optional, Any
 from .base_client import BaseDataClient
+from .effect_tables import EffectTablesMixin
+from .name_resolver import NameResolverMixin
+from .query import Field
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 
-class MovesClient(BaseDataClient):
+class MovesClient(EffectTablesMixin, NameResolverMixin, BaseDataClient):
     """
     Client for accessing Revomon moves data.
 
@@ -24,8 +27,11 @@ class MovesClient(BaseDataClient):
     - priority: Move priority in battle
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/moves.json")
+    indexed_fields = ("name", "type", "category")
+    sorted_index_fields = ("power", "accuracy", "pp", "priority")
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/moves.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "id"
@@ -116,9 +122,7 @@ class MovesClient(BaseDataClient):
         Returns:
             List of moves within the power range
         """
-        self.load_data()
-        return [record.copy() for record in self._data
-                if min_power <= record.get("power", 0) <= max_power]
+        return self.query().where(Field("power").between(min_power, max_power)).all()
 
     def get_high_power_moves(self, min_power: int = 100) -> List[Dict[str, Any]]:
         """
@@ -142,9 +146,7 @@ class MovesClient(BaseDataClient):
         Returns:
             List of moves with low PP
         """
-        self.load_data()
-        return [record.copy() for record in self._data
-                if record.get("pp", 999) <= max_pp]
+        return self.query().where(Field("pp") <= max_pp).all()
 
     def get_priority_moves(self, priority: int = 1) -> List[Dict[str, Any]]:
         """
@@ -165,9 +167,7 @@ class MovesClient(BaseDataClient):
         Returns:
             List of priority moves
         """
-        self.load_data()
-        return [record.copy() for record in self._data
-                if record.get("priority", 0) > 0]
+        return self.query().where(Field("priority") > 0).all()
 
     def get_last_resort_moves(self) -> List[Dict[str, Any]]:
         """
@@ -176,9 +176,7 @@ class MovesClient(BaseDataClient):
         Returns:
             List of moves with negative priority
         """
-        self.load_data()
-        return [record.copy() for record in self._data
-                if record.get("priority", 0) < 0]
+        return self.query().where(Field("priority") < 0).all()
 
     def get_inaccurate_moves(self, max_accuracy: float = 0.8) -> List[Dict[str, Any]]:
         """
@@ -190,9 +188,7 @@ class MovesClient(BaseDataClient):
         Returns:
             List of moves with low accuracy
         """
-        self.load_data()
-        return [record.copy() for record in self._data
-                if record.get("accuracy", 1.0) <= max_accuracy]
+        return self.query().where(Field("accuracy") <= max_accuracy).all()
 
     def get_always_hit_moves(self) -> List[Dict[str, Any]]:
         """
@@ -228,7 +224,4 @@ class MovesClient(BaseDataClient):
         Returns:
             List of moves containing the keyword
         """
-        self.load_data()
-        keyword = keyword.lower()
-        return [record.copy() for record in self._data
-                if keyword in record.get("description", "").lower()]
+        return self.find_by_keywords([keyword])
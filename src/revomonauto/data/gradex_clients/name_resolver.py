@@ -0,0 +1,254 @@
+"""
+Fuzzy matching of noisy text (e.g. OCR output) against a closed set of names
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Characters OCR commonly reads in place of letters; names are compared after folding
+_OCR_FOLD = str.maketrans({"0": "o", "1": "l", "|": "l", "5": "s", "8": "b", "$": "s", "@": "a"})
+
+# Anything other than letters, digits, spaces and hyphens is noise
+_NOISE = re.compile(r"[^a-z0-9 \-]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for comparison.
+
+    Lower-cases, folds common OCR confusions, drops stray punctuation and
+    collapses whitespace.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        The normalized text
+    """
+    text = text.lower().translate(_OCR_FOLD)
+    return _SPACES.sub(" ", _NOISE.sub("", text)).strip()
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between two strings.
+
+    Args:
+        a: First string
+        b: Second string
+        limit: If given, stop early once the distance is known to exceed it
+
+    Returns:
+        The distance, or ``limit + 1`` if it exceeds ``limit``
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def trigrams(key: str) -> Set[str]:
+    """
+    Get the distinct trigrams of a padded string.
+
+    Args:
+        key: Normalized text
+
+    Returns:
+        Set of three-character substrings of the text padded with spaces
+    """
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+    """
+    Resolves noisy text to the closest of a fixed set of names.
+
+    Names are normalized once and indexed by trigram. One edit changes at
+    most three trigrams, so the trigrams a query shares with a name give a
+    lower bound on their edit distance; names are verified in order of that
+    bound with an edit distance that stops as soon as it can't beat the best
+    match so far, and the search ends once no remaining bound can. Exact
+    matches after normalization are answered from a dict.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Build the resolver.
+
+        Args:
+            names: Canonical names; the first of any that normalize alike wins
+        """
+        self._canonical: Dict[str, str] = {}
+        for name in names:
+            if isinstance(name, str):
+                self._canonical.setdefault(normalize(name), name)
+        self._keys: List[str] = list(self._canonical)
+        self._gram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, key in enumerate(self._keys):
+            grams = trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def candidates(self, text: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find every name within an edit distance of some text.
+
+        Args:
+            text: Raw text
+            max_distance: Largest edit distance to accept
+
+        Returns:
+            List of (name, distance) pairs, closest first (ties in the order
+            the names were given)
+        """
+        key = normalize(text)
+        found = []
+        for _, position in self._bounded(key, max_distance):
+            distance = edit_distance(key, self._keys[position], max_distance)
+            if distance <= max_distance:
+                found.append((distance, position))
+        found.sort()
+        return [(self._canonical[self._keys[position]], distance) for distance, position in found]
+
+    def resolve(
+        self, text: Optional[str], max_distance: Optional[int] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Resolve text to the closest name.
+
+        Args:
+            text: Raw text
+            max_distance: Largest edit distance to accept (defaults to a third
+                of the normalized text's length, at least 1)
+
+        Returns:
+            Tuple of (name, confidence) where confidence is 1.0 for an exact
+            match and falls with the edit distance relative to the longer
+            string, or None if no name is close enough. Ties go to the name
+            given first.
+        """
+        if not text:
+            return None
+        key = normalize(text)
+        if not key:
+            return None
+        name = self._canonical.get(key)
+        if name is not None:
+            return name, 1.0
+        if max_distance is None:
+            max_distance = max(1, len(key) // 3)
+
+        best: Optional[Tuple[int, int]] = None
+        for bound, position in self._bounded(key, max_distance):
+            if best is not None and bound > best[0]:
+                break
+            limit = max_distance if best is None else best[0]
+            distance = edit_distance(key, self._keys[position], limit)
+            if distance <= limit and (best is None or (distance, position) < best):
+                best = (distance, position)
+        if best is None:
+            return None
+        distance, position = best
+        match = self._keys[position]
+        return self._canonical[match], 1.0 - distance / max(len(key), len(match))
+
+    def _bounded(self, key: str, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        Get the names whose distance lower bound is within a limit.
+
+        Args:
+            key: Normalized query text
+            max_distance: Largest edit distance to accept
+
+        Returns:
+            List of (lower bound, position) pairs, smallest bound first
+        """
+        grams = trigrams(key)
+        shared = [0] * len(self._keys)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+        length = len(key)
+        result = []
+        for position, (count, common) in enumerate(zip(self._gram_counts, shared)):
+            # An edit removes at most three distinct trigrams from either side
+            bound = max(
+                -(-(max(count, len(grams)) - common) // 3),
+                abs(len(self._keys[position]) - length),
+            )
+            if bound <= max_distance:
+                result.append((bound, position))
+        result.sort()
+        return result
+
+
+class NameResolverMixin:
+    """
+    Adds fuzzy name resolution to a data client.
+
+    Mixed into the clients whose names are read from the screen (Revomon and
+    moves) ahead of ``BaseDataClient``.
+    """
+
+    def get_name_resolver(self, field: str = "name") -> NameResolver:
+        """
+        Get the fuzzy resolver over the values of a name field, building it on first use.
+
+        Args:
+            field: Field holding the names
+
+        Returns:
+            The name resolver
+        """
+        self.load_data()
+        if self._dataset is None:
+            return NameResolver(record.get(field) for record in self._data)
+        return self._dataset.derived(
+            f"name_resolver:{field}",
+            lambda dataset: NameResolver(record.get(field) for record in dataset.records),
+        )
+
+    def resolve_name(
+        self,
+        text: Optional[str],
+        field: str = "name",
+        min_confidence: float = 0.0,
+        max_distance: Optional[int] = None,
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Resolve noisy text (e.g. OCR output) to the record with the closest name.
+
+        Args:
+            text: Raw text
+            field: Field holding the names
+            min_confidence: Smallest confidence to accept, from 0.0 to 1.0
+            max_distance: Largest edit distance to accept (see ``NameResolver.resolve``)
+
+        Returns:
+            Tuple of (record, confidence), or None if no name is close enough
+        """
+        match = self.get_name_resolver(field).resolve(text, max_distance)
+        if match is None or match[1] < min_confidence:
+            return None
+        name, confidence = match
+        return self.find_first_by_field(field, name), confidence
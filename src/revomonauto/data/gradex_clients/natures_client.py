@@ -20,8 +20,10 @@ class NaturesClient(BaseDataClient):
     - dislikes: Flavor disliked by Revomon with this nature
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/natures.json")
+    indexed_fields = ("buffs", "debuffs")
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/natures.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "name"
@@ -46,7 +48,7 @@ class NaturesClient(BaseDataClient):
             List of natures with stat buffs
         """
         self.load_data()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if record.get("buffs") is not None]
 
     def get_neutral_natures(self) -> List[Dict[str, Any]]:
@@ -57,7 +59,7 @@ class NaturesClient(BaseDataClient):
             List of neutral natures
         """
         self.load_data()
-        return [record.copy() for record in self._data
+        return [self._emit(record) for record in self._data
                 if record.get("buffs") is None and record.get("debuffs") is None]
 
     def get_natures_by_buffed_stat(self, stat: str) -> List[Dict[str, Any]]:
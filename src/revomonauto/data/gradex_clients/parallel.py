@@ -0,0 +1,318 @@
+"""
+Process-pool execution for bulk analytics over the Revomon datasets
+"""
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+import numpy as np
+
+from .dataset_registry import shared_registry
+from .snapshot_cache import SnapshotCache
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+# Data files workers load on start-up, relative to the repository root like every client's
+DATA_FILES: Tuple[str, ...] = tuple(
+    f"src/revomonauto/data/gradex_jsons/{name}.json"
+    for name in ("revomon", "moves", "types", "revomon_moves", "abilities", "counterdex")
+)
+
+# Wall time a chunk of work should take: long enough to amortize sending it
+# to a worker, short enough to keep every worker busy until the end
+TARGET_CHUNK_SECONDS = 0.05
+
+# Chunks per worker the tuner aims for at least, so uneven items balance out
+MIN_CHUNKS_PER_WORKER = 4
+
+# Time spent running items in the calling process to measure their cost
+PROBE_SECONDS = 0.01
+
+# Objects task functions reuse across the tasks a process runs, by class
+_process_instances: Dict[type, Any] = {}
+
+
+def auto_chunk_size(
+    item_seconds: float,
+    items: int,
+    workers: int,
+    target_seconds: float = TARGET_CHUNK_SECONDS,
+) -> int:
+    """
+    Pick how many items to send to a worker at once.
+
+    Args:
+        item_seconds: Measured time of one item
+        items: Items left to run
+        workers: Worker processes
+        target_seconds: Wall time a chunk should take
+
+    Returns:
+        Chunk size of at least 1
+    """
+    by_time = target_seconds / item_seconds if item_seconds > 0 else items
+    by_balance = math.ceil(items / (workers * MIN_CHUNKS_PER_WORKER)) if workers else items
+    return max(1, min(int(by_time), by_balance))
+
+
+def item_seeds(seed: Union[int, np.random.SeedSequence, None], count: int) -> List[np.random.SeedSequence]:
+    """
+    Give every item its own independent random stream.
+
+    Seeds are spawned per item rather than per chunk or worker, so results
+    don't depend on how the work was split.
+
+    Args:
+        seed: Root seed or SeedSequence (fresh entropy if None)
+        count: Number of items
+
+    Returns:
+        One SeedSequence per item
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(count)
+
+
+def process_instance(cls: Type[T]) -> T:
+    """
+    Get this process's instance of a class, creating it on first use.
+
+    Task functions use it to keep clients, and whatever the clients cache,
+    across the tasks a worker runs.
+
+    Args:
+        cls: Class constructible without arguments
+
+    Returns:
+        The instance
+    """
+    instance = _process_instances.get(cls)
+    if instance is None:
+        instance = _process_instances[cls] = cls()
+    return instance
+
+
+def load_worker_datasets(data_files: Sequence[str], cache_dir: Union[str, Path]) -> None:
+    """
+    Load datasets into this process's registry from compiled snapshots.
+
+    The parent compiles every data file into ``cache_dir`` before starting
+    the pool, so a worker unpickles the records and indexes instead of
+    parsing JSON. Forked workers already hold the parent's datasets and only
+    check they are current. The worker keeps using ``cache_dir`` as its
+    snapshot cache.
+
+    Args:
+        data_files: Data files to load
+        cache_dir: Snapshot directory the parent compiled the data files into
+    """
+    shared_registry.snapshot_cache = SnapshotCache(cache_dir)
+    for data_file in data_files:
+        if Path(data_file).exists():
+            shared_registry.get(data_file)
+
+
+def _slice(
+    seeds: Optional[List[np.random.SeedSequence]], start: int, stop: int
+) -> Optional[List[np.random.SeedSequence]]:
+    """
+    Get the seeds of a range of items.
+
+    Args:
+        seeds: Per-item seeds, or None when unseeded
+        start: First item
+        stop: Item after the last
+
+    Returns:
+        The seeds of the range, or None when unseeded
+    """
+    return None if seeds is None else seeds[start:stop]
+
+
+def _run_chunk(
+    func: Callable[..., Any],
+    items: Sequence[Any],
+    seeds: Optional[Sequence[np.random.SeedSequence]],
+) -> List[Any]:
+    """
+    Run a function over a chunk of items.
+
+    Args:
+        func: Function of an item, or of an item and a Generator when seeded
+        items: The items
+        seeds: One SeedSequence per item, or None for unseeded functions
+
+    Returns:
+        Results in item order
+    """
+    if seeds is None:
+        return [func(item) for item in items]
+    return [func(item, np.random.default_rng(seed)) for item, seed in zip(items, seeds)]
+
+
+class ParallelRunner:
+    """
+    Shards bulk work across a pool of worker processes.
+
+    Before starting the pool the runner compiles every data file into the
+    registry's snapshot cache, or into a temporary directory it owns when
+    snapshots are disabled, and each worker loads those snapshots once at
+    start-up instead of parsing JSON, so tasks only carry their items. ``map`` preserves
+    input order and, when seeded, gives each item its own random stream, so
+    results are identical for any number of workers or chunk size.
+
+    The pool is started on first use and shut down by ``close`` or on leaving
+    a ``with`` block. Functions and items must be picklable, so functions
+    have to be defined at module level.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        data_files: Sequence[str] = DATA_FILES,
+        start_method: Optional[str] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Worker processes (defaults to the CPU count); 1 runs
+                everything in the calling process
+            data_files: Data files workers load on start-up
+            start_method: multiprocessing start method for the workers
+                ("fork", "spawn" or "forkserver"; defaults to the platform's)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.data_files = tuple(data_files)
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._snapshot_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "ParallelRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes and remove the runner's snapshots."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._snapshot_dir is not None:
+            self._snapshot_dir.cleanup()
+            self._snapshot_dir = None
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        items: Sequence[Any],
+        chunk_size: Optional[int] = None,
+        seed: Union[int, np.random.SeedSequence, None] = None,
+        seeded: bool = False
+    ) -> List[Any]:
+        """
+        Apply a function to every item in parallel.
+
+        Without a ``chunk_size``, items are run in this process until
+        ``PROBE_SECONDS`` have passed to measure their cost, and the rest
+        are split with ``auto_chunk_size``. Cheap workloads never leave this
+        process.
+
+        Args:
+            func: Module-level function of an item, or of an item and a
+                ``numpy.random.Generator`` when seeded
+            items: Items to process
+            chunk_size: Items per task sent to a worker (tuned if None)
+            seed: Root seed; passing one implies ``seeded``
+            seeded: Call ``func`` with a per-item Generator
+
+        Returns:
+            Results in item order
+        """
+        items = list(items)
+        seeds = item_seeds(seed, len(items)) if seeded or seed is not None else None
+
+        results: List[Any] = []
+        done = 0
+        if chunk_size is None:
+            start = time.perf_counter()
+            while done < len(items) and (done == 0 or time.perf_counter() - start < PROBE_SECONDS):
+                results.extend(_run_chunk(func, items[done:done + 1], _slice(seeds, done, done + 1)))
+                done += 1
+            item_seconds = (time.perf_counter() - start) / max(done, 1)
+            chunk_size = auto_chunk_size(item_seconds, len(items) - done, self.max_workers)
+            # Not worth a round trip to a worker
+            if (len(items) - done) * item_seconds < TARGET_CHUNK_SECONDS:
+                chunk_size = len(items)
+
+        remaining = len(items) - done
+        if not remaining:
+            return results
+        if self.max_workers <= 1 or chunk_size >= remaining:
+            results.extend(_run_chunk(func, items[done:], _slice(seeds, done, len(items))))
+            return results
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _run_chunk, func, items[start:start + chunk_size], _slice(seeds, start, start + chunk_size)
+            )
+            for start in range(done, len(items), chunk_size)
+        ]
+        logger.debug(f"Sent {remaining} items to {self.max_workers} workers in {len(futures)} chunks of {chunk_size}")
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Get the worker pool, starting it on first use.
+
+        Returns:
+            The executor
+        """
+        if self._executor is None:
+            cache_dir = self._compile_snapshots()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=load_worker_datasets,
+                initargs=(self.data_files, cache_dir),
+            )
+        return self._executor
+
+    def _compile_snapshots(self) -> Path:
+        """
+        Write snapshots of the data files for the workers to load.
+
+        Uses the registry's snapshot cache when one is configured, otherwise
+        a temporary directory removed by ``close``.
+
+        Returns:
+            The snapshot directory
+        """
+        cache = shared_registry.snapshot_cache
+        if cache is None:
+            if self._snapshot_dir is None:
+                self._snapshot_dir = tempfile.TemporaryDirectory(prefix="revomonauto-snapshots-")
+            cache = SnapshotCache(self._snapshot_dir.name)
+
+        for data_file in self.data_files:
+            if not Path(data_file).exists():
+                continue
+            dataset = shared_registry.get(data_file)
+            if cache is shared_registry.snapshot_cache and cache.snapshot_path(dataset.path).exists():
+                # Rewrite it only if the dataset has gained indexes since
+                shared_registry.save_snapshot(dataset)
+            elif not cache.save(dataset.path, dataset.mtime_ns, dataset.records, dataset.indexes):
+                logger.warning(f"Could not compile a snapshot of {data_file}, workers will parse it")
+        return cache.cache_dir
@@ -0,0 +1,624 @@
+"""
+Composable queries over data client records
+"""
+import heapq
+import operator
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .streaming import project
+
+if TYPE_CHECKING:
+    from .base_client import BaseDataClient
+
+Matcher = Callable[[Dict[str, Any]], bool]
+
+
+class Predicate(ABC):
+    """
+    A condition on a record.
+
+    Predicates combine with ``&`` (and), ``|`` (or) and ``~`` (not), and can
+    be called with a record to test it.
+    """
+
+    @abstractmethod
+    def compile(self) -> Matcher:
+        """
+        Build a function that tests a record against this predicate.
+
+        Returns:
+            Function taking a record and returning True if it matches
+        """
+        pass
+
+    def conjuncts(self) -> List["Predicate"]:
+        """
+        Split the predicate into conditions that must all hold.
+
+        Returns:
+            List of predicates whose conjunction is this predicate
+        """
+        return [self]
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        return self.compile()(record)
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return And(self.conjuncts() + other.conjuncts())
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Or([self, other])
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+class Comparison(Predicate):
+    """
+    Compare one field of a record with a value.
+
+    Ordering comparisons never match a missing field, None, or a value of
+    an incomparable type.
+    """
+
+    _OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    def __init__(self, field: str, op: str, value: Any):
+        """
+        Initialize the comparison.
+
+        Args:
+            field: Field to compare
+            op: One of ==, !=, <, <=, >, >=, between, in, contains
+            value: Value to compare against (a (low, high) tuple for between,
+                a collection for in, a string for contains)
+        """
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def compile(self) -> Matcher:
+        field, op, value = self.field, self.op, self.value
+
+        if op == "==":
+            return lambda record: record.get(field) == value
+        if op == "!=":
+            return lambda record: record.get(field) != value
+        if op == "in":
+            values = _as_container(value)
+            return lambda record: _safe_in(record.get(field), values)
+        if op == "contains":
+            needle = value.lower()
+            return lambda record: needle in str(record.get(field) or "").lower()
+        if op == "between":
+            low, high = value
+
+            def matches(record: Dict[str, Any]) -> bool:
+                found = record.get(field)
+                try:
+                    return found is not None and low <= found <= high
+                except TypeError:
+                    return False
+
+            return matches
+
+        compare = self._OPERATORS[op]
+
+        def matches(record: Dict[str, Any]) -> bool:
+            found = record.get(field)
+            try:
+                return found is not None and compare(found, value)
+            except TypeError:
+                return False
+
+        return matches
+
+    def __repr__(self) -> str:
+        return f"Field({self.field!r}) {self.op} {self.value!r}"
+
+
+class And(Predicate):
+    """All of several predicates."""
+
+    def __init__(self, predicates: Sequence[Predicate]):
+        self.predicates = list(predicates)
+
+    def compile(self) -> Matcher:
+        matchers = [predicate.compile() for predicate in self.predicates]
+        if len(matchers) == 1:
+            return matchers[0]
+        return lambda record: all(matches(record) for matches in matchers)
+
+    def conjuncts(self) -> List[Predicate]:
+        return list(self.predicates)
+
+    def __repr__(self) -> str:
+        return "(" + " & ".join(map(repr, self.predicates)) + ")"
+
+
+class Or(Predicate):
+    """Any of several predicates."""
+
+    def __init__(self, predicates: Sequence[Predicate]):
+        self.predicates = list(predicates)
+
+    def compile(self) -> Matcher:
+        matchers = [predicate.compile() for predicate in self.predicates]
+        return lambda record: any(matches(record) for matches in matchers)
+
+    def __repr__(self) -> str:
+        return "(" + " | ".join(map(repr, self.predicates)) + ")"
+
+
+class Not(Predicate):
+    """The negation of a predicate."""
+
+    def __init__(self, predicate: Predicate):
+        self.predicate = predicate
+
+    def compile(self) -> Matcher:
+        matches = self.predicate.compile()
+        return lambda record: not matches(record)
+
+    def __repr__(self) -> str:
+        return f"~({self.predicate!r})"
+
+
+class Field:
+    """
+    Reference to a record field, used to build predicates.
+
+    Example:
+        >>> (Field("type") == "fire") & (Field("power") >= 90)
+    """
+
+    __hash__ = None
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Field name
+        """
+        self.name = name
+
+    def __eq__(self, value: Any) -> Comparison:  # type: ignore[override]
+        return Comparison(self.name, "==", value)
+
+    def __ne__(self, value: Any) -> Comparison:  # type: ignore[override]
+        return Comparison(self.name, "!=", value)
+
+    def __lt__(self, value: Any) -> Comparison:
+        return Comparison(self.name, "<", value)
+
+    def __le__(self, value: Any) -> Comparison:
+        return Comparison(self.name, "<=", value)
+
+    def __gt__(self, value: Any) -> Comparison:
+        return Comparison(self.name, ">", value)
+
+    def __ge__(self, value: Any) -> Comparison:
+        return Comparison(self.name, ">=", value)
+
+    def between(self, low: Any, high: Any) -> Comparison:
+        """Match values within an inclusive range."""
+        return Comparison(self.name, "between", (low, high))
+
+    def isin(self, values: Iterable[Any]) -> Comparison:
+        """Match values equal to any of several values."""
+        return Comparison(self.name, "in", tuple(values))
+
+    def contains(self, text: str) -> Comparison:
+        """Match values containing a substring, ignoring case."""
+        return Comparison(self.name, "contains", text)
+
+
+class SortedIndex:
+    """
+    Record positions ordered by the value of one field.
+
+    Records whose field is missing or None are left out, so the index only
+    serves range comparisons, which never match them.
+    """
+
+    def __init__(self, keys: List[Any], positions: List[int]):
+        """
+        Args:
+            keys: Field values in ascending order
+            positions: Record position of each key
+        """
+        self.keys = keys
+        self.positions = positions
+
+    @classmethod
+    def build(cls, records: Sequence[Dict[str, Any]], field: str) -> Optional["SortedIndex"]:
+        """
+        Build a sorted index over a field.
+
+        Args:
+            records: Records to index
+            field: Field to order by
+
+        Returns:
+            The index, or None if the field's values can't be ordered
+        """
+        pairs = [
+            (record.get(field), position)
+            for position, record in enumerate(records)
+            if record.get(field) is not None
+        ]
+        try:
+            pairs.sort()
+        except TypeError:
+            return None
+        return cls([key for key, _ in pairs], [position for _, position in pairs])
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> List[int]:
+        """
+        Get the positions of records within a value range.
+
+        Args:
+            low: Lower bound, or None for no lower bound
+            high: Upper bound, or None for no upper bound
+            include_low: If True, the lower bound is inclusive
+            include_high: If True, the upper bound is inclusive
+
+        Returns:
+            Matching record positions, ordered by value
+        """
+        start = 0
+        end = len(self.keys)
+        if low is not None:
+            start = (bisect_left if include_low else bisect_right)(self.keys, low)
+        if high is not None:
+            end = (bisect_right if include_high else bisect_left)(self.keys, high)
+        return self.positions[start:end]
+
+
+class Query:
+    """
+    A query over one client's records.
+
+    Built by chaining ``where``, ``select``, ``order_by`` and ``limit``, each
+    of which returns a new query, and run with ``all``, ``first``, ``count``
+    or by iterating.
+
+    The planner looks at the conditions that must all hold and picks the
+    most selective one served by an existing hash index (equality and
+    membership) or sorted index (ranges). Only the records it yields are
+    checked against the remaining conditions. Without a usable index the
+    query is a single scan testing every condition in one compiled pass.
+
+    Example:
+        >>> moves.query().where(
+        ...     (Field("type") == "fire") & (Field("category") == "special"),
+        ...     Field("power") >= 90,
+        ...     Field("accuracy") >= 0.9,
+        ... ).order_by("power", descending=True).all()
+    """
+
+    def __init__(self, client: "BaseDataClient"):
+        """
+        Args:
+            client: Client whose records are queried
+        """
+        self._client = client
+        self._predicates: List[Predicate] = []
+        self._fields: Optional[Tuple[str, ...]] = None
+        self._order: List[Tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+
+    def _clone(self) -> "Query":
+        query = Query(self._client)
+        query._predicates = list(self._predicates)
+        query._fields = self._fields
+        query._order = list(self._order)
+        query._limit = self._limit
+        return query
+
+    def where(self, *predicates: Predicate) -> "Query":
+        """
+        Add conditions that every result must satisfy.
+
+        Args:
+            *predicates: Predicates, all of which must hold
+
+        Returns:
+            The new query
+        """
+        query = self._clone()
+        for predicate in predicates:
+            query._predicates.extend(predicate.conjuncts())
+        return query
+
+    def select(self, *fields: str) -> "Query":
+        """
+        Return only some fields of each record.
+
+        Args:
+            *fields: Fields to keep
+
+        Returns:
+            The new query
+        """
+        query = self._clone()
+        query._fields = fields
+        return query
+
+    def order_by(self, field: str, descending: bool = False) -> "Query":
+        """
+        Sort results by a field, after any earlier sort keys.
+
+        Records missing the field, or holding None, sort last.
+
+        Args:
+            field: Field to sort by
+            descending: If True, sort from highest to lowest
+
+        Returns:
+            The new query
+        """
+        query = self._clone()
+        query._order.append((field, descending))
+        return query
+
+    def limit(self, count: int) -> "Query":
+        """
+        Return at most a number of results.
+
+        Args:
+            count: Maximum number of results
+
+        Returns:
+            The new query
+        """
+        query = self._clone()
+        query._limit = max(count, 0)
+        return query
+
+    def all(self) -> List[Dict[str, Any]]:
+        """
+        Run the query.
+
+        Returns:
+            List of matching records, projected if ``select`` was used
+        """
+        return list(self)
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        """
+        Run the query and return its first result.
+
+        Returns:
+            The first matching record, or None if nothing matches
+        """
+        return next(iter(self.limit(1)), None)
+
+    def count(self) -> int:
+        """
+        Count the matching records, ignoring ordering and projection.
+
+        Returns:
+            Number of matching records, capped by ``limit``
+        """
+        total = sum(1 for _ in self._matching_positions())
+        return total if self._limit is None else min(total, self._limit)
+
+    def explain(self) -> str:
+        """
+        Describe how the query will be run.
+
+        Returns:
+            Human readable plan
+        """
+        self._client.load_data()
+        access, residual = self._plan()
+        if access is None:
+            plan = f"full scan of {len(self._client._data)} records"
+        else:
+            plan = access[0]
+        if residual:
+            plan += " filtered by " + " & ".join(map(repr, residual))
+        if self._order:
+            plan += ", ordered by " + ", ".join(
+                f"{field} {'desc' if descending else 'asc'}" for field, descending in self._order
+            )
+        if self._limit is not None:
+            plan += f", limit {self._limit}"
+        return plan
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        client = self._client
+        data = client._data
+        positions: Iterable[int] = self._matching_positions()
+
+        if self._order:
+            positions = self._sorted(positions, data)
+        elif self._limit is not None:
+            positions = (position for _, position in zip(range(self._limit), positions))
+
+        for position in positions:
+            record = data[position]
+            yield project(record, self._fields) if self._fields is not None else client._emit(record)
+
+    def _matching_positions(self) -> Iterator[int]:
+        """
+        Find the positions of matching records in dataset order.
+
+        Yields:
+            Matching record positions, ascending
+        """
+        self._client.load_data()
+        data = self._client._data
+        access, residual = self._plan()
+        matches = And(residual).compile() if residual else None
+
+        if access is None:
+            candidates: Iterable[int] = range(len(data))
+        else:
+            candidates = sorted(access[1])
+
+        if matches is None:
+            yield from candidates
+            return
+        for position in candidates:
+            if matches(data[position]):
+                yield position
+
+    def _plan(self) -> Tuple[Optional[Tuple[str, Iterable[int]]], List[Predicate]]:
+        """
+        Pick the access path for the query.
+
+        Returns:
+            Tuple of (access, residual). ``access`` is a (description,
+            positions) pair for the most selective indexed condition, or None
+            for a full scan. ``residual`` lists the conditions still to check.
+        """
+        best = None
+        best_predicate = None
+        for predicate in self._predicates:
+            candidate = self._index_access(predicate)
+            if candidate is not None and (best is None or len(candidate[1]) < len(best[1])):
+                best = candidate
+                best_predicate = predicate
+
+        residual = [predicate for predicate in self._predicates if predicate is not best_predicate]
+        return best, residual
+
+    def _index_access(self, predicate: Predicate) -> Optional[Tuple[str, List[int]]]:
+        """
+        Get the candidate positions for a condition from an index.
+
+        Args:
+            predicate: One of the conditions that must hold
+
+        Returns:
+            Tuple of (description, positions), or None if no index applies
+        """
+        if not isinstance(predicate, Comparison):
+            return None
+
+        client = self._client
+        field, op, value = predicate.field, predicate.op, predicate.value
+
+        if op in ("==", "in") and client.has_index(field):
+            index = client._indexes[field]
+            try:
+                if op == "==":
+                    positions = index.get(value, [])
+                else:
+                    positions = [p for v in set(value) for p in index.get(v, ())]
+            except TypeError:
+                return None
+            return f"hash index on '{field}' ({len(positions)} candidates)", positions
+
+        if op in ("<", "<=", ">", ">=", "between") and value is not None:
+            sorted_index = client.get_sorted_index(field)
+            if sorted_index is None:
+                return None
+            try:
+                if op == "between":
+                    positions = sorted_index.range(value[0], value[1])
+                elif op in ("<", "<="):
+                    positions = sorted_index.range(high=value, include_high=op == "<=")
+                else:
+                    positions = sorted_index.range(low=value, include_low=op == ">=")
+            except TypeError:
+                return None
+            return f"sorted index on '{field}' ({len(positions)} candidates)", positions
+
+        return None
+
+    def _sorted(self, positions: Iterable[int], data: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Order positions by the query's sort keys, keeping dataset order for ties.
+
+        Args:
+            positions: Matching record positions in dataset order
+            data: The client's records
+
+        Returns:
+            Ordered positions, truncated to the limit
+        """
+        if len(self._order) == 1:
+            field, descending = self._order[0]
+            key = _sort_key(data, field, descending)
+            if self._limit is not None:
+                return heapq.nsmallest(self._limit, positions, key=key)
+            return sorted(positions, key=key)
+
+        ordered = list(positions)
+        # Stable sorts applied from the last key to the first
+        for field, descending in reversed(self._order):
+            ordered.sort(key=_sort_key(data, field, descending))
+        return ordered if self._limit is None else ordered[: self._limit]
+
+
+class _Descending:
+    """Wraps a value so it sorts in reverse order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _sort_key(
+    data: Sequence[Dict[str, Any]], field: str, descending: bool
+) -> Callable[[int], Tuple[bool, Any]]:
+    """
+    Build a sort key over record positions that puts missing values last.
+
+    Args:
+        data: The client's records
+        field: Field to sort by
+        descending: If True, larger values sort first
+
+    Returns:
+        Key function taking a record position
+    """
+    if descending:
+        def key(position: int) -> Tuple[bool, Any]:
+            value = data[position].get(field)
+            return (value is None, None if value is None else _Descending(value))
+    else:
+        def key(position: int) -> Tuple[bool, Any]:
+            value = data[position].get(field)
+            return (value is None, value)
+    return key
+
+
+def _as_container(values: Any) -> Any:
+    """Use a set for membership tests when every value is hashable."""
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
+
+
+def _safe_in(value: Any, values: Any) -> bool:
+    """Membership test that treats unhashable values as missing from a set."""
+    try:
+        return value in values
+    except TypeError:
+        return False
@@ -0,0 +1,36 @@
+"""
+Read-only record type shared by the data clients
+"""
+from typing import Any, NoReturn
+
+
+class FrozenRecord(dict):
+    """
+    A dict that can't be modified.
+
+    Datasets store their records as FrozenRecords so records shared between
+    clients can be handed out without copying. Reads behave exactly like a
+    dict; any mutation raises TypeError. ``copy()`` returns a plain, mutable
+    dict, so callers that need to change a record copy it on write.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenRecord is read-only, use .copy() to get a mutable dict")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        # The default dict pickling restores items through __setitem__
+        return (FrozenRecord, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenRecord({dict.__repr__(self)})"
@@ -3,14 +3,20 @@ Client for accessing Revomon species data
 """
 
 from logging import getLogger
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .base_client import BaseDataClient
+from .evolution_graph import EvolutionGraph, build_evolution_graph
+from .name_resolver import NameResolverMixin
+
+if TYPE_CHECKING:
+    from .evolution_chains import EvolutionChains
+    from .revomon_columns import RevomonColumns
 
 logger = getLogger(__name__)
 
 
-class RevomonClient(BaseDataClient):
+class RevomonClient(NameResolverMixin, BaseDataClient):
     """
     Client for accessing Revomon species data.
 
@@ -25,8 +31,12 @@ class RevomonClient(BaseDataClient):
     - images: various image URLs
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/revomon.json")
+    indexed_fields = (
+        "name", "type1", "type2", "rarity", "evo", "ability1", "ability2", "abilityh"
+    )
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/revomon.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "dex_id"
@@ -80,18 +90,17 @@ class RevomonClient(BaseDataClient):
         """
         self.load_data()
         if type2 is None:
-            return [
-                record.copy()
-                for record in self._data
-                if record.get("type1") == type1 or record.get("type2") == type1
-            ]
+            positions = set(self._lookup("type1", type1) or ()) | set(
+                self._lookup("type2", type1) or ()
+            )
         else:
-            return [
-                record.copy()
-                for record in self._data
-                if (record.get("type1") == type1 and record.get("type2") == type2)
-                or (record.get("type1") == type2 and record.get("type2") == type1)
-            ]
+            positions = set(self._lookup("type1", type1) or ()) & set(
+                self._lookup("type2", type2) or ()
+            )
+            positions |= set(self._lookup("type1", type2) or ()) & set(
+                self._lookup("type2", type1) or ()
+            )
+        return [self._emit(self._data[position]) for position in sorted(positions)]
 
     def get_revomon_by_ability(self, ability: str) -> List[Dict[str, Any]]:
         """
@@ -104,15 +113,10 @@ class RevomonClient(BaseDataClient):
             List of Revomon with the specified ability
         """
         self.load_data()
-        matches = []
-        for record in self._data:
-            if (
-                record.get("ability1") == ability
-                or record.get("ability2") == ability
-                or record.get("abilityh") == ability
-            ):
-                matches.append(record.copy())
-        return matches
+        positions = set()
+        for field in ("ability1", "ability2", "abilityh"):
+            positions.update(self._lookup(field, ability) or ())
+        return [self._emit(self._data[position]) for position in sorted(positions)]
 
     def get_revomon_by_stat_total_range(
         self, min_total: int, max_total: int
@@ -127,12 +131,9 @@ class RevomonClient(BaseDataClient):
         Returns:
             List of Revomon within the stat range
         """
-        self.load_data()
-        return [
-            record.copy()
-            for record in self._data
-            if min_total <= record.get("stat_total", 0) <= max_total
-        ]
+        columns = self.get_columns()
+        positions = columns.positions(columns.between("stat_total", min_total, max_total))
+        return [self._emit(self._data[position]) for position in positions]
 
     def get_highest_stat_total(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -144,11 +145,7 @@ class RevomonClient(BaseDataClient):
         Returns:
             List of Revomon sorted by stat total (highest first)
         """
-        self.load_data()
-        sorted_data = sorted(
-            self._data, key=lambda x: x.get("stat_total", 0), reverse=True
-        )
-        return [record.copy() for record in sorted_data[:limit]]
+        return self._top_stat_total(limit, largest=True)
 
     def get_lowest_stat_total(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -160,9 +157,76 @@ class RevomonClient(BaseDataClient):
         Returns:
             List of Revomon sorted by stat total (lowest first)
         """
+        return self._top_stat_total(limit, largest=False)
+
+    def _top_stat_total(self, limit: int, largest: bool) -> List[Dict[str, Any]]:
+        """
+        Get the Revomon with the highest or lowest stat totals without a full sort.
+
+        Args:
+            limit: Number of results to return, sliced like a list
+            largest: If True return the highest totals first, otherwise the lowest
+
+        Returns:
+            List of Revomon in rank order, ties in Revodex order
+        """
+        columns = self.get_columns()
+        count = len(range(len(columns))[:limit])
+        positions = columns.top_k("stat_total", count, largest=largest)
+        return [self._emit(self._data[position]) for position in positions]
+
+    def get_columns(self) -> "RevomonColumns":
+        """
+        Get the columnar NumPy view of the Revomon data.
+
+        The columns are built once per loaded dataset and shared by every
+        client reading revomon.json.
+
+        Returns:
+            Columns aligned with the record order of ``get_all()``
+        """
+        from .revomon_columns import RevomonColumns, build_revomon_columns
+
+        self.load_data()
+        if self._dataset is None:
+            return RevomonColumns(self._data)
+        return self._dataset.derived("revomon_columns", build_revomon_columns)
+
+    def get_evolution_graph(self) -> EvolutionGraph:
+        """
+        Get the evolution DAG of the Revomon data.
+
+        The graph is built once per loaded dataset and shared by every
+        client reading revomon.json.
+
+        Returns:
+            Graph whose nodes are positions in ``get_all()``
+        """
         self.load_data()
-        sorted_data = sorted(self._data, key=lambda x: x.get("stat_total", 0))
-        return [record.copy() for record in sorted_data[:limit]]
+        if self._dataset is None:
+            return EvolutionGraph(self._data)
+        return self._dataset.derived("evolution_graph", build_evolution_graph)
+
+    def get_evolution_chains(self) -> "EvolutionChains":
+        """
+        Get every forward evolution chain with its features as NumPy arrays.
+
+        The chains are enumerated once per loaded dataset and shared by every
+        client reading revomon.json.
+
+        Returns:
+            The evolution chains
+        """
+        from .evolution_chains import EvolutionChains
+
+        self.load_data()
+        graph = self.get_evolution_graph()
+        columns = self.get_columns()
+        if self._dataset is None:
+            return EvolutionChains(self._data, graph, columns)
+        return self._dataset.derived(
+            "evolution_chains", lambda dataset: EvolutionChains(dataset.records, graph, columns)
+        )
 
     def get_evolution_chain(self, dex_id: int) -> List[Dict[str, Any]]:
         """
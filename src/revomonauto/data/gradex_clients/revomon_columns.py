@@ -0,0 +1,263 @@
+"""
+Columnar NumPy view of Revomon species data
+"""
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Base stats, in the order used by stat matrices
+STAT_FIELDS: Tuple[str, ...] = ("hp", "atk", "def", "spa", "spd", "spe")
+
+# Integer columns stored as arrays
+NUMERIC_FIELDS: Tuple[str, ...] = STAT_FIELDS + (
+    "stat_total",
+    "ev_hp", "ev_atk", "ev_def", "ev_spa", "ev_spd", "ev_spe",
+    "dex_id",
+)
+
+# String columns stored as categorical codes
+CATEGORICAL_FIELDS: Tuple[str, ...] = (
+    "type1", "type2", "ability1", "ability2", "abilityh", "rarity",
+)
+
+# Code used for a missing categorical value
+MISSING = -1
+
+
+class RevomonColumns:
+    """
+    Column arrays built from the records of revomon.json.
+
+    Numeric fields are stored as int64 arrays and string fields as int32
+    category codes, all aligned with the dataset's record positions. Filters
+    return boolean masks that can be combined with ``&``, ``|`` and ``~``
+    and turned into record positions with ``positions()``.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Build the columns.
+
+        Args:
+            records: Revomon records, in dataset order
+        """
+        self.size = len(records)
+        self._numeric: Dict[str, np.ndarray] = {}
+        for field in NUMERIC_FIELDS:
+            column = np.fromiter(
+                (record.get(field) or 0 for record in records), dtype=np.int64, count=self.size
+            )
+            column.flags.writeable = False
+            self._numeric[field] = column
+
+        self._codes: Dict[str, np.ndarray] = {}
+        self._code_lookups: Dict[str, Dict[str, int]] = {}
+        self.categories: Dict[str, Tuple[str, ...]] = {}
+        for field in CATEGORICAL_FIELDS:
+            values = [record.get(field) for record in records]
+            categories = tuple(sorted({value for value in values if value is not None}))
+            lookup = {value: code for code, value in enumerate(categories)}
+            codes = np.fromiter(
+                (lookup.get(value, MISSING) for value in values), dtype=np.int32, count=self.size
+            )
+            codes.flags.writeable = False
+            self._codes[field] = codes
+            self._code_lookups[field] = lookup
+            self.categories[field] = categories
+
+        self.base_stats = np.stack([self._numeric[field] for field in STAT_FIELDS], axis=1)
+        self.base_stats.flags.writeable = False
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """
+        Get a numeric column, or the category codes of a categorical column.
+
+        Args:
+            field: Field name
+
+        Returns:
+            Read-only array with one value per record
+        """
+        if field in self._numeric:
+            return self._numeric[field]
+        if field in self._codes:
+            return self._codes[field]
+        raise KeyError(field)
+
+    def code(self, field: str, value: Optional[str]) -> Optional[int]:
+        """
+        Get the category code of a value.
+
+        Args:
+            field: Categorical field name
+            value: Value to encode (None for missing)
+
+        Returns:
+            The code, or None if the value never occurs in the field
+        """
+        if value is None:
+            return MISSING
+        return self._code_lookups[field].get(value)
+
+    def equals(self, field: str, value: Any) -> np.ndarray:
+        """
+        Mask of records whose field equals a value.
+
+        Args:
+            field: Numeric or categorical field name
+            value: Value to match
+
+        Returns:
+            Boolean mask
+        """
+        if field in self._codes:
+            code = self.code(field, value)
+            if code is None:
+                return np.zeros(self.size, dtype=bool)
+            return self._codes[field] == code
+        return self[field] == value
+
+    def between(self, field: str, minimum: float, maximum: float) -> np.ndarray:
+        """
+        Mask of records whose numeric field is within an inclusive range.
+
+        Args:
+            field: Numeric field name
+            minimum: Lower bound
+            maximum: Upper bound
+
+        Returns:
+            Boolean mask
+        """
+        column = self._numeric[field]
+        return (column >= minimum) & (column <= maximum)
+
+    def has_type(self, type_name: str) -> np.ndarray:
+        """
+        Mask of records with a type in either slot.
+
+        Args:
+            type_name: Type to match
+
+        Returns:
+            Boolean mask
+        """
+        return self.equals("type1", type_name) | self.equals("type2", type_name)
+
+    def has_ability(self, ability: str) -> np.ndarray:
+        """
+        Mask of records that can have an ability, including the hidden ability.
+
+        Args:
+            ability: Ability name
+
+        Returns:
+            Boolean mask
+        """
+        return (
+            self.equals("ability1", ability)
+            | self.equals("ability2", ability)
+            | self.equals("abilityh", ability)
+        )
+
+    @staticmethod
+    def positions(mask: np.ndarray) -> np.ndarray:
+        """
+        Convert a mask to record positions.
+
+        Args:
+            mask: Boolean mask
+
+        Returns:
+            Ascending record positions
+        """
+        return np.flatnonzero(mask)
+
+    def top_k(
+        self,
+        field: str,
+        k: int,
+        largest: bool = True,
+        mask: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Positions of the k records with the largest (or smallest) field values.
+
+        Uses a partial partition instead of a full sort. Ties are broken by
+        record position, so the result matches a stable sort of the records.
+
+        Args:
+            field: Numeric field to rank by
+            k: Number of positions to return
+            largest: If True rank highest first, otherwise lowest first
+            mask: Optional mask restricting the candidates
+
+        Returns:
+            Record positions, best first
+        """
+        candidates = np.arange(self.size) if mask is None else np.flatnonzero(mask)
+        k = min(k, len(candidates))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        column = self._numeric[field][candidates]
+        keys = -column if largest else column
+        threshold = np.partition(keys, k - 1)[k - 1]
+        better = np.flatnonzero(keys < threshold)
+        ties = np.flatnonzero(keys == threshold)[: k - len(better)]
+        chosen = np.concatenate([better, ties])
+        # Both parts are in position order, so a stable sort keeps ties in record order
+        chosen = chosen[np.argsort(keys[chosen], kind="stable")]
+        return candidates[chosen]
+
+    def effective_stats(self, level: Union[int, np.ndarray] = 100) -> np.ndarray:
+        """
+        Compute level-scaled stats for every species at once.
+
+        Uses the same formula as ``BattleMechanicsClient._get_effective_stats``.
+
+        Args:
+            level: Level for every species, or an array with one level per species
+
+        Returns:
+            Integer array of shape (species, 6) with columns in ``STAT_FIELDS`` order
+        """
+        return scale_stats(self.base_stats, level)
+
+
+def scale_stats(base_stats: np.ndarray, level: Union[int, np.ndarray] = 100) -> np.ndarray:
+    """
+    Compute level-scaled stats for rows of base stats.
+
+    Uses the same formula as ``BattleMechanicsClient._get_effective_stats``.
+
+    Args:
+        base_stats: Integer array of shape (n, 6) with columns in ``STAT_FIELDS`` order
+        level: Level for every row, or an array with one level per row
+
+    Returns:
+        Integer array of shape (n, 6)
+    """
+    level = np.asarray(level, dtype=np.int64)
+    if level.ndim:
+        level = level[:, np.newaxis]
+    level_multiplier = (2 * level) / 100 + 1
+    scaled = base_stats * level_multiplier
+    offsets = np.where(np.arange(len(STAT_FIELDS)) == 0, level + 10, 5)
+    return np.floor(scaled + offsets).astype(np.int64)
+
+
+def build_revomon_columns(dataset) -> RevomonColumns:
+    """
+    Build the columns for a revomon.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Columns over the dataset's records
+    """
+    return RevomonColumns(dataset.records)
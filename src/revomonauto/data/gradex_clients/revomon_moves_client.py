@@ -3,10 +3,15 @@ Client for accessing Revomon moves data (which moves each Revomon can learn)
 """
 
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .base_client import BaseDataClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .learnset_index import LearnsetIndex
+
 logger = getLogger(__name__)
 
 
@@ -21,10 +26,17 @@ class RevomonMovesClient(BaseDataClient):
     - move_name: Move name
     - method: Learning method (levelup, machine, etc.)
     - level: Level learned (for levelup method)
+
+    Learnset queries are served from a LearnsetIndex built once per dataset,
+    so they cost time proportional to the rows returned rather than the
+    size of the file.
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/revomon_moves.json")
+    # Move, method and level lookups go through the learnset index
+    indexed_fields = ("mon_name",)
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/revomon_moves.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         # Composite key, but we'll use a combination for unique identification
@@ -40,10 +52,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of moves the Revomon can learn
         """
-        self.load_data()
-        return [
-            record.copy() for record in self._data if record.get("mon_dex_id") == dex_id
-        ]
+        return self._emit_positions(self.get_learnset_index().species_positions(dex_id))
 
     def get_moves_by_revomon_name(self, name: str) -> List[Dict[str, Any]]:
         """
@@ -55,10 +64,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of moves the Revomon can learn
         """
-        self.load_data()
-        return [
-            record.copy() for record in self._data if record.get("mon_name") == name
-        ]
+        return self.find_by_field("mon_name", name)
 
     def get_moves_by_learning_method(self, method: str) -> List[Dict[str, Any]]:
         """
@@ -70,7 +76,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of moves learned by the specified method
         """
-        return self.find_by_field("method", method)
+        return self._emit_positions(self.get_learnset_index().methods.get(method))
 
     def get_levelup_moves(self) -> List[Dict[str, Any]]:
         """
@@ -100,12 +106,8 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of moves learned at the specified level
         """
-        self.load_data()
-        return [
-            record.copy()
-            for record in self._data
-            if record.get("method") == "levelup" and record.get("level") == level
-        ]
+        index = self.get_learnset_index()
+        return self._emit_positions(index.levelup_positions_in_range(None, level, level))
 
     def get_revomon_levelup_moves_by_level(
         self, dex_id: int, level: int
@@ -120,14 +122,28 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of moves learned at the specified level
         """
-        self.load_data()
-        return [
-            record.copy()
-            for record in self._data
-            if record.get("mon_dex_id") == dex_id
-            and record.get("method") == "levelup"
-            and record.get("level") == level
-        ]
+        index = self.get_learnset_index()
+        return self._emit_positions(index.levelup_positions_in_range(dex_id, level, level))
+
+    def get_levelup_schedule(
+        self, dex_id: int, max_level: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a Revomon's level-up moves in the order they are learned.
+
+        Args:
+            dex_id: The Revomon's Revodex ID
+            max_level: If given, only include moves learned at or below this level
+
+        Returns:
+            List of level-up moves sorted by level
+        """
+        index = self.get_learnset_index()
+        if max_level is None:
+            _, positions = index.levelup_schedule(dex_id)
+        else:
+            positions = index.levelup_positions_in_range(dex_id, 0, max_level)
+        return self._emit_positions(positions)
 
     def get_all_learnable_moves(self) -> List[str]:
         """
@@ -136,11 +152,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of all learnable move names
         """
-        self.load_data()
-        moves = set()
-        for record in self._data:
-            moves.add(record.get("move_name", ""))
-        return list(moves)
+        return list(self.get_learnset_index().move_ids)
 
     def get_move_learning_methods(self, move_name: str) -> List[Dict[str, Any]]:
         """
@@ -152,12 +164,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of learning methods for the move
         """
-        self.load_data()
-        return [
-            record.copy()
-            for record in self._data
-            if record.get("move_name") == move_name
-        ]
+        return self._get_move_rows(move_name)
 
     def get_revomon_with_move(self, move_name: str) -> List[Dict[str, Any]]:
         """
@@ -169,12 +176,7 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             List of Revomon that can learn the move
         """
-        self.load_data()
-        return [
-            record.copy()
-            for record in self._data
-            if record.get("move_name") == move_name
-        ]
+        return self._get_move_rows(move_name)
 
     def get_learning_method_distribution(self) -> Dict[str, int]:
         """
@@ -183,10 +185,51 @@ class RevomonMovesClient(BaseDataClient):
         Returns:
             Dictionary mapping learning method to count
         """
+        counts = self.get_learnset_index().methods.counts()
+        return {method: count for method, count in counts.items() if method}
+
+    def get_learnset_index(self) -> "LearnsetIndex":
+        """
+        Get the learnset index over the loaded data.
+
+        The index is built once per loaded dataset and shared by every
+        RevomonMovesClient.
+
+        Returns:
+            Index whose record positions refer to ``get_all()`` order
+        """
+        from .learnset_index import LearnsetIndex, build_learnset_index
+
         self.load_data()
-        method_counts = {}
-        for record in self._data:
-            method = record.get("method")
-            if method:
-                method_counts[method] = method_counts.get(method, 0) + 1
-        return method_counts
+        if self._dataset is None:
+            return LearnsetIndex(self._data)
+        return self._dataset.derived("learnset_index", build_learnset_index)
+
+    def _get_move_rows(self, move_name: str) -> List[Dict[str, Any]]:
+        """
+        Get every learnset row for a move.
+
+        Args:
+            move_name: The move name
+
+        Returns:
+            List of learnset rows in dataset order
+        """
+        index = self.get_learnset_index()
+        move_id = index.move_ids.get(move_name)
+        if move_id is None:
+            return []
+        return self._emit_positions(index.move_positions(move_id))
+
+    def _emit_positions(self, positions: "np.ndarray") -> List[Dict[str, Any]]:
+        """
+        Get the records at a sequence of positions.
+
+        Args:
+            positions: Record positions
+
+        Returns:
+            List of records, copied unless the client is read-only
+        """
+        data = self._data
+        return [self._emit(data[position]) for position in positions.tolist()]
@@ -0,0 +1,195 @@
+"""
+On-disk compiled snapshots of Revomon datasets
+"""
+import hashlib
+import os
+import pickle
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = getLogger(__name__)
+
+# Bump when the snapshot layout changes so stale snapshots are ignored
+SNAPSHOT_FORMAT = 2
+
+
+class SnapshotCache:
+    """
+    Stores parsed datasets and their indexes as pickle snapshots.
+
+    Each snapshot holds a small header followed by the payload. The header
+    records the source file's size, mtime and SHA-256, so a snapshot is only
+    used while it still matches the JSON it was compiled from. When only the
+    mtime differs the source is re-hashed and the snapshot kept if the
+    content is unchanged.
+
+    Snapshots are written to ``$REVOMONAUTO_CACHE_DIR`` when set, otherwise to
+    ``~/.cache/revomonauto/snapshots``. Only point it at a directory you
+    trust, since snapshots are unpickled on load.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path, None] = None):
+        """
+        Initialize the snapshot cache.
+
+        Args:
+            cache_dir: Directory to store snapshots in (uses the default if None)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("REVOMONAUTO_CACHE_DIR") or (
+                Path.home() / ".cache" / "revomonauto" / "snapshots"
+            )
+        self.cache_dir = Path(cache_dir)
+
+    def snapshot_path(self, source: Path) -> Path:
+        """
+        Get the snapshot file used for a source file.
+
+        Args:
+            source: Resolved path of the JSON data file
+
+        Returns:
+            Path of the snapshot file
+        """
+        digest = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{source.stem}-{digest}.snapshot"
+
+    def load(
+        self, source: Path
+    ) -> Optional[Tuple[Sequence[Dict[str, Any]], Dict[str, Dict[Any, List[int]]]]]:
+        """
+        Load the records and indexes for a source file from its snapshot.
+
+        Args:
+            source: Resolved path of the JSON data file
+
+        Returns:
+            Tuple of (records, indexes), or None if there is no valid snapshot
+        """
+        snapshot = self.snapshot_path(source)
+        if not snapshot.exists():
+            return None
+
+        try:
+            stat = source.stat()
+            with open(snapshot, "rb") as f:
+                header = pickle.load(f)
+                if not self._is_current(header, source, stat):
+                    return None
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {snapshot}: {e}")
+            return None
+
+        if header["mtime_ns"] != stat.st_mtime_ns:
+            # Content is unchanged, refresh the header so the next load skips hashing
+            try:
+                self._write(snapshot, dict(header, mtime_ns=stat.st_mtime_ns), payload)
+            except OSError as e:
+                logger.warning(f"Could not refresh snapshot {snapshot}: {e}")
+
+        logger.debug(f"Loaded snapshot {snapshot}")
+        return payload["records"], payload["indexes"]
+
+    def save(
+        self,
+        source: Path,
+        mtime_ns: int,
+        records: Sequence[Dict[str, Any]],
+        indexes: Dict[str, Dict[Any, List[int]]],
+    ) -> bool:
+        """
+        Write a snapshot of the records and indexes for a source file.
+
+        Args:
+            source: Resolved path of the JSON data file
+            mtime_ns: Modification time of the source when the records were parsed
+            records: The parsed records
+            indexes: Indexes built over the records
+
+        Returns:
+            True if the snapshot was written, False otherwise
+        """
+        try:
+            stat = source.stat()
+            if stat.st_mtime_ns != mtime_ns:
+                # The source changed after it was parsed, the records are stale
+                return False
+            header = {
+                "format": SNAPSHOT_FORMAT,
+                "source": str(source),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(source),
+            }
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write(
+                self.snapshot_path(source),
+                header,
+                {"records": records, "indexes": indexes},
+            )
+            return True
+        except OSError as e:
+            logger.warning(f"Could not write snapshot for {source}: {e}")
+            return False
+
+    def clear(self) -> None:
+        """Delete every snapshot in the cache directory."""
+        if not self.cache_dir.exists():
+            return
+        for snapshot in self.cache_dir.glob("*.snapshot"):
+            snapshot.unlink(missing_ok=True)
+
+    def _is_current(self, header: Dict[str, Any], source: Path, stat: os.stat_result) -> bool:
+        """
+        Check a snapshot header against the current state of its source file.
+
+        Args:
+            header: The snapshot header
+            source: Resolved path of the JSON data file
+            stat: Current stat result of the source file
+
+        Returns:
+            True if the snapshot matches the source, False otherwise
+        """
+        if header.get("format") != SNAPSHOT_FORMAT or header.get("size") != stat.st_size:
+            return False
+        if header.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        return header.get("sha256") == file_sha256(source)
+
+    def _write(self, snapshot: Path, header: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """
+        Atomically write a snapshot file.
+
+        Args:
+            snapshot: Destination path
+            header: Snapshot header
+            payload: Records and indexes
+        """
+        tmp_path = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,206 @@
+"""
+Location and time-window indexes over the spawn fields of revomon.json
+"""
+import re
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Number of spawn location/time slots per record
+SPAWN_SLOTS = 3
+
+MINUTES_PER_DAY = 24 * 60
+
+_CLOCK = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
+_WINDOW = re.compile(r"^\s*(\d{1,2}:\d{2})\s+to\s+(\d{1,2}:\d{2})\s*$", re.IGNORECASE)
+
+
+def minute_of_day(time: Union[str, int]) -> Optional[int]:
+    """
+    Convert a clock time to minutes after midnight.
+
+    Out-of-range values found in the data (e.g. "24:59" or "3:60") wrap
+    around the day.
+
+    Args:
+        time: "H:MM" string, or minutes after midnight
+
+    Returns:
+        Minutes in [0, 1440), or None if the time can't be parsed
+    """
+    if isinstance(time, int):
+        return time % MINUTES_PER_DAY
+    match = _CLOCK.match(time)
+    if not match:
+        return None
+    return (int(match.group(1)) * 60 + int(match.group(2))) % MINUTES_PER_DAY
+
+
+def parse_window(text: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse a spawn time window such as "20:00 to 3:59".
+
+    Args:
+        text: The window, with both ends inclusive
+
+    Returns:
+        Tuple of (start, end) minutes after midnight, where end < start means
+        the window wraps past midnight, or None if the text can't be parsed
+    """
+    if not text:
+        return None
+    match = _WINDOW.match(text)
+    if not match:
+        return None
+    return minute_of_day(match.group(1)), minute_of_day(match.group(2))
+
+
+class IntervalIndex:
+    """
+    Stabbing queries over inclusive minute-of-day intervals.
+
+    The day is cut at every interval boundary into elementary segments, and
+    each segment stores the ids of the intervals covering it, so a query is
+    a binary search. Intervals that wrap past midnight are split in two.
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[int, int, int]]):
+        """
+        Build the index.
+
+        Args:
+            intervals: (start, end, id) triples with inclusive ends in minutes
+                after midnight; end < start wraps past midnight
+        """
+        pieces = []
+        for start, end, interval_id in intervals:
+            if end < start:
+                pieces.append((start, MINUTES_PER_DAY - 1, interval_id))
+                pieces.append((0, end, interval_id))
+            else:
+                pieces.append((start, end, interval_id))
+
+        cuts = {0}
+        for start, end, _ in pieces:
+            cuts.add(start)
+            cuts.add(end + 1)
+        self.starts: List[int] = sorted(cut for cut in cuts if cut < MINUTES_PER_DAY)
+        covering: List[List[int]] = [[] for _ in self.starts]
+        for start, end, interval_id in pieces:
+            first = bisect_right(self.starts, start) - 1
+            last = bisect_right(self.starts, end) - 1
+            for segment in range(first, last + 1):
+                covering[segment].append(interval_id)
+        self.segments: List[Tuple[int, ...]] = [tuple(sorted(set(ids))) for ids in covering]
+
+    def at(self, minute: int) -> Tuple[int, ...]:
+        """
+        Get the intervals covering a minute.
+
+        Args:
+            minute: Minutes after midnight
+
+        Returns:
+            Ids of the covering intervals, ascending
+        """
+        return self.segments[bisect_right(self.starts, minute % MINUTES_PER_DAY) - 1]
+
+
+class SpawnIndex:
+    """
+    Spawn entries of every record, indexed by location and by time.
+
+    A spawn entry is one filled ``spawn_loc{i}`` slot of a record. Entries
+    are numbered in record and slot order; ``by_location`` maps each
+    lower-cased location to its entries, and ``windows`` answers which
+    entries are active at a time of day.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            records: revomon.json records
+        """
+        # (record position, slot, location as written, spawn time)
+        self.entries: List[Tuple[int, int, str, Optional[str]]] = []
+        self.by_location: Dict[str, List[int]] = {}
+        # Spawn time string -> positions of the records with it in any slot
+        self.by_time: Dict[str, List[int]] = {}
+        # Spawn time string -> number of slots with it, in first-seen order
+        self.time_counts: Dict[str, int] = {}
+        windows = []
+        for position, record in enumerate(records):
+            for slot in range(1, SPAWN_SLOTS + 1):
+                spawn_time = record.get(f"spawn_time{slot}")
+                if spawn_time:
+                    self.time_counts[spawn_time] = self.time_counts.get(spawn_time, 0) + 1
+                    positions = self.by_time.setdefault(spawn_time, [])
+                    if not positions or positions[-1] != position:
+                        positions.append(position)
+                location = record.get(f"spawn_loc{slot}")
+                if not location:
+                    continue
+                entry_id = len(self.entries)
+                self.entries.append((position, slot, location, spawn_time))
+                self.by_location.setdefault(location.lower(), []).append(entry_id)
+                window = parse_window(spawn_time)
+                if window is not None:
+                    windows.append((window[0], window[1], entry_id))
+        self.windows = IntervalIndex(windows)
+
+    def first_entries(self, location: str) -> List[int]:
+        """
+        Get the first entry of each record spawning at a location.
+
+        Args:
+            location: The location name (any case)
+
+        Returns:
+            Entry ids in record order
+        """
+        entries = []
+        last_position = None
+        for entry_id in self.by_location.get(location.lower(), ()):
+            position = self.entries[entry_id][0]
+            if position != last_position:
+                entries.append(entry_id)
+                last_position = position
+        return entries
+
+    def active(self, time: Union[str, int], location: Optional[str] = None) -> List[int]:
+        """
+        Get the entries whose time window covers a time of day.
+
+        Args:
+            time: "H:MM" string, or minutes after midnight
+            location: If given, only entries at this location (any case)
+
+        Returns:
+            Entry ids, ascending
+
+        Raises:
+            ValueError: If the time can't be parsed
+        """
+        minute = minute_of_day(time)
+        if minute is None:
+            raise ValueError(f"Invalid time of day: {time!r}")
+        active = self.windows.at(minute)
+        if location is None:
+            return list(active)
+        location = location.lower()
+        entries = self.entries
+        return [entry_id for entry_id in active if entries[entry_id][2].lower() == location]
+
+
+def build_spawn_index(dataset) -> SpawnIndex:
+    """
+    Build the spawn index for a revomon.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Index over the dataset's records
+    """
+    return SpawnIndex(dataset.records)
@@ -17,6 +17,9 @@ from logging import getLogger
 
 logger = getLogger(__name__)
 
+# Status conditions covered by team analyses
+TEAM_STATUSES = ("poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion")
+
 
 class StatusEffectsClient(BaseDataClient):
     """
@@ -30,13 +33,13 @@ class StatusEffectsClient(BaseDataClient):
     - Status counter strategies
     """
 
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         """Initialize with abilities, moves, and items data for status analysis."""
         # Status effects are not in a separate JSON file, so we'll use abilities, moves, and items
-        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json")
-        self.abilities_client = AbilitiesClient()
-        self.moves_client = MovesClient()
-        self.items_client = ItemsClient()
+        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json", read_only=read_only)
+        self.abilities_client = AbilitiesClient(read_only=True)
+        self.moves_client = MovesClient(read_only=True)
+        self.items_client = ItemsClient(read_only=True)
 
         # Load all data
         self.load_data()
@@ -135,229 +138,88 @@ class StatusEffectsClient(BaseDataClient):
         Returns:
             List of status-causing moves and abilities
         """
-        causers = []
-
-        # Check moves that cause status
-        status_moves = self._get_status_moves()
-        for move in status_moves:
-            move_effects = self._get_move_status_effects(move)
-            if status in move_effects:
-                causers.append({
-                    "type": "move",
-                    "name": move.get("name"),
-                    "description": move.get("description"),
-                    "accuracy": move.get("accuracy"),
-                    "pp": move.get("pp"),
-                    "status_caused": status,
-                    "chance": move_effects[status].get("chance", 100)
-                })
-
-        # Check abilities that cause status
-        status_abilities = self._get_status_abilities()
-        for ability in status_abilities:
-            ability_effects = self._get_ability_status_effects(ability)
-            if status in ability_effects:
-                causers.append({
-                    "type": "ability",
-                    "name": ability.get("name"),
-                    "description": ability.get("description"),
-                    "status_caused": status,
-                    "trigger": ability_effects[status].get("trigger", "contact")
-                })
-
-        return causers
-
-    def _get_status_moves(self) -> List[Dict[str, Any]]:
-        """
-        Get all moves that can cause status conditions.
-
-        Returns:
-            List of status moves
-        """
-        status_move_names = [
-            "toxic", "poison sting", "poison powder", "smog", "acid",
-            "thunder wave", "stun spore", "glare", "nuzzle",
-            "sleep powder", "hypnosis", "sing", "spore",
-            "blizzard", "ice beam", "ice punch", "powder snow",
-            "ember", "flamethrower", "fire punch", "will-o-wisp",
-            "confusion", "psybeam", "psychic", "confuse ray",
-            "bite", "headbutt", "stomp", "fake out", "rock slide"
-        ]
-
-        status_moves = []
-        for move_name in status_move_names:
-            move = self.moves_client.get_move_by_name(move_name)
-            if move:
-                status_moves.append(move)
-
-        return status_moves
-
-    def _get_status_abilities(self) -> List[Dict[str, Any]]:
-        """
-        Get all abilities that can cause status conditions.
-
-        Returns:
-            List of status abilities
-        """
-        status_abilities = []
-
-        status_ability_names = [
-            "poison point", "flame body", "static", "cute charm",
-            "effect spore", "synchronize", "trace", "stench"
+        moves = self.moves_client.get_all()
+        causers = [
+            {
+                "type": "move",
+                "name": moves[position].get("name"),
+                "description": moves[position].get("description"),
+                "accuracy": moves[position].get("accuracy"),
+                "pp": moves[position].get("pp"),
+                "status_caused": status,
+                "chance": effect.get("chance", 100)
+            }
+            for position, effect in self.moves_client.get_effect_table("move_status_causes").get(status)
         ]
 
-        for ability_name in status_ability_names:
-            ability = self.abilities_client.get_ability_by_name(ability_name)
-            if ability:
-                status_abilities.append(ability)
+        abilities = self.abilities_client.get_all()
+        causers.extend(
+            self._ability_causer(abilities[position], status, effect)
+            for position, effect in self.abilities_client.get_effect_table("ability_status_causes").get(status)
+        )
 
-        return status_abilities
-
-    def _get_move_status_effects(self, move: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Get status effects for a specific move.
-
-        Args:
-            move: Move data
+        return causers
 
-        Returns:
-            Dict of status effects
-        """
-        effects = {}
-        move_name = move.get("name", "").lower()
-        description = move.get("description", "").lower()
-
-        # Poison moves
-        if any(word in move_name for word in ["toxic", "poison", "smog", "acid"]):
-            if "toxic" in move_name or "badly" in description:
-                effects["toxic"] = {"chance": 100}
-            else:
-                effects["poison"] = {"chance": 30}
-
-        # Paralysis moves
-        if any(word in move_name for word in ["thunder", "stun", "glare", "nuzzle"]):
-            effects["paralysis"] = {"chance": 30}
-
-        # Sleep moves
-        if any(word in move_name for word in ["sleep", "hypnosis", "sing", "spore"]):
-            effects["sleep"] = {"chance": 100 if "spore" in move_name else 60}
-
-        # Freeze moves
-        if any(word in move_name for word in ["blizzard", "ice beam", "ice punch"]):
-            effects["freeze"] = {"chance": 10}
-
-        # Burn moves
-        if any(word in move_name for word in ["ember", "flamethrower", "fire punch", "will-o-wisp"]):
-            if "will-o-wisp" in move_name:
-                effects["burn"] = {"chance": 100}
-            else:
-                effects["burn"] = {"chance": 10}
-
-        # Confusion moves
-        if any(word in move_name for word in ["confusion", "psybeam", "psychic", "confuse"]):
-            effects["confusion"] = {"chance": 10}
-
-        return effects
-
-    def _get_ability_status_effects(self, ability: Dict[str, Any]) -> Dict[str, Any]:
+    def _ability_causer(self, ability: Dict[str, Any], status: str, effect: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Get status effects for a specific ability.
+        Describe an ability as a status causer.
 
         Args:
             ability: Ability data
+            status: Status condition it causes
+            effect: Its row in the status causes table
 
         Returns:
-            Dict of status effects
-        """
-        effects = {}
-        ability_name = ability.get("name", "").lower()
-        _description = ability.get("description", "").lower()
-
-        # Poison Point - poisons on contact
-        if "poison point" in ability_name:
-            effects["poison"] = {"trigger": "contact", "chance": 30}
-
-        # Flame Body - burns on contact
-        if "flame body" in ability_name:
-            effects["burn"] = {"trigger": "contact", "chance": 30}
-
-        # Static - paralyzes on contact
-        if "static" in ability_name:
-            effects["paralysis"] = {"trigger": "contact", "chance": 30}
-
-        # Cute Charm - infatuates on contact (gender-based)
-        if "cute charm" in ability_name:
-            effects["infatuation"] = {"trigger": "contact", "chance": 30}
-
-        # Effect Spore - random status on contact
-        if "effect spore" in ability_name:
-            effects["random"] = {"trigger": "contact", "chance": 10,
-                               "possible": ["poison", "paralysis", "sleep"]}
-
-        return effects
+            Causer entry
+        """
+        return {
+            "type": "ability",
+            "name": ability.get("name"),
+            "description": ability.get("description"),
+            "status_caused": status,
+            "trigger": effect.get("trigger", "contact")
+        }
 
     def get_status_immunities(self, status: str) -> List[Dict[str, Any]]:
         """
-        Get all abilities that provide immunity to a specific status.
+        Get all abilities and types that provide immunity to a specific status.
 
         Args:
             status: Status condition name
 
         Returns:
-            List of immunity abilities
+            List of immunities
         """
-        immunities = []
-
-        # Check abilities for status immunity
-        all_abilities = self.abilities_client.get_all()
-        for ability in all_abilities:
-            ability_name = ability.get("name", "").lower()
-            _description = ability.get("description", "").lower()
-
-            if self._ability_immunes_status(ability_name, _description, status):
-                immunities.append({
-                    "name": ability.get("name"),
-                    "description": ability.get("description"),
-                    "immunity_type": "complete",
-                    "status_immuned": status
-                })
+        abilities = self.abilities_client.get_all()
+        immunities = [
+            self._ability_immunity(abilities[position], status)
+            for position, _ in self.abilities_client.get_effect_table("ability_status_immunities").get(status)
+        ]
 
         # Check types for status immunity (e.g., Electric immune to paralysis)
-        type_immunities = self._get_type_status_immunities(status)
-        immunities.extend(type_immunities)
+        immunities.extend(self._get_type_status_immunities(status))
 
         return immunities
 
-    def _ability_immunes_status(self, ability_name: str, description: str, status: str) -> bool:
+    def _ability_immunity(self, ability: Dict[str, Any], status: str) -> Dict[str, Any]:
         """
-        Check if an ability provides immunity to a status.
+        Describe an ability as a status immunity.
 
         Args:
-            ability_name: Name of the ability
-            description: Ability description
-            status: Status condition
+            ability: Ability data
+            status: Status condition it prevents
 
         Returns:
-            True if ability provides immunity
-        """
-        # Immunity abilities
-        immunity_mapping = {
-            "poison": ["immunity", "poison heal"],
-            "toxic": ["immunity", "poison heal"],
-            "paralysis": ["limber"],
-            "sleep": ["insomnia", "vital spirit"],
-            "freeze": ["magma armor"],
-            "burn": ["water veil"],
-            "confusion": ["own tempo"]
+            Immunity entry
+        """
+        return {
+            "type": "ability",
+            "name": ability.get("name"),
+            "description": ability.get("description"),
+            "immunity_type": "complete",
+            "status_immuned": status
         }
 
-        if status in immunity_mapping:
-            for immunity_ability in immunity_mapping[status]:
-                if immunity_ability in ability_name:
-                    return True
-
-        return False
-
     def _get_type_status_immunities(self, status: str) -> List[Dict[str, Any]]:
         """
         Get type-based status immunities.
@@ -373,6 +235,7 @@ class StatusEffectsClient(BaseDataClient):
         # Electric types are immune to paralysis
         if status == "paralysis":
             immunities.append({
+                "type": "type",
                 "name": "Electric type",
                 "description": "Electric-type Revomon are immune to paralysis",
                 "immunity_type": "type",
@@ -392,166 +255,67 @@ class StatusEffectsClient(BaseDataClient):
         Returns:
             List of cure methods
         """
-        cures = []
-
-        # Check items that cure status
-        status_items = self._get_status_cure_items()
-        for item in status_items:
-            item_effects = self._get_item_status_effects(item)
-            if status in item_effects:
-                cures.append({
-                    "type": "item",
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "cost": item.get("cost"),
-                    "cures": [status]
-                })
-
-        # Check moves that cure status
-        status_cure_moves = self._get_status_cure_moves()
-        for move in status_cure_moves:
-            move_effects = self._get_move_cure_effects(move)
-            if status in move_effects:
-                cures.append({
-                    "type": "move",
-                    "name": move.get("name"),
-                    "description": move.get("description"),
-                    "pp": move.get("pp"),
-                    "cures": [status]
-                })
-
-        # Check abilities that prevent/cure status
-        status_abilities = self.abilities_client.get_all()
-        for ability in status_abilities:
-            ability_name = ability.get("name", "").lower()
-            _description = ability.get("description", "").lower()
-
-            if self._ability_cures_status(ability_name, _description, status):
-                cures.append({
-                    "type": "ability",
-                    "name": ability.get("name"),
-                    "description": ability.get("description"),
-                    "cures": [status]
-                })
-
-        return cures
-
-    def _get_status_cure_items(self) -> List[Dict[str, Any]]:
-        """
-        Get all items that can cure status conditions.
-
-        Returns:
-            List of cure items
-        """
-        cure_item_names = [
-            "antidote", "burn heal", "ice heal", "awakening", "paralyze heal",
-            "full heal", "full restore", "heal powder", "energy root"
-        ]
-
-        cure_items = []
-        for item_name in cure_item_names:
-            item = self.items_client.get_item_by_name(item_name)
-            if item:
-                cure_items.append(item)
+        cures = self._item_cures(status)
 
-        return cure_items
-
-    def _get_status_cure_moves(self) -> List[Dict[str, Any]]:
-        """
-        Get all moves that can cure status conditions.
-
-        Returns:
-            List of cure moves
-        """
-        cure_move_names = [
-            "refresh", "heal bell", "aromatherapy", "jungle healing",
-            "purify", "take heart", "sparkly swirl"
-        ]
-
-        cure_moves = []
-        for move_name in cure_move_names:
-            move = self.moves_client.get_move_by_name(move_name)
-            if move:
-                cure_moves.append(move)
+        moves = self.moves_client.get_all()
+        cures.extend(
+            {
+                "type": "move",
+                "name": moves[position].get("name"),
+                "description": moves[position].get("description"),
+                "pp": moves[position].get("pp"),
+                "cures": [status]
+            }
+            for position, _ in self.moves_client.get_effect_table("move_status_cures").get(status)
+        )
 
-        return cure_moves
+        abilities = self.abilities_client.get_all()
+        cures.extend(
+            self._ability_cure(abilities[position], status)
+            for position, _ in self.abilities_client.get_effect_table("ability_status_cures").get(status)
+        )
 
-    def _get_item_status_effects(self, item: Dict[str, Any]) -> List[str]:
-        """
-        Get status effects cured by an item.
-
-        Args:
-            item: Item data
+        return cures
 
-        Returns:
-            List of cured status conditions
-        """
-        cured_status = []
-        item_name = item.get("name", "").lower()
-        description = item.get("description", "").lower()
-
-        if "antidote" in item_name or "poison" in description:
-            cured_status.append("poison")
-            cured_status.append("toxic")
-        if "burn" in item_name or "burn" in description:
-            cured_status.append("burn")
-        if "ice heal" in item_name or "freeze" in description:
-            cured_status.append("freeze")
-        if "awakening" in item_name or "sleep" in description:
-            cured_status.append("sleep")
-        if "paral" in item_name or "paralysis" in description:
-            cured_status.append("paralysis")
-        if "heal" in item_name or "cure" in description:
-            cured_status.extend(["poison", "toxic", "burn", "freeze", "sleep", "paralysis", "confusion"])
-
-        return cured_status
-
-    def _get_move_cure_effects(self, move: Dict[str, Any]) -> List[str]:
+    def _item_cures(self, status: str) -> List[Dict[str, Any]]:
         """
-        Get status effects cured by a move.
+        Get the items that cure a status condition.
 
         Args:
-            move: Move data
+            status: Status condition name
 
         Returns:
-            List of cured status conditions
+            List of item cure entries
         """
-        cured_status = []
-        move_name = move.get("name", "").lower()
-        _description = move.get("description", "").lower()
-
-        if any(word in move_name for word in ["refresh", "heal bell", "aromatherapy"]):
-            cured_status.extend(["poison", "toxic", "burn", "freeze", "sleep", "paralysis", "confusion"])
-        if "purify" in move_name:
-            cured_status.extend(["poison", "toxic", "burn", "freeze", "sleep", "paralysis", "confusion"])
-
-        return cured_status
+        items = self.items_client.get_all()
+        return [
+            {
+                "type": "item",
+                "name": items[position].get("name"),
+                "description": items[position].get("description"),
+                "cost": items[position].get("cost"),
+                "cures": [status]
+            }
+            for position, _ in self.items_client.get_effect_table("item_status_cures").get(status)
+        ]
 
-    def _ability_cures_status(self, ability_name: str, description: str, status: str) -> bool:
+    def _ability_cure(self, ability: Dict[str, Any], status: str) -> Dict[str, Any]:
         """
-        Check if an ability can cure or prevent a status.
+        Describe an ability as a status cure.
 
         Args:
-            ability_name: Name of the ability
-            description: Ability description
-            status: Status condition
+            ability: Ability data
+            status: Status condition it cures
 
         Returns:
-            True if ability cures the status
+            Cure entry
         """
-        # Hydration - cures status in rain
-        if "hydration" in ability_name and "rain" in description:
-            return True
-
-        # Natural Cure - cures status when switching out
-        if "natural cure" in ability_name:
-            return True
-
-        # Shed Skin - may cure status each turn
-        if "shed skin" in ability_name:
-            return True
-
-        return False
+        return {
+            "type": "ability",
+            "name": ability.get("name"),
+            "description": ability.get("description"),
+            "cures": [status]
+        }
 
     def analyze_status_strategy(self, team: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -571,82 +335,37 @@ class StatusEffectsClient(BaseDataClient):
             "recommended_status_strategy": ""
         }
 
-        # Analyze team immunities
-        for status in ["poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion"]:
-            immunities = self.get_status_immunities(status)
-            team_immunities = []
-
-            for immunity in immunities:
-                if immunity["type"] == "ability":
-                    for revomon in team:
-                        if (revomon.get("ability1") == immunity["name"] or
-                            revomon.get("ability2") == immunity["name"] or
-                            revomon.get("abilityh") == immunity["name"]):
-                            team_immunities.append({
-                                "revomon": revomon.get("name"),
-                                "immunity": immunity
-                            })
-                            break
-                elif immunity["type"] == "type":
-                    for revomon in team:
-                        if (revomon.get("type1") in immunity.get("types", []) or
-                            revomon.get("type2") in immunity.get("types", [])):
-                            team_immunities.append({
-                                "revomon": revomon.get("name"),
-                                "immunity": immunity
-                            })
-                            break
-
+        # Each analysis joins the team against the effect tables; moves would
+        # need RevomonMovesClient integration to know who can learn them
+        abilities = self.abilities_client.get_all()
+        immunity_table = self.abilities_client.get_effect_table("ability_status_immunities")
+        causer_table = self.abilities_client.get_effect_table("ability_status_causes")
+        cure_table = self.abilities_client.get_effect_table("ability_status_cures")
+
+        for status in TEAM_STATUSES:
+            team_immunities = [
+                {"revomon": revomon.get("name"), "immunity": self._ability_immunity(ability, status)}
+                for revomon, ability, _ in immunity_table.join(abilities, team, status)
+            ]
+            for immunity in self._get_type_status_immunities(status):
+                types = immunity["types"]
+                revomon = next((revomon for revomon in team
+                                if revomon.get("type1") in types or revomon.get("type2") in types), None)
+                if revomon is not None:
+                    team_immunities.append({"revomon": revomon.get("name"), "immunity": immunity})
             strategy["team_immunities"][status] = team_immunities
 
-        # Analyze team status causers
-        for status in ["poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion"]:
-            causers = self.get_status_causers(status)
-            team_causers = []
-
-            for causer in causers:
-                if causer["type"] == "move":
-                    # Check if team can learn this move
-                    for revomon in team:
-                        # This would need RevomonMovesClient integration
-                        pass
-                elif causer["type"] == "ability":
-                    for revomon in team:
-                        if (revomon.get("ability1") == causer["name"] or
-                            revomon.get("ability2") == causer["name"] or
-                            revomon.get("abilityh") == causer["name"]):
-                            team_causers.append({
-                                "revomon": revomon.get("name"),
-                                "causer": causer
-                            })
-                            break
-
-            strategy["team_causers"][status] = team_causers
-
-        # Analyze team cures
-        for status in ["poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion"]:
-            cures = self.get_status_cures(status)
-            team_cures = []
-
-            for cure in cures:
-                if cure["type"] == "item":
-                    team_cures.append(cure)
-                elif cure["type"] == "move":
-                    # Check if team can learn this move
-                    for revomon in team:
-                        # This would need RevomonMovesClient integration
-                        pass
-                elif cure["type"] == "ability":
-                    for revomon in team:
-                        if (revomon.get("ability1") == cure["name"] or
-                            revomon.get("ability2") == cure["name"] or
-                            revomon.get("abilityh") == cure["name"]):
-                            team_cures.append({
-                                "revomon": revomon.get("name"),
-                                "cure": cure
-                            })
-                            break
+            strategy["team_causers"][status] = [
+                {"revomon": revomon.get("name"), "causer": self._ability_causer(ability, status, effect)}
+                for revomon, ability, effect in causer_table.join(abilities, team, status)
+            ]
 
+            # Items are available to every team
+            team_cures = self._item_cures(status)
+            team_cures.extend(
+                {"revomon": revomon.get("name"), "cure": self._ability_cure(ability, status)}
+                for revomon, ability, _ in cure_table.join(abilities, team, status)
+            )
             strategy["team_cures"][status] = team_cures
 
         # Calculate vulnerabilities
@@ -669,7 +388,7 @@ class StatusEffectsClient(BaseDataClient):
         """
         vulnerabilities = {}
 
-        for status in ["poison", "toxic", "paralysis", "sleep", "freeze", "burn", "confusion"]:
+        for status in TEAM_STATUSES:
             immunities = len(strategy["team_immunities"][status])
             causers = len(strategy["team_causers"][status])
             cures = len(strategy["team_cures"][status])
@@ -0,0 +1,135 @@
+"""
+Incremental parsing of JSON array data files
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+# Default number of characters read per chunk
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_array(
+    path: Union[str, Path], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array as they are parsed.
+
+    The file is read in chunks and only the unparsed tail is buffered, so
+    memory stays proportional to the largest element rather than the file.
+
+    Args:
+        path: Path to a JSON file containing an array
+        chunk_size: Number of characters to read at a time
+
+    Yields:
+        Each element of the array, in order
+
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If the file isn't a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def skip_whitespace() -> None:
+            nonlocal buffer, pos, eof
+            while True:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if pos < len(buffer) or eof:
+                    return
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = chunk, 0, not chunk
+
+        skip_whitespace()
+        if buffer[pos:pos + 1] != "[":
+            raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+        pos += 1
+
+        skip_whitespace()
+        if buffer[pos:pos + 1] == "]":
+            return
+
+        while True:
+            # Only accept a value followed by more input, so a value cut off at
+            # the end of a chunk (e.g. a number) is never decoded early
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+
+            yield value
+            pos = end
+            skip_whitespace()
+            separator = buffer[pos:pos + 1]
+            pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos - 1)
+            skip_whitespace()
+
+
+class IndexBuilder:
+    """
+    Builds field indexes one record at a time.
+
+    Produces the same ``{field: {value: [positions]}}`` mapping as
+    ``BaseDataClient._build_index``. A field is dropped if any of its values
+    is unhashable.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        """
+        Initialize the builder.
+
+        Args:
+            fields: Fields to index
+        """
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {field: {} for field in fields}
+        self._position = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Index the next record.
+
+        Args:
+            record: The record at the next position
+        """
+        position = self._position
+        self._position += 1
+        for field, index in list(self.indexes.items()):
+            value = record.get(field)
+            try:
+                index.setdefault(value, []).append(position)
+            except TypeError:
+                del self.indexes[field]
+
+
+def project(record: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """
+    Keep only some fields of a record.
+
+    Args:
+        record: The record
+        fields: Fields to keep, or None to keep the record as is
+
+    Returns:
+        A new dict with the requested fields, or the record itself
+    """
+    if fields is None:
+        return record
+    return {field: record.get(field) for field in fields}
@@ -0,0 +1,465 @@
+"""
+Team Builder for searching the Revodex for Pareto-best teams
+
+This module provides:
+- Per-species features (type profiles, tier, stats, weather roles) as arrays
+- Pluggable team objectives scored over whole batches of teams
+- Beam search over teams, widened until a time budget runs out
+- Pareto-front selection over the teams found
+"""
+import time
+from logging import getLogger
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .abilities_client import AbilitiesClient
+from .counterdex_client import TIER_VALUES, CounterdexClient
+from .effect_tables import ABILITY_FIELDS, TYPE_WEATHER_BENEFITS, WEATHER_CONDITIONS
+from .parallel import ParallelRunner, process_instance
+from .revomon_client import RevomonClient
+from .type_profiles import TypeProfiles
+from .types_client import TypesClient
+
+logger = getLogger(__name__)
+
+# Objectives map features and a (teams, members) array of species positions
+# to one score per team, higher is better and roughly within 0..1
+Objective = Callable[["SpeciesFeatures", np.ndarray], np.ndarray]
+
+# Expanded teams per task when a beam step is scored in parallel
+TEAM_ROWS_PER_TASK = 4096
+
+
+class SpeciesFeatures:
+    """
+    Everything the team objectives need about each species, as aligned arrays.
+
+    Position ``s`` of every array describes ``names[s]``. Type matchups are
+    bitmasks from ``TypeProfiles``, so team-level features reduce with
+    bitwise operations.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        profiles: TypeProfiles,
+        tiers: Dict[str, str],
+        weather_setters: Dict[str, Sequence[str]],
+        weather_abilities: Dict[str, Sequence[str]],
+    ):
+        """
+        Compute the features.
+
+        Args:
+            records: revomon.json records
+            profiles: Type profiles
+            tiers: Counterdex tier by Revomon name
+            weather_setters: Abilities summoning each weather
+            weather_abilities: Abilities benefiting from each weather
+        """
+        self.profiles = profiles
+        self.names: Tuple[str, ...] = tuple(record.get("name") for record in records)
+        self.positions = {name: position for position, name in reversed(list(enumerate(self.names)))}
+        self.type1, self.type2 = profiles.encode(records)
+        self.offense = profiles.offense[self.type1, self.type2]
+        self.weak = profiles.weak[self.type1, self.type2]
+        self.resist = profiles.resist[self.type1, self.type2]
+        self.stat_total = np.array([record.get("stat_total") or 0 for record in records], dtype=np.float64)
+        self.tier = np.array(
+            [TIER_VALUES.get((tiers.get(name) or "").lower(), 0) for name in self.names], dtype=np.float64
+        )
+
+        self.weathers: Tuple[str, ...] = tuple(weather for weather in WEATHER_CONDITIONS if weather != "normal")
+        self.weather_setter = np.zeros((len(records), len(self.weathers)), dtype=bool)
+        self.weather_user = np.zeros((len(records), len(self.weathers)), dtype=bool)
+        for position, record in enumerate(records):
+            abilities = {record.get(field) for field in ABILITY_FIELDS} - {None}
+            types = {record.get("type1"), record.get("type2")} - {None}
+            for column, weather in enumerate(self.weathers):
+                self.weather_setter[position, column] = bool(abilities.intersection(weather_setters.get(weather, ())))
+                self.weather_user[position, column] = bool(
+                    abilities.intersection(weather_abilities.get(weather, ()))
+                    or types.intersection(TYPE_WEATHER_BENEFITS.get(weather, ()))
+                )
+
+        for array in (self.offense, self.weak, self.resist, self.stat_total, self.tier,
+                      self.weather_setter, self.weather_user):
+            array.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def coverage_objective(features: SpeciesFeatures, teams: np.ndarray) -> np.ndarray:
+    """
+    Fraction of single types the team hits super effectively with STAB moves.
+    """
+    covered = np.bitwise_or.reduce(features.offense[teams], axis=-1)
+    return np.bitwise_count(covered) / features.profiles.size
+
+
+def weakness_objective(features: SpeciesFeatures, teams: np.ndarray) -> np.ndarray:
+    """
+    Fraction of attacking types fewer than two members are weak to.
+    """
+    shared = (features.profiles.counts(features.weak[teams]) >= 2).sum(axis=-1)
+    return 1 - shared / features.profiles.size
+
+
+def tier_objective(features: SpeciesFeatures, teams: np.ndarray) -> np.ndarray:
+    """
+    Mean counterdex tier of the members, with the top tier as 1.
+    """
+    return features.tier[teams].mean(axis=-1) / max(TIER_VALUES.values())
+
+
+def stats_objective(features: SpeciesFeatures, teams: np.ndarray) -> np.ndarray:
+    """
+    Mean stat total of the members, relative to the highest in the dex.
+    """
+    return features.stat_total[teams].mean(axis=-1) / max(features.stat_total.max(), 1.0)
+
+
+def weather_objective(features: SpeciesFeatures, teams: np.ndarray) -> np.ndarray:
+    """
+    Share of members benefiting from a weather a member can summon, for the best weather.
+    """
+    if not features.weathers:
+        return np.zeros(len(teams))
+    has_setter = features.weather_setter[teams].any(axis=-2)
+    users = features.weather_user[teams].sum(axis=-2)
+    return (has_setter * users).max(axis=-1) / teams.shape[-1]
+
+
+OBJECTIVES: Dict[str, Objective] = {
+    "coverage": coverage_objective,
+    "weaknesses": weakness_objective,
+    "tier": tier_objective,
+    "stats": stats_objective,
+    "weather": weather_objective,
+}
+
+
+def pareto_front(values: np.ndarray) -> np.ndarray:
+    """
+    Find the rows no other row dominates.
+
+    A row dominates another when it is at least as good on every column and
+    better on one.
+
+    Args:
+        values: Array of shape (candidates, objectives), higher is better
+
+    Returns:
+        Boolean mask of the non-dominated rows
+    """
+    keep = np.ones(len(values), dtype=bool)
+    for row in range(len(values)):
+        if not keep[row]:
+            continue
+        dominated_by = (values >= values[row]).all(axis=1) & (values > values[row]).any(axis=1)
+        if dominated_by.any():
+            keep[row] = False
+        else:
+            # Whatever this row dominates can be skipped
+            keep &= ~((values <= values[row]).all(axis=1) & (values < values[row]).any(axis=1))
+    return keep
+
+
+class TeamBuilder:
+    """
+    Search every species for the best teams under several objectives.
+
+    Teams are grown one member at a time with beam search: every team in
+    the beam is extended by every candidate species, the extensions are
+    scored by the weighted sum of the objectives and the best ``beam_width``
+    are kept. The search is repeated with a doubled beam width until the
+    time budget runs out or the beam stops pruning anything, and the
+    Pareto front of all complete teams found is returned.
+    """
+
+    def __init__(self):
+        """Initialize the team builder with the data clients it draws features from."""
+        self.revomon_client = RevomonClient(read_only=True)
+        self.types_client = TypesClient(read_only=True)
+        self.counterdex_client = CounterdexClient(read_only=True)
+        self.abilities_client = AbilitiesClient(read_only=True)
+        self._features: Optional[SpeciesFeatures] = None
+
+        logger.info("TeamBuilder initialized")
+
+    def get_features(self) -> SpeciesFeatures:
+        """
+        Get the per-species features, computing them on first use.
+
+        Returns:
+            Features of every Revomon in revomon.json order
+        """
+        if self._features is None:
+            abilities = self.abilities_client.get_all()
+            weathers = [weather for weather in WEATHER_CONDITIONS if weather != "normal"]
+            setters, beneficiaries = (
+                {
+                    weather: [abilities[position].get("name") for position, _ in table.get(weather)]
+                    for weather in weathers
+                }
+                for table in (
+                    self.abilities_client.get_effect_table("ability_weather_generation"),
+                    self.abilities_client.get_effect_table("ability_weather_benefits"),
+                )
+            )
+            self._features = SpeciesFeatures(
+                self.revomon_client.get_all(),
+                self.types_client.get_type_profiles(),
+                {record.get("name"): record.get("tier") for record in self.counterdex_client.get_all()},
+                setters,
+                beneficiaries,
+            )
+        return self._features
+
+    def evaluate(
+        self,
+        team: Sequence[str],
+        objectives: Optional[Dict[str, Objective]] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Score a hand-picked team with the search objectives.
+
+        Args:
+            team: Revomon names
+            objectives: Objectives by name (defaults to ``OBJECTIVES``)
+            weights: Weight of each objective in the score (default 1.0)
+
+        Returns:
+            Dict with the team, its weighted score and each objective's value
+        """
+        features = self.get_features()
+        positions = [features.positions.get(name) for name in team]
+        unknown = [name for name, position in zip(team, positions) if position is None]
+        if unknown:
+            return {"error": f"Unknown Revomon: {', '.join(unknown)}"}
+        objectives = objectives or OBJECTIVES
+        values = self._objective_values(np.array([positions]), objectives)
+        return self._result(features, np.array(positions), values[0], objectives, weights)
+
+    def search(
+        self,
+        team_size: int = 6,
+        objectives: Optional[Dict[str, Objective]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        beam_width: int = 64,
+        time_budget: float = 2.0,
+        include: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        max_results: Optional[int] = 10,
+        runner: Optional[ParallelRunner] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the Pareto-best teams.
+
+        The first beam search always runs to completion, so a result is
+        returned even when it takes longer than ``time_budget``. Wider
+        searches are abandoned at the first step that starts past the
+        budget, so a wide step can overrun it slightly.
+
+        Args:
+            team_size: Members per team
+            objectives: Objectives by name (defaults to ``OBJECTIVES``)
+            weights: Weight of each objective when ranking partial teams
+                and results (default 1.0)
+            beam_width: Teams kept per step in the first search
+            time_budget: Seconds to spend widening the search
+            include: Revomon every team must contain
+            exclude: Revomon no team may contain
+            max_results: Number of teams to return, or None for the whole front
+            runner: Runner to score large beam steps on, or None to score
+                them in this process; objectives must then be module-level
+                functions so they can be sent to the workers
+
+        Returns:
+            Pareto-optimal teams, highest weighted score first; each a dict
+            with the member names, weighted score and objective values
+        """
+        deadline = time.perf_counter() + time_budget
+        features = self.get_features()
+        objectives = objectives or OBJECTIVES
+        scale = self._weights(objectives, weights)
+
+        required = sorted({features.positions[name] for name in include if name in features.positions})
+        excluded = {features.positions[name] for name in exclude if name in features.positions}
+        if len(required) > team_size:
+            raise ValueError(f"{len(required)} required members don't fit a team of {team_size}")
+        candidates = np.array(
+            [position for position in range(len(features)) if position not in excluded and position not in required],
+            dtype=np.intp,
+        )
+        if len(candidates) < team_size - len(required):
+            raise ValueError(f"Only {len(candidates)} species left to fill {team_size - len(required)} slots")
+
+        found = []
+        width = max(beam_width, 1)
+        while True:
+            beam, pruned = self._beam_search(
+                np.array([required], dtype=np.intp).reshape(1, len(required)),
+                candidates, team_size, width, objectives, scale, deadline if found else None, runner,
+            )
+            if beam is None:
+                break
+            found.append(beam)
+            if not pruned or time.perf_counter() >= deadline:
+                break
+            width *= 2
+
+        teams = np.unique(np.concatenate(found), axis=0)
+        values = self._objective_values(teams, objectives)
+        front = np.flatnonzero(pareto_front(values))
+        order = front[np.argsort(-(values[front] @ scale), kind="stable")]
+        if max_results is not None:
+            order = order[:max_results]
+        logger.info(f"Team search kept {len(front)} Pareto-optimal teams of {len(teams)} found at width {width}")
+        return [self._result(features, teams[row], values[row], objectives, weights) for row in order]
+
+    def _beam_search(
+        self,
+        start: np.ndarray,
+        candidates: np.ndarray,
+        team_size: int,
+        width: int,
+        objectives: Dict[str, Objective],
+        scale: np.ndarray,
+        deadline: Optional[float],
+        runner: Optional[ParallelRunner] = None
+    ) -> Tuple[Optional[np.ndarray], bool]:
+        """
+        Grow teams one member at a time, keeping the best partial teams.
+
+        Args:
+            start: (1, k) array with the required members
+            candidates: Species positions members are drawn from
+            team_size: Members per team
+            width: Teams kept per step
+            objectives: Objectives by name
+            scale: Weight of each objective
+            deadline: Time to give up at, or None to always finish
+            runner: Runner to score expanded teams on, or None
+
+        Returns:
+            Tuple of (complete teams, whether any step dropped teams); the
+            teams are None if the deadline passed
+        """
+        beam = start
+        pruned = False
+        while beam.shape[1] < team_size:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None, pruned
+            rows = np.repeat(beam, len(candidates), axis=0)
+            added = np.tile(candidates, len(beam))
+            fresh = ~(rows == added[:, np.newaxis]).any(axis=1)
+            # Sorting members makes reorderings of one team identical rows
+            expanded = np.unique(np.sort(np.column_stack((rows[fresh], added[fresh])), axis=1), axis=0)
+            if len(expanded) > width:
+                scores = self._batch_values(expanded, objectives, runner) @ scale
+                expanded = expanded[np.sort(np.argpartition(-scores, width - 1)[:width])]
+                pruned = True
+            beam = expanded
+        return beam, pruned
+
+    def _objective_values(self, teams: np.ndarray, objectives: Dict[str, Objective]) -> np.ndarray:
+        """
+        Evaluate every objective on a batch of teams.
+
+        Args:
+            teams: (teams, members) array of species positions
+            objectives: Objectives by name
+
+        Returns:
+            Array of shape (teams, objectives)
+        """
+        features = self.get_features()
+        return np.column_stack([
+            np.broadcast_to(np.asarray(objective(features, teams), dtype=np.float64), (len(teams),))
+            for objective in objectives.values()
+        ])
+
+    def _batch_values(
+        self,
+        teams: np.ndarray,
+        objectives: Dict[str, Objective],
+        runner: Optional[ParallelRunner]
+    ) -> np.ndarray:
+        """
+        Evaluate every objective on a batch of teams, in row blocks on a runner if given.
+
+        Args:
+            teams: (teams, members) array of species positions
+            objectives: Objectives by name
+            runner: Runner to evaluate the blocks on, or None
+
+        Returns:
+            Array of shape (teams, objectives)
+        """
+        if runner is None or len(teams) <= TEAM_ROWS_PER_TASK:
+            return self._objective_values(teams, objectives)
+        blocks = [
+            (objectives, teams[start:start + TEAM_ROWS_PER_TASK])
+            for start in range(0, len(teams), TEAM_ROWS_PER_TASK)
+        ]
+        return np.concatenate(runner.map(_team_block_values, blocks))
+
+    @staticmethod
+    def _weights(objectives: Dict[str, Objective], weights: Optional[Dict[str, float]]) -> np.ndarray:
+        """
+        Get the weight of each objective, in objective order.
+
+        Args:
+            objectives: Objectives by name
+            weights: Weights by objective name (default 1.0)
+
+        Returns:
+            Float array of weights
+        """
+        weights = weights or {}
+        return np.array([weights.get(name, 1.0) for name in objectives], dtype=np.float64)
+
+    def _result(
+        self,
+        features: SpeciesFeatures,
+        team: np.ndarray,
+        values: np.ndarray,
+        objectives: Dict[str, Objective],
+        weights: Optional[Dict[str, float]]
+    ) -> Dict[str, Any]:
+        """
+        Describe a scored team.
+
+        Args:
+            features: Species features
+            team: Species positions
+            values: The team's objective values
+            objectives: Objectives by name
+            weights: Weights by objective name
+
+        Returns:
+            Dict with "team", "score" and "objectives"
+        """
+        return {
+            "team": [features.names[position] for position in team.tolist()],
+            "score": float(values @ self._weights(objectives, weights)),
+            "objectives": dict(zip(objectives, values.tolist()))
+        }
+
+
+def _team_block_values(block: Tuple[Dict[str, Objective], np.ndarray]) -> np.ndarray:
+    """
+    Evaluate the objectives on a block of teams of a parallel beam step.
+
+    Args:
+        block: (objectives, teams) pair
+
+    Returns:
+        Array of shape (teams, objectives)
+    """
+    objectives, teams = block
+    return process_instance(TeamBuilder)._objective_values(teams, objectives)
@@ -0,0 +1,203 @@
+"""
+Tokenized inverted index over text fields of a dataset
+"""
+import re
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+# Tokens are runs of lower-case letters and digits
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Joins a record's fields so substring matches can't span two fields
+_FIELD_SEPARATOR = "\x00"
+
+# Substring queries cached per index before the cache is reset
+_CACHE_LIMIT = 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lower-case word tokens.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of tokens in order
+    """
+    return _TOKEN.findall(text.lower())
+
+
+class TextIndex:
+    """
+    Inverted index over one or more text fields of every record.
+
+    Text is lower-cased once when the index is built. Each token maps to the
+    sorted positions of the records containing it and to the token offsets
+    within each record, which serve boolean AND/OR token queries and phrase
+    queries.
+
+    ``contains`` keeps the plain substring semantics of ``keyword in text``
+    (so "use" still matches "caused"): the vocabulary is scanned for tokens
+    containing each word of the keyword, their posting lists give the
+    candidate records, and only the candidates are checked against the text.
+    Results are cached per keyword and returned as tuples, since the index
+    is shared by every client reading the dataset.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]], fields: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            records: Records to index, in dataset order
+            fields: Text fields to index
+        """
+        self.fields = tuple(fields)
+        # Lower-cased text of each field, per record
+        self.lowered: List[Tuple[str, ...]] = [
+            tuple(str(record.get(field) or "").lower() for field in self.fields)
+            for record in records
+        ]
+        self._texts = [_FIELD_SEPARATOR.join(texts) for texts in self.lowered]
+
+        self.postings: Dict[str, List[int]] = {}
+        self.offsets: Dict[str, Dict[int, List[int]]] = {}
+        for position, texts in enumerate(self.lowered):
+            offset = 0
+            for text in texts:
+                for token in _TOKEN.findall(text):
+                    offsets = self.offsets.setdefault(token, {})
+                    if position not in offsets:
+                        offsets[position] = []
+                        self.postings.setdefault(token, []).append(position)
+                    offsets[position].append(offset)
+                    offset += 1
+                # Leave a gap so phrases can't span two fields
+                offset += 1
+
+        self._contains_cache: Dict[str, Tuple[int, ...]] = {}
+        self._word_cache: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.lowered)
+
+    def search(self, words: Iterable[str], match_all: bool = True) -> List[int]:
+        """
+        Find records containing whole-word tokens.
+
+        Args:
+            words: Words to look for (tokenized the same way as the text)
+            match_all: If True records must contain every word (AND),
+                otherwise any of them (OR)
+
+        Returns:
+            Matching record positions, ascending
+        """
+        tokens = [token for word in words for token in tokenize(word)]
+        if not tokens:
+            return []
+        postings = sorted((self.postings.get(token, []) for token in tokens), key=len)
+        if match_all:
+            result = set(postings[0])
+            for posting in postings[1:]:
+                if not result:
+                    break
+                result.intersection_update(posting)
+        else:
+            result = set().union(*postings)
+        return sorted(result)
+
+    def phrase(self, text: str) -> List[int]:
+        """
+        Find records containing a sequence of whole-word tokens.
+
+        Args:
+            text: The phrase
+
+        Returns:
+            Matching record positions, ascending
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        matches = []
+        for position in self.search(tokens):
+            starts = set(self.offsets[tokens[0]][position])
+            for index, token in enumerate(tokens[1:], start=1):
+                starts &= {offset - index for offset in self.offsets[token][position]}
+                if not starts:
+                    break
+            if starts:
+                matches.append(position)
+        return matches
+
+    def contains(self, keyword: str) -> Tuple[int, ...]:
+        """
+        Find records whose text contains a substring, ignoring case.
+
+        Matches exactly the records for which ``keyword.lower() in text`` is
+        true for one of the indexed fields.
+
+        Args:
+            keyword: Substring to look for
+
+        Returns:
+            Matching record positions, ascending
+        """
+        keyword = keyword.lower()
+        cached = self._contains_cache.get(keyword)
+        if cached is not None:
+            return cached
+
+        words = _TOKEN.findall(keyword)
+        if words:
+            # Each word of the keyword lies inside some token of a matching text
+            candidates = set(self._positions_with_word(words[0]))
+            for word in words[1:]:
+                candidates.intersection_update(self._positions_with_word(word))
+            candidates = sorted(candidates)
+        else:
+            candidates = range(len(self._texts))
+
+        texts = self._texts
+        result = tuple(position for position in candidates if keyword in texts[position])
+        if len(self._contains_cache) >= _CACHE_LIMIT:
+            self._contains_cache.clear()
+        self._contains_cache[keyword] = result
+        return result
+
+    def contains_any(self, keywords: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Find records whose text contains any of several substrings.
+
+        Args:
+            keywords: Substrings to look for
+
+        Returns:
+            Matching record positions, ascending
+        """
+        result: Set[int] = set()
+        for keyword in keywords:
+            result.update(self.contains(keyword))
+        return tuple(sorted(result))
+
+    def _positions_with_word(self, word: str) -> Set[int]:
+        """
+        Get the records with a token containing a word.
+
+        Args:
+            word: A single token-shaped word
+
+        Returns:
+            Set of record positions
+        """
+        positions = self._word_cache.get(word)
+        if positions is None:
+            positions = set()
+            for token, posting in self.postings.items():
+                if word in token:
+                    positions.update(posting)
+            if len(self._word_cache) >= _CACHE_LIMIT:
+                self._word_cache.clear()
+            self._word_cache[word] = positions
+        return positions
@@ -0,0 +1,195 @@
+"""
+Dense type-effectiveness matrix built from types.json
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Fields of a types.json record that aren't attacking types
+METADATA_FIELDS = frozenset({"types_str", "img_url", "type1", "type2"})
+
+# Code used for a missing or unknown type
+NO_TYPE = -1
+
+
+class TypeChart:
+    """
+    Effectiveness multipliers as a (defending combination x attacking type) matrix.
+
+    Type names are mapped to integer codes: attacking types index columns in
+    the order they appear in types.json, and every types_str indexes a row.
+    ``single`` holds the rows of the single types reordered by type code,
+    so the multiplier for any pair of defending types is the product of two
+    of its rows. Single lookups are O(1) and whole arrays of matchups can be
+    evaluated in one vectorized call.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        """
+        Build the chart.
+
+        Args:
+            records: types.json records
+        """
+        self.attacking_types: Tuple[str, ...] = tuple(
+            field for field in (records[0] if records else {}) if field not in METADATA_FIELDS
+        )
+        self.type_codes: Dict[str, int] = {name: code for code, name in enumerate(self.attacking_types)}
+        self.combinations: Tuple[str, ...] = tuple(record["types_str"] for record in records)
+        self.combination_codes: Dict[str, int] = {
+            name: row for row, name in enumerate(self.combinations)
+        }
+
+        self.matrix = np.array(
+            [[record.get(name, 1.0) for name in self.attacking_types] for record in records],
+            dtype=np.float64,
+        ).reshape(len(records), len(self.attacking_types))
+
+        # Rows for single defending types, indexed by type code; unlisted types are neutral
+        self.single = np.ones((len(self.attacking_types), len(self.attacking_types)))
+        for record, row in zip(records, self.matrix):
+            if record.get("type2") is None and record.get("type1") in self.type_codes:
+                self.single[self.type_codes[record["type1"]]] = row
+
+        # Single-type table with a trailing neutral row and column, indexed by NO_TYPE
+        size = len(self.attacking_types)
+        self._padded_single = np.ones((size + 1, size + 1))
+        self._padded_single[:size, :size] = self.single
+
+        for array in (self.matrix, self.single, self._padded_single):
+            array.flags.writeable = False
+        # Nested lists make scalar lookups cheaper than indexing the arrays
+        self._rows: List[List[float]] = self.matrix.tolist()
+        self._single_rows: List[List[float]] = self.single.tolist()
+
+    def effectiveness(self, attacker_type: str, defender: str) -> Optional[float]:
+        """
+        Get the multiplier of an attacking type against a defending combination.
+
+        Args:
+            attacker_type: The attacking type
+            defender: The defending type combination (e.g. "fire" or "battle/ice")
+
+        Returns:
+            The multiplier (1.0 for an unknown attacking type), or None if the
+            defending combination is unknown
+        """
+        row = self.combination_codes.get(defender)
+        if row is None:
+            return None
+        column = self.type_codes.get(attacker_type)
+        return 1.0 if column is None else self._rows[row][column]
+
+    def multiplier(self, attacker_type: str, type1: Optional[str], type2: Optional[str] = None) -> float:
+        """
+        Get the multiplier of an attacking type against a defender's types.
+
+        Unknown or missing types count as neutral.
+
+        Args:
+            attacker_type: The attacking type
+            type1: The defender's primary type
+            type2: The defender's secondary type, if any
+
+        Returns:
+            The combined multiplier
+        """
+        column = self.type_codes.get(attacker_type)
+        if column is None:
+            return 1.0
+        result = 1.0
+        code1 = self.type_codes.get(type1)
+        if code1 is not None:
+            result = self._single_rows[code1][column]
+        if type2 is not None and type2 != type1:
+            code2 = self.type_codes.get(type2)
+            if code2 is not None:
+                result *= self._single_rows[code2][column]
+        return result
+
+    def encode(self, type_names: Iterable[Optional[str]]) -> np.ndarray:
+        """
+        Convert type names to codes.
+
+        Args:
+            type_names: Type names, None for a missing type
+
+        Returns:
+            Integer array of codes, ``NO_TYPE`` for missing or unknown types
+        """
+        codes = self.type_codes
+        return np.fromiter((codes.get(name, NO_TYPE) for name in type_names), dtype=np.int64)
+
+    def multipliers(
+        self,
+        attacker_codes: np.ndarray,
+        type1_codes: np.ndarray,
+        type2_codes: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized ``multiplier`` over arrays of type codes.
+
+        The arrays broadcast against each other, so e.g. a column of
+        attacking types against a row of defenders yields a full grid.
+
+        Args:
+            attacker_codes: Attacking type codes
+            type1_codes: Defenders' primary type codes
+            type2_codes: Defenders' secondary type codes (``NO_TYPE`` if none)
+
+        Returns:
+            Array of combined multipliers
+        """
+        attacker_codes = np.asarray(attacker_codes)
+        type1_codes = np.asarray(type1_codes)
+        table = self._padded_single
+        result = table[type1_codes, attacker_codes]
+        if type2_codes is not None:
+            type2_codes = np.asarray(type2_codes)
+            second = table[type2_codes, attacker_codes]
+            result = result * np.where(type2_codes == type1_codes, 1.0, second)
+        return result
+
+    def row(self, defender: str) -> Optional[np.ndarray]:
+        """
+        Get the multipliers of every attacking type against a combination.
+
+        Args:
+            defender: The defending type combination
+
+        Returns:
+            Array in ``attacking_types`` order, or None if the combination is unknown
+        """
+        row = self.combination_codes.get(defender)
+        return None if row is None else self.matrix[row]
+
+    def attacking_types_where(
+        self, defender: str, mask: Callable[[np.ndarray], np.ndarray]
+    ) -> List[str]:
+        """
+        Get the attacking types whose multiplier against a combination satisfies a test.
+
+        Args:
+            defender: The defending type combination
+            mask: Function taking the row array and returning a boolean mask
+
+        Returns:
+            Matching attacking types in ``attacking_types`` order
+        """
+        row = self.row(defender)
+        if row is None:
+            return []
+        return [self.attacking_types[column] for column in np.flatnonzero(mask(row))]
+
+
+def build_type_chart(dataset) -> TypeChart:
+    """
+    Build the type chart for a types.json dataset.
+
+    Args:
+        dataset: The loaded dataset
+
+    Returns:
+        Chart over the dataset's records
+    """
+    return TypeChart(dataset.records)
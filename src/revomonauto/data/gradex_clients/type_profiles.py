@@ -0,0 +1,221 @@
+"""
+Offensive and defensive type profiles as bitmasks, for scoring teams in bulk
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .type_chart import TypeChart
+
+
+class TypeProfiles:
+    """
+    Bitmask profile of every type combination.
+
+    Bit ``t`` of a mask stands for type code ``t`` of the chart. Tables are
+    indexed by ``[type1 code, type2 code]``, with ``NO_TYPE`` (-1) landing
+    on a trailing row and column for a missing type, so the chart codes of
+    a Revomon's types index its profile directly:
+
+    - ``offense``: single defending types one of its own types (its STAB
+      moves) hits super effectively
+    - ``weak``: attacking types either of its types is weak to
+    - ``resist``: attacking types its combined typing takes less than
+      neutral damage from, immunities included
+    - ``immune``: attacking types its combined typing takes no damage from
+
+    Because profiles are plain integers, a team's coverage is an OR over its
+    members and a batch of teams is scored with a few array operations.
+    """
+
+    def __init__(self, chart: TypeChart):
+        """
+        Build the profiles.
+
+        Args:
+            chart: Type chart
+        """
+        size = len(chart.attacking_types)
+        if size > 64:
+            raise ValueError(f"Type profiles hold at most 64 types, got {size}")
+        self.chart = chart
+        self.size = size
+        self.bits = np.left_shift(np.uint64(1), np.arange(size, dtype=np.uint64))
+
+        # Per single type (plus a trailing empty entry for NO_TYPE)
+        super_effective = chart.single >= 2.0
+        offense_by_type = np.zeros(size + 1, dtype=np.uint64)
+        offense_by_type[:size] = self._pack(super_effective.T)
+        weak_by_type = np.zeros(size + 1, dtype=np.uint64)
+        weak_by_type[:size] = self._pack(super_effective)
+
+        codes = np.arange(-1, size)
+        type1, type2 = codes[:, np.newaxis], codes[np.newaxis, :]
+        multipliers = chart.multipliers(
+            np.arange(size), type1[:, :, np.newaxis], type2[:, :, np.newaxis]
+        )
+        shape = (size + 1, size + 1)
+        self.offense = np.zeros(shape, dtype=np.uint64)
+        self.weak = np.zeros(shape, dtype=np.uint64)
+        self.resist = np.zeros(shape, dtype=np.uint64)
+        self.immune = np.zeros(shape, dtype=np.uint64)
+        # Assigning through the codes puts NO_TYPE on the trailing row and column
+        self.offense[type1, type2] = offense_by_type[type1] | offense_by_type[type2]
+        self.weak[type1, type2] = weak_by_type[type1] | weak_by_type[type2]
+        self.resist[type1, type2] = self._pack(multipliers < 1.0)
+        self.immune[type1, type2] = self._pack(multipliers == 0.0)
+
+        for array in (self.bits, self.offense, self.weak, self.resist, self.immune):
+            array.flags.writeable = False
+
+    def _pack(self, flags: np.ndarray) -> np.ndarray:
+        """
+        Pack the last axis of a boolean array into masks.
+
+        Args:
+            flags: Boolean array whose last axis runs over type codes
+
+        Returns:
+            uint64 array with the last axis removed
+        """
+        return np.bitwise_or.reduce(np.where(flags, self.bits, np.uint64(0)), axis=-1)
+
+    def encode(self, team: Iterable[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the type codes of a team.
+
+        Args:
+            team: Revomon records
+
+        Returns:
+            Tuple of (type1, type2) code arrays
+        """
+        team = list(team)
+        return (
+            self.chart.encode(revomon.get("type1") for revomon in team),
+            self.chart.encode(revomon.get("type2") for revomon in team),
+        )
+
+    def names(self, mask: int) -> List[str]:
+        """
+        Get the types in a mask.
+
+        Args:
+            mask: Bitmask of type codes
+
+        Returns:
+            Type names in chart order
+        """
+        mask = int(mask)
+        return [name for code, name in enumerate(self.chart.attacking_types) if mask >> code & 1]
+
+    def counts(self, masks: np.ndarray) -> np.ndarray:
+        """
+        Count, per type, how many masks along the last axis contain it.
+
+        Args:
+            masks: uint64 array of shape (..., members)
+
+        Returns:
+            Integer array of shape (..., types)
+        """
+        return ((masks[..., np.newaxis] & self.bits) != 0).sum(axis=-2)
+
+    def coverage(self, type1: np.ndarray, type2: np.ndarray) -> np.ndarray:
+        """
+        Get the single types teams hit super effectively with STAB moves.
+
+        Args:
+            type1: Primary type codes of shape (..., members)
+            type2: Secondary type codes of the same shape
+
+        Returns:
+            uint64 masks with the members axis reduced
+        """
+        return np.bitwise_or.reduce(self.offense[type1, type2], axis=-1)
+
+    def resistances(self, type1: np.ndarray, type2: np.ndarray) -> np.ndarray:
+        """
+        Get the attacking types at least one member of each team resists.
+
+        Args:
+            type1: Primary type codes of shape (..., members)
+            type2: Secondary type codes of the same shape
+
+        Returns:
+            uint64 masks with the members axis reduced
+        """
+        return np.bitwise_or.reduce(self.resist[type1, type2], axis=-1)
+
+    def shared_weaknesses(self, type1: np.ndarray, type2: np.ndarray, min_members: int = 2) -> np.ndarray:
+        """
+        Get the attacking types several members of each team are weak to.
+
+        Args:
+            type1: Primary type codes of shape (..., members)
+            type2: Secondary type codes of the same shape
+            min_members: Weak members needed for a type to count
+
+        Returns:
+            uint64 masks with the members axis reduced
+        """
+        shared = self.counts(self.weak[type1, type2]) >= min_members
+        return self._pack(shared)
+
+    def score_teams(
+        self,
+        type1: np.ndarray,
+        type2: np.ndarray,
+        min_members: int = 2,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of teams' type matchups.
+
+        Args:
+            type1: Primary type codes of shape (teams, members)
+            type2: Secondary type codes of the same shape
+            min_members: Weak members for a weakness to count as shared
+
+        Returns:
+            Dict of arrays with one entry per team: "coverage" (single types
+            hit super effectively), "shared_weaknesses" (types at least
+            ``min_members`` members are weak to) and "unresisted" (types no
+            member resists)
+        """
+        type1, type2 = np.asarray(type1), np.asarray(type2)
+        resisted = self.resistances(type1, type2)
+        return {
+            "coverage": np.bitwise_count(self.coverage(type1, type2)).astype(np.int64),
+            "shared_weaknesses": np.bitwise_count(self.shared_weaknesses(type1, type2, min_members)).astype(np.int64),
+            "unresisted": self.size - np.bitwise_count(resisted).astype(np.int64),
+        }
+
+
+def team_codes(
+    profiles: TypeProfiles,
+    teams: Sequence[Sequence[Dict[str, Any]]],
+    size: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode teams as rectangular code arrays.
+
+    Shorter teams are padded with ``NO_TYPE`` members, which have empty
+    profiles and so don't change any score.
+
+    Args:
+        profiles: Type profiles
+        teams: Teams of Revomon records
+        size: Members per row (defaults to the largest team)
+
+    Returns:
+        Tuple of (type1, type2) arrays of shape (teams, size)
+    """
+    if size is None:
+        size = max((len(team) for team in teams), default=0)
+    type1 = np.full((len(teams), size), -1, dtype=np.int64)
+    type2 = np.full((len(teams), size), -1, dtype=np.int64)
+    for row, team in enumerate(teams):
+        codes1, codes2 = profiles.encode(team)
+        type1[row, :len(codes1)] = codes1
+        type2[row, :len(codes2)] = codes2
+    return type1, type2
@@ -1,10 +1,14 @@
 """
 Client for accessing Revomon types data
 """
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from .base_client import BaseDataClient
 from logging import getLogger
 
+if TYPE_CHECKING:
+    from .type_chart import TypeChart
+    from .type_profiles import TypeProfiles
+
 logger = getLogger(__name__)
 
 
@@ -17,10 +21,15 @@ class TypesClient(BaseDataClient):
     - type1: Primary type
     - type2: Secondary type (null if single type)
     - effectiveness multipliers for all types
+
+    Effectiveness queries are answered from a TypeChart matrix built once
+    per dataset.
     """
 
-    def __init__(self):
-        super().__init__("src/revomonauto/data/gradex_jsons/types.json")
+    indexed_fields = ("type1", "type2")
+
+    def __init__(self, read_only: bool = False):
+        super().__init__("src/revomonauto/data/gradex_jsons/types.json", read_only=read_only)
 
     def get_primary_key_field(self) -> str:
         return "types_str"
@@ -64,7 +73,7 @@ class TypesClient(BaseDataClient):
             List of dual type records
         """
         self.load_data()
-        return [record for record in self._data if record.get("type2") is not None]
+        return [self._emit(record) for record in self._data if record.get("type2") is not None]
 
     def get_types_by_element(self, element_type: str) -> List[Dict[str, Any]]:
         """
@@ -77,8 +86,43 @@ class TypesClient(BaseDataClient):
             List of types containing the specified element
         """
         self.load_data()
-        return [record for record in self._data
-                if record.get("type1") == element_type or record.get("type2") == element_type]
+        positions = set(self._lookup("type1", element_type) or ()) | set(
+            self._lookup("type2", element_type) or ())
+        return [self._emit(self._data[position]) for position in sorted(positions)]
+
+    def get_type_chart(self) -> "TypeChart":
+        """
+        Get the dense type-effectiveness matrix.
+
+        The chart is built once per loaded dataset and shared by every
+        TypesClient.
+
+        Returns:
+            The type chart
+        """
+        from .type_chart import TypeChart, build_type_chart
+
+        self.load_data()
+        if self._dataset is None:
+            return TypeChart(self._data)
+        return self._dataset.derived("type_chart", build_type_chart)
+
+    def get_type_profiles(self) -> "TypeProfiles":
+        """
+        Get the bitmask profile of every type combination.
+
+        The profiles are built once per loaded dataset and shared by every
+        TypesClient.
+
+        Returns:
+            The type profiles
+        """
+        from .type_profiles import TypeProfiles
+
+        chart = self.get_type_chart()
+        if self._dataset is None:
+            return TypeProfiles(chart)
+        return self._dataset.derived("type_profiles", lambda dataset: TypeProfiles(chart))
 
     def get_effectiveness_against(self, attacker_type: str, defender_type: str) -> Optional[float]:
         """
@@ -92,13 +136,7 @@ class TypesClient(BaseDataClient):
             Effectiveness multiplier (0.0 = no effect, 0.5 = not very effective,
             1.0 = normal, 2.0 = super effective, 4.0 = very super effective)
         """
-        record = self.get_type_effectiveness(defender_type)
-        if not record:
-            return None
-
-        # Get effectiveness of attacker_type against defender_type
-        # The record contains effectiveness values for all types
-        return record.get(attacker_type, 1.0)
+        return self.get_type_chart().effectiveness(attacker_type, defender_type)
 
     def get_super_effective_types(self, defender_type: str) -> List[str]:
         """
@@ -110,19 +148,7 @@ class TypesClient(BaseDataClient):
         Returns:
             List of type combinations that are super effective
         """
-        record = self.get_type_effectiveness(defender_type)
-        if not record:
-            return []
-
-        super_effective = []
-        for type_name, effectiveness in record.items():
-            # Skip metadata fields
-            if type_name in ["types_str", "img_url", "type1", "type2"]:
-                continue
-            if effectiveness >= 2.0:
-                super_effective.append(type_name)
-
-        return super_effective
+        return self.get_type_chart().attacking_types_where(defender_type, lambda row: row >= 2.0)
 
     def get_types_weak_to(self, defender_type: str) -> List[str]:
         """
@@ -134,19 +160,9 @@ class TypesClient(BaseDataClient):
         Returns:
             List of type combinations that the defender is weak against
         """
-        record = self.get_type_effectiveness(defender_type)
-        if not record:
-            return []
-
-        weak_to = []
-        for type_name, effectiveness in record.items():
-            # Skip metadata fields
-            if type_name in ["types_str", "img_url", "type1", "type2"]:
-                continue
-            if 0 < effectiveness < 1.0:
-                weak_to.append(type_name)
-
-        return weak_to
+        return self.get_type_chart().attacking_types_where(
+            defender_type, lambda row: (row > 0) & (row < 1.0)
+        )
 
     def get_immune_types(self, defender_type: str) -> List[str]:
         """
@@ -158,16 +174,4 @@ class TypesClient(BaseDataClient):
         Returns:
             List of type combinations that the defender is immune to
         """
-        record = self.get_type_effectiveness(defender_type)
-        if not record:
-            return []
-
-        immune_to = []
-        for type_name, effectiveness in record.items():
-            # Skip metadata fields
-            if type_name in ["types_str", "img_url", "type1", "type2"]:
-                continue
-            if effectiveness == 0.0:
-                immune_to.append(type_name)
-
-        return immune_to
+        return self.get_type_chart().attacking_types_where(defender_type, lambda row: row == 0.0)
@@ -8,8 +8,9 @@ This client provides:
 - Weather strategy optimization
 - Weather counter analysis
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from .base_client import BaseDataClient
+from .effect_tables import TYPE_WEATHER_BENEFITS
 from .abilities_client import AbilitiesClient
 from .moves_client import MovesClient
 from logging import getLogger
@@ -28,12 +29,12 @@ class WeatherClient(BaseDataClient):
     - Weather counter strategies
     """
 
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         """Initialize with abilities and moves data for weather analysis."""
         # Weather is not in a separate JSON file, so we'll use abilities and moves
-        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json")
-        self.abilities_client = AbilitiesClient()
-        self.moves_client = MovesClient()
+        super().__init__("src/revomonauto/data/gradex_jsons/abilities.json", read_only=read_only)
+        self.abilities_client = AbilitiesClient(read_only=True)
+        self.moves_client = MovesClient(read_only=True)
 
         # Load all data
         self.load_data()
@@ -73,170 +74,47 @@ class WeatherClient(BaseDataClient):
         Returns:
             List of weather-generating abilities/moves
         """
-        generators = []
-
-        # Check abilities for weather generation
-        weather_abilities = self._get_weather_abilities()
-        for ability in weather_abilities:
-            ability_effects = self._get_ability_weather_effects(ability)
-            if weather in ability_effects:
-                generators.append({
-                    "type": "ability",
-                    "name": ability.get("name"),
-                    "description": ability.get("description"),
-                    "weather_generated": weather,
-                    "duration": ability_effects[weather].get("duration", "indefinite"),
-                    "conditions": ability_effects[weather].get("conditions", [])
-                })
-
-        # Check moves for weather generation
-        weather_moves = self._get_weather_moves()
-        for move in weather_moves:
-            move_effects = self._get_move_weather_effects(move)
-            if weather in move_effects:
-                generators.append({
-                    "type": "move",
-                    "name": move.get("name"),
-                    "description": move.get("description"),
-                    "weather_generated": weather,
-                    "duration": move_effects[weather].get("duration", "5 turns"),
-                    "pp": move.get("pp"),
-                    "accuracy": move.get("accuracy")
-                })
-
-        return generators
-
-    def _get_weather_abilities(self) -> List[Dict[str, Any]]:
-        """
-        Get all weather-related abilities.
-
-        Returns:
-            List of weather abilities
-        """
-        weather_abilities = []
-
-        weather_ability_names = [
-            "drizzle", "drought", "sand stream", "snow warning",
-            "chlorophyll", "solar power", "rain dish", "ice body",
-            "sand rush", "sand veil", "swift swim", "hydration"
+        abilities = self.abilities_client.get_all()
+        generators = [
+            self._ability_generator(abilities[position], weather, effect)
+            for position, effect in self.abilities_client.get_effect_table("ability_weather_generation").get(weather)
         ]
 
-        for ability_name in weather_ability_names:
-            ability = self.abilities_client.get_ability_by_name(ability_name)
-            if ability:
-                weather_abilities.append(ability)
-
-        return weather_abilities
-
-    def _get_weather_moves(self) -> List[Dict[str, Any]]:
-        """
-        Get all weather-related moves.
+        moves = self.moves_client.get_all()
+        for position, effect in self.moves_client.get_effect_table("move_weather_generation").get(weather):
+            move = moves[position]
+            generators.append({
+                "type": "move",
+                "name": move.get("name"),
+                "description": move.get("description"),
+                "weather_generated": weather,
+                "duration": effect.get("duration", "5 turns"),
+                "pp": move.get("pp"),
+                "accuracy": move.get("accuracy")
+            })
 
-        Returns:
-            List of weather moves
-        """
-        weather_moves = []
-
-        weather_move_names = [
-            "sunny day", "rain dance", "sandstorm", "hail",
-            "weather ball", "solar beam", "moonlight", "morning sun",
-            "synthesis", "thunder", "blizzard", "hydro pump"
-        ]
-
-        for move_name in weather_move_names:
-            move = self.moves_client.get_move_by_name(move_name)
-            if move:
-                weather_moves.append(move)
-
-        return weather_moves
+        return generators
 
-    def _get_ability_weather_effects(self, ability: Dict[str, Any]) -> Dict[str, Any]:
+    def _ability_generator(self, ability: Dict[str, Any], weather: str, effect: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Get weather effects for a specific ability.
+        Describe an ability as a weather generator.
 
         Args:
             ability: Ability data
+            weather: Weather it generates
+            effect: Its row in the weather generation table
 
         Returns:
-            Dict of weather effects
-        """
-        effects = {}
-        ability_name = ability.get("name", "").lower()
-        description = ability.get("description", "").lower()
-
-        # Drizzle - generates rain
-        if "drizzle" in ability_name or "rain" in description:
-            effects["rain"] = {
-                "duration": "indefinite",
-                "conditions": ["summons rain when switched in"]
-            }
-
-        # Drought - generates sun
-        if "drought" in ability_name or "sun" in description:
-            effects["sunny"] = {
-                "duration": "indefinite",
-                "conditions": ["summons harsh sunlight when switched in"]
-            }
-
-        # Sand Stream - generates sandstorm
-        if "sand stream" in ability_name or "sandstorm" in description:
-            effects["sandstorm"] = {
-                "duration": "indefinite",
-                "conditions": ["summons sandstorm when switched in"]
-            }
-
-        # Snow Warning - generates hail
-        if "snow warning" in ability_name or "hail" in description:
-            effects["hail"] = {
-                "duration": "indefinite",
-                "conditions": ["summons hail when switched in"]
-            }
-
-        return effects
-
-    def _get_move_weather_effects(self, move: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Get weather effects for a specific move.
-
-        Args:
-            move: Move data
-
-        Returns:
-            Dict of weather effects
+            Generator entry
         """
-        effects = {}
-        move_name = move.get("name", "").lower()
-        description = move.get("description", "").lower()
-
-        # Sunny Day - generates sun
-        if "sunny day" in move_name:
-            effects["sunny"] = {
-                "duration": "5 turns",
-                "conditions": ["summons harsh sunlight"]
-            }
-
-        # Rain Dance - generates rain
-        if "rain dance" in move_name:
-            effects["rain"] = {
-                "duration": "5 turns",
-                "conditions": ["summons rain"]
-            }
-
-        # Sandstorm move - generates sandstorm
-        if "sandstorm" in move_name and "summons" in description:
-            effects["sandstorm"] = {
-                "duration": "5 turns",
-                "conditions": ["summons sandstorm"]
-            }
-
-        # Hail move - generates hail
-        if "hail" in move_name and "summons" in description:
-            effects["hail"] = {
-                "duration": "5 turns",
-                "conditions": ["summons hail"]
-            }
-
-        return effects
+        return {
+            "type": "ability",
+            "name": ability.get("name"),
+            "description": ability.get("description"),
+            "weather_generated": weather,
+            "duration": effect.get("duration", "indefinite"),
+            "conditions": effect.get("conditions", [])
+        }
 
     def get_weather_beneficiaries(self, weather: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -248,108 +126,21 @@ class WeatherClient(BaseDataClient):
         Returns:
             Dict with benefiting Revomon and moves
         """
-        beneficiaries = {
-            "abilities": [],
-            "moves": [],
-            "types": []
+        weather = weather.lower()
+        abilities = self.abilities_client.get_all()
+        moves = self.moves_client.get_all()
+        return {
+            "abilities": [
+                self._emit(abilities[position])
+                for position, _ in self.abilities_client.get_effect_table("ability_weather_benefits").get(weather)
+            ],
+            "moves": [
+                self._emit(moves[position])
+                for position, _ in self.moves_client.get_effect_table("move_weather_benefits").get(weather)
+            ],
+            "types": self._get_type_weather_benefits(weather)
         }
 
-        # Check abilities that benefit from weather
-        all_abilities = self.abilities_client.get_all()
-        for ability in all_abilities:
-            ability_name = ability.get("name", "").lower()
-            description = ability.get("description", "").lower()
-
-            if self._ability_benefits_from_weather(ability_name, description, weather):
-                beneficiaries["abilities"].append(ability)
-
-        # Check moves that benefit from weather
-        all_moves = self.moves_client.get_all()
-        for move in all_moves:
-            move_name = move.get("name", "").lower()
-            description = move.get("description", "").lower()
-
-            if self._move_benefits_from_weather(move_name, description, weather):
-                beneficiaries["moves"].append(move)
-
-        # Check types that benefit from weather
-        type_benefits = self._get_type_weather_benefits(weather)
-        beneficiaries["types"] = type_benefits
-
-        return beneficiaries
-
-    def _ability_benefits_from_weather(self, ability_name: str, description: str, weather: str) -> bool:
-        """
-        Check if an ability benefits from specific weather.
-
-        Args:
-            ability_name: Name of the ability
-            description: Ability description
-            weather: Weather condition
-
-        Returns:
-            True if ability benefits from weather
-        """
-        weather_lower = weather.lower()
-
-        # Chlorophyll - speed boost in sun
-        if "chlorophyll" in ability_name and weather_lower == "sunny":
-            return True
-
-        # Solar Power - special attack boost in sun, HP drain
-        if "solar power" in ability_name and weather_lower == "sunny":
-            return True
-
-        # Swift Swim - speed boost in rain
-        if "swift swim" in ability_name and weather_lower == "rain":
-            return True
-
-        # Rain Dish - HP recovery in rain
-        if "rain dish" in ability_name and weather_lower == "rain":
-            return True
-
-        # Ice Body - HP recovery in hail
-        if "ice body" in ability_name and weather_lower == "hail":
-            return True
-
-        # Sand Rush - speed boost in sandstorm
-        if "sand rush" in ability_name and weather_lower == "sandstorm":
-            return True
-
-        return False
-
-    def _move_benefits_from_weather(self, move_name: str, description: str, weather: str) -> bool:
-        """
-        Check if a move benefits from specific weather.
-
-        Args:
-            move_name: Name of the move
-            description: Move description
-            weather: Weather condition
-
-        Returns:
-            True if move benefits from weather
-        """
-        weather_lower = weather.lower()
-
-        # Solar Beam - charges in sun, fires immediately
-        if "solar beam" in move_name and weather_lower == "sunny":
-            return True
-
-        # Thunder - accuracy increases in rain
-        if "thunder" in move_name and weather_lower == "rain":
-            return True
-
-        # Blizzard - accuracy increases in hail
-        if "blizzard" in move_name and weather_lower == "hail":
-            return True
-
-        # Weather Ball - power doubles and type changes based on weather
-        if "weather ball" in move_name:
-            return True
-
-        return False
-
     def _get_type_weather_benefits(self, weather: str) -> List[str]:
         """
         Get types that benefit from specific weather.
@@ -360,18 +151,7 @@ class WeatherClient(BaseDataClient):
         Returns:
             List of benefiting types
         """
-        benefits = []
-
-        if weather.lower() == "sunny":
-            benefits.extend(["fire", "forest"])  # Fire moves boosted, Water weakened
-        elif weather.lower() == "rain":
-            benefits.extend(["water", "electric"])  # Water moves boosted, Fire weakened
-        elif weather.lower() == "sandstorm":
-            benefits.extend(["stone", "earth"])  # Rock moves boosted
-        elif weather.lower() == "hail":
-            benefits.extend(["ice"])  # Ice moves boosted
-
-        return benefits
+        return list(TYPE_WEATHER_BENEFITS.get(weather.lower(), ()))
 
     def analyze_weather_strategy(self, team: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -389,31 +169,16 @@ class WeatherClient(BaseDataClient):
             if weather == "normal":
                 continue
 
-            # Get weather generators in the team
-            generators = self._find_weather_generators_in_team(team, weather)
+            # Join the team's abilities against the generator table; move
+            # generators would need RevomonMovesClient integration
+            team_generators = [
+                {"revomon": revomon.get("name"), "generator": generator}
+                for revomon, generator in self._find_weather_generators_in_team(team, weather)
+            ]
 
-            # Get weather beneficiaries in the team
+            # Weather beneficiaries across the game
             beneficiaries = self.get_weather_beneficiaries(weather)
 
-            # Check if team has generators for this weather
-            team_generators = []
-            for generator in generators:
-                if generator["type"] == "ability":
-                    for revomon in team:
-                        if (revomon.get("ability1") == generator["name"] or
-                            revomon.get("ability2") == generator["name"] or
-                            revomon.get("abilityh") == generator["name"]):
-                            team_generators.append({
-                                "revomon": revomon.get("name"),
-                                "generator": generator
-                            })
-                elif generator["type"] == "move":
-                    # Check if any team member can learn this move
-                    for revomon in team:
-                        # This would need RevomonMovesClient integration
-                        # For now, assume if move exists, team can use it
-                        pass
-
             # Calculate strategy score
             strategy_score = self._calculate_weather_strategy_score(
                 team, weather, team_generators, beneficiaries
@@ -437,34 +202,26 @@ class WeatherClient(BaseDataClient):
             "weather_counters": self._find_weather_counters(strategies)
         }
 
-    def _find_weather_generators_in_team(self, team: List[Dict[str, Any]], weather: str) -> List[Dict[str, Any]]:
+    def _find_weather_generators_in_team(
+        self, team: List[Dict[str, Any]], weather: str
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
         """
-        Find weather generators available in a team.
+        Find the team members with an ability generating a weather.
 
         Args:
             team: Team of Revomon
             weather: Target weather
 
         Returns:
-            List of generators available in team
+            List of (revomon, generator) pairs, one per member and ability
         """
-        generators = self.get_weather_generators(weather)
-        team_generators = []
-
-        for generator in generators:
-            if generator["type"] == "ability":
-                for revomon in team:
-                    if (revomon.get("ability1") == generator["name"] or
-                        revomon.get("ability2") == generator["name"] or
-                        revomon.get("abilityh") == generator["name"]):
-                        team_generators.append(generator)
-                        break
-            elif generator["type"] == "move":
-                # This would need RevomonMovesClient integration
-                # For now, include all move generators
-                team_generators.append(generator)
-
-        return team_generators
+        table = self.abilities_client.get_effect_table("ability_weather_generation")
+        return [
+            (revomon, self._ability_generator(ability, weather, effect))
+            for revomon, ability, effect in table.join(
+                self.abilities_client.get_all(), team, weather, first_only=False
+            )
+        ]
 
     def _calculate_weather_strategy_score(self, team: List[Dict[str, Any]],
                                          weather: str,
@@ -0,0 +1,43 @@
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+
+class LazyScreens(Mapping):
+    """
+    Read-only mapping of screen names to screens that are built on first access.
+
+    Building a screen constructs all of its UI elements, so screens the bot
+    never visits are never built.
+    """
+
+    def __init__(self, factories: dict[str, Callable[[], Any]]):
+        """
+        Args:
+            factories (dict[str, Callable[[], Any]]): Screen name to a callable that builds the screen.
+        """
+        self._factories = dict(factories)
+        self._screens: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = self._factories[name]()
+        return screen
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        """
+        Checks if a screen has been built yet.
+
+        Args:
+            name (str): The screen name.
+
+        Returns:
+            bool: True if the screen has been built, False otherwise.
+        """
+        return name in self._screens
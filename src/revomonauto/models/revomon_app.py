@@ -1,5 +1,7 @@
+import importlib
 import io
 import logging
+import sys
 from pathlib import Path
 from time import sleep
 
@@ -7,16 +9,42 @@ from bluepyll import AppLifecycleState, BluePyllApp
 from PIL import Image
 
 from .action import Actions, action
-from .revomon_ui.screens.battle_screen import BattleScreen
-from .revomon_ui.screens.login_screen import LoginScreen
-from .revomon_ui.screens.main_menu_screen import MainMenuScreen
-from .revomon_ui.screens.overworld_screen import OverworldScreen
-from .revomon_ui.screens.shared_screen import SharedScreen
-from .revomon_ui.screens.start_game_screen import StartGameScreen
-from .revomon_ui.screens.team_bag_screen import TeamBagScreen
+from .lazy_screens import LazyScreens
 from .states import BattleState, GameState, requires_state
 from .strategies import BattleStrategy, RandomMove
 
+# Screen name -> (module, class). Screen modules build their UI elements at
+# import time, so they are imported on first use through __getattr__ below.
+SCREENS = {
+    "shared": (".revomon_ui.screens.shared_screen", "SharedScreen"),
+    "start_game": (".revomon_ui.screens.start_game_screen", "StartGameScreen"),
+    "login": (".revomon_ui.screens.login_screen", "LoginScreen"),
+    "overworld": (".revomon_ui.screens.overworld_screen", "OverworldScreen"),
+    "main_menu": (".revomon_ui.screens.main_menu_screen", "MainMenuScreen"),
+    "battle": (".revomon_ui.screens.battle_screen", "BattleScreen"),
+    "team_bag": (".revomon_ui.screens.team_bag_screen", "TeamBagScreen"),
+}
+_SCREEN_MODULES = {class_name: module for module, class_name in SCREENS.values()}
+
+
+def __getattr__(name: str):
+    # PEP 562: import screen classes on first access
+    module = _SCREEN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen_class = getattr(importlib.import_module(module, __package__), name)
+    globals()[name] = screen_class
+    return screen_class
+
+
+def _screen_factory(class_name: str):
+    # Resolve the class when the screen is built so patched classes are honoured
+    return lambda: getattr(sys.modules[__name__], class_name)()
+
+
+# Smallest confidence for OCR text to be replaced by the closest known name
+MIN_NAME_CONFIDENCE = 0.6
+
 LOGGED_IN_STATES = (
     GameState.OVERWORLD,
     GameState.MAIN_MENU,
@@ -39,15 +67,12 @@ class RevomonApp(BluePyllApp):
         super().__init__(
             app_name="revomon",
             package_name="com.revomon.vr",
-            screens={
-                "shared": SharedScreen(),
-                "start_game": StartGameScreen(),
-                "login": LoginScreen(),
-                "overworld": OverworldScreen(),
-                "main_menu": MainMenuScreen(),
-                "battle": BattleScreen(),
-                "team_bag": TeamBagScreen(),
-            },
+            screens=LazyScreens(
+                {
+                    name: _screen_factory(class_name)
+                    for name, (_, class_name) in SCREENS.items()
+                }
+            ),
         )
 
         self.last_action = None
@@ -118,6 +143,10 @@ class RevomonApp(BluePyllApp):
         }
         self.opps_last_move_used = None  # {used_by: xxxx, move_name: xxxx, move_type: xxxx, starting_pp: xx, ending_pp: xx, total_pp: xx}
 
+        # Game data clients, created on first use to resolve OCR'd names
+        self._revomon_client = None
+        self._moves_client = None
+
     def get_current_state(self) -> dict:
         """
         Returns the current state of the Revomon app.
@@ -138,6 +167,52 @@ class RevomonApp(BluePyllApp):
             "battle_sub_state": self.battle_sub_state,
         }
 
+    def resolve_revomon(self, text: str) -> dict | None:
+        """
+        Resolve OCR text to the Revodex entry with the closest name.
+
+        Args:
+            text (str): Raw OCR text of a Revomon name.
+
+        Returns:
+            dict | None: The Revomon record, or None if no name is close enough.
+        """
+        if self._revomon_client is None:
+            # Imported here so the app doesn't load game data until it's needed
+            from ..data.gradex_clients import RevomonClient
+
+            self._revomon_client = RevomonClient(read_only=True)
+        return self._resolve_name(self._revomon_client, text)
+
+    def resolve_move(self, text: str) -> dict | None:
+        """
+        Resolve OCR text to the move with the closest name.
+
+        Args:
+            text (str): Raw OCR text of a move name.
+
+        Returns:
+            dict | None: The move record, or None if no name is close enough.
+        """
+        if self._moves_client is None:
+            # Imported here so the app doesn't load game data until it's needed
+            from ..data.gradex_clients import MovesClient
+
+            self._moves_client = MovesClient(read_only=True)
+        return self._resolve_name(self._moves_client, text)
+
+    def _resolve_name(self, client, text: str) -> dict | None:
+        match = client.resolve_name(text, min_confidence=MIN_NAME_CONFIDENCE)
+        if match is None:
+            self.logger.warning(f"No known name matches OCR text: {text!r}")
+            return None
+        record, confidence = match
+        if confidence < 1.0:
+            self.logger.info(
+                f"Resolved OCR text {text!r} to {record['name']!r} (confidence {confidence:.2f})"
+            )
+        return record
+
     def extract_regions(
         self,
         position_x_sizes: list[tuple[tuple[int, int], tuple[int, int], str]],
@@ -302,7 +377,8 @@ class RevomonApp(BluePyllApp):
                 player1_mon_name_text.path
             )
             if mon_name and mon_name[0]:
-                self.mon_on_field["name"] = mon_name[0]
+                revomon = self.resolve_revomon(mon_name[0])
+                self.mon_on_field["name"] = revomon["name"] if revomon else mon_name[0]
 
             mon_lvl = self.bluepyll_controller.image.img_txt_checker.read_text(
                 player1_mon_lvl_text.path, allowlist="lvl1234567890 "
@@ -323,7 +399,10 @@ class RevomonApp(BluePyllApp):
                 player2_mon_name_text.path
             )
             if opps_mon_name and opps_mon_name[0]:
-                self.opps_mon_on_field["name"] = opps_mon_name[0]
+                opps_revomon = self.resolve_revomon(opps_mon_name[0])
+                self.opps_mon_on_field["name"] = (
+                    opps_revomon["name"] if opps_revomon else opps_mon_name[0]
+                )
 
             opps_mon_lvl = self.bluepyll_controller.image.img_txt_checker.read_text(
                 player2_mon_lvl_text.path, allowlist="lvl1234567890 "
@@ -448,9 +527,12 @@ class RevomonApp(BluePyllApp):
                     try:
                         pp_parts = processed_move_data[1].split("/")
                         if len(pp_parts) == 2:
-                            self.mon_on_field["moves"][i]["name"] = processed_move_data[
-                                0
-                            ]
+                            move = self.resolve_move(processed_move_data[0])
+                            self.mon_on_field["moves"][i]["name"] = (
+                                move["name"] if move else processed_move_data[0]
+                            )
+                            if move:
+                                self.mon_on_field["moves"][i]["type"] = move["type"]
                             self.mon_on_field["moves"][i]["pp"]["current"] = int(
                                 pp_parts[0]
                             )
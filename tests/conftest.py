@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the test suite
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import shared_registry  # noqa: E402
+from revomonauto.data.gradex_clients.snapshot_cache import SnapshotCache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def snapshots(tmp_path, monkeypatch):
+    """Keep every test's snapshots in its own temporary directory."""
+    monkeypatch.setattr(shared_registry, "snapshot_cache", SnapshotCache(tmp_path / "snapshots"))
+    return tmp_path / "snapshots"
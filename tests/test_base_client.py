@@ -0,0 +1,119 @@
+"""
+Tests for BaseDataClient hash indexes and the shared dataset registry
+"""
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    LocationsClient,
+    MovesClient,
+    RevomonClient,
+    shared_registry,
+)
+
+
+def test_primary_key_and_declared_indexes():
+    client = MovesClient()
+    assert client.load_data()
+
+    assert client.has_index("id")
+    assert client.has_index("name")
+
+    earthquake = client.get_move_by_name("earthquake")
+    assert earthquake is not None
+    assert client.get_move_by_id(earthquake["id"]) == earthquake
+
+
+def test_indexed_lookups_match_linear_scan():
+    client = RevomonClient()
+    client.load_data()
+
+    fire = client.find_by_field("type1", "fire")
+    assert fire == [r for r in client.get_all() if r.get("type1") == "fire"]
+
+    # Fields without a declared index are indexed on first lookup
+    assert not client.has_index("spawn_rate")
+    rare_spawns = client.find_by_field("spawn_rate", "1%")
+    assert client.has_index("spawn_rate")
+    assert rare_spawns == [r for r in client.get_all() if r.get("spawn_rate") == "1%"]
+
+    assert client.find_first_by_field("name", "not a revomon") is None
+
+
+def test_returned_records_are_copies():
+    client = RevomonClient()
+    record = client.get_revomon_by_id(1)
+    record["name"] = "changed"
+    assert client.get_revomon_by_id(1)["name"] != "changed"
+
+
+def test_read_only_clients_share_frozen_records():
+    client = RevomonClient(read_only=True)
+    record = client.get_revomon_by_id(1)
+
+    assert record is client.get_revomon_by_name(record["name"])
+    records = client.get_all()
+    assert type(records) is list and records is not client.get_all()
+    assert all(shared is own for shared, own in zip(records, client._data))
+    records.sort(key=lambda r: r["name"])
+    assert client.get_all()[0] is client._data[0]
+    with pytest.raises(TypeError):
+        record["name"] = "changed"
+    with pytest.raises(TypeError):
+        record.update(name="changed")
+
+    mutable = record.copy()
+    mutable["name"] = "changed"
+    assert type(mutable) is dict
+    assert client.get_revomon_by_id(1)["name"] != "changed"
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_force_reload_rebuilds_indexes():
+    client = MovesClient()
+    client.load_data()
+    client.create_index("power")
+    client._indexes["name"] = {}
+
+    assert client.load_data(force_reload=True)
+    assert client.get_move_by_name("earthquake") is not None
+    assert not client.has_index("power")
+
+
+def test_concurrent_index_builds_keep_one_shared_index():
+    first, second = MovesClient(), MovesClient()
+    first.load_data(force_reload=True)
+    second.load_data()
+    assert not first.has_index("accuracy")
+    index = first._build_index("accuracy")
+    built = second._build_index("accuracy")
+
+    assert shared_registry.add_index(first._dataset, "accuracy", index) is index
+    assert shared_registry.add_index(second._dataset, "accuracy", built) is index
+    assert second.create_index("accuracy")
+    assert second._indexes["accuracy"] is index
+
+
+def test_clients_share_one_parsed_dataset():
+    revomon_client = RevomonClient()
+    locations_client = LocationsClient()
+    revomon_client.load_data()
+    locations_client.load_data()
+
+    assert revomon_client._data is locations_client._data
+    assert RevomonClient().get_all() == revomon_client.get_all()
+
+
+def test_memory_report_covers_loaded_datasets():
+    MovesClient().load_data()
+    report = shared_registry.memory_report()
+
+    moves_report = next(v for k, v in report.items() if os.path.basename(k) == "moves.json")
+    assert moves_report["records"] == MovesClient().count()
+    assert "id" in moves_report["indexed_fields"]
+    assert moves_report["bytes"]["total"] > moves_report["bytes"]["indexes"] > 0
@@ -0,0 +1,93 @@
+"""
+Tests for the seeded Monte Carlo battle simulator
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient  # noqa: E402
+from revomonauto.data.gradex_clients.battle_simulation import (  # noqa: E402
+    DuelSide,
+    hit_chance,
+    sample_damage,
+    sample_duels,
+    wilson_interval,
+)
+
+
+def _physical_move(client, accuracy):
+    return next(
+        move for move in client.moves_client.get_all()
+        if move.get("category") == "physical" and (move.get("power") or 0) > 60 and move.get("accuracy") == accuracy
+    )
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert np.isclose(low, 0.4038, atol=1e-3) and np.isclose(high, 0.5962, atol=1e-3)
+    assert wilson_interval(0, 100)[0] == 0.0
+    assert wilson_interval(100, 100)[1] == 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_accuracy_zero_always_hits():
+    assert hit_chance({"accuracy": 0.0}) == 1.0
+    damage, hit, _ = sample_damage((10.0, 20.0), hit_chance({"accuracy": 0.0}), 0.0, 1000, np.random.default_rng(0))
+    assert hit.all()
+    assert ((damage >= 8) & (damage <= 10)).all()
+
+
+def test_same_seed_same_results():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[10], revomon[20]
+    move = _physical_move(client, 0.85)["name"]
+
+    assert client.simulate_turns(attacker, defender, move, samples=2000, rng=5) == \
+        client.simulate_turns(attacker, defender, move, samples=2000, rng=5)
+    assert [client.simulate_battle_turn(attacker, defender, move, rng=seed) for seed in range(20)] == \
+        [client.simulate_battle_turn(attacker, defender, move, rng=seed) for seed in range(20)]
+    assert client.simulate_duel(attacker, defender, move, move, samples=500, rng=9) == \
+        client.simulate_duel(attacker, defender, move, move, samples=500, rng=9)
+
+
+def test_turns_match_exact_probabilities():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[10], revomon[20]
+    move = _physical_move(client, 0.85)
+    normal = [
+        client.calculate_damage(
+            attacker, defender, move, critical_hit=False, random_factor=roll / 100,
+            stab=client._calculate_stab(move, attacker),
+        )["damage"]
+        for roll in range(85, 101)
+    ]
+    # Knock out exactly when the roll is in the top half, without a critical hit
+    defender_hp = normal[8]
+    exact_ko = 0.85 * (0.9375 * np.mean(np.array(normal) >= defender_hp) + 0.0625)
+
+    result = client.simulate_turns(attacker, defender, move["name"], samples=40000, rng=1, defender_hp=defender_hp)
+    assert result["hit"]["low"] <= 0.85 <= result["hit"]["high"]
+    assert result["ko"]["low"] <= exact_ko <= result["ko"]["high"]
+
+
+def test_duel_outcomes():
+    rng = np.random.default_rng(0)
+    strong = DuelSide((100.0, 200.0), 1.0, 0.0, hp=50, speed=10)
+    weak = DuelSide((1.0, 2.0), 1.0, 0.0, hp=50, speed=20)
+    winner, turns = sample_duels(strong, weak, 100, rng)
+    assert (winner == 1).all() and (turns == 1).all()
+
+    # The faster side knocks out first when both would
+    fast = DuelSide((100.0, 200.0), 1.0, 0.0, hp=50, speed=20)
+    winner, _ = sample_duels(strong, fast, 100, rng)
+    assert (winner == 2).all()
+
+    harmless = DuelSide((0.0, 0.0), 1.0, 0.0, hp=50, speed=1)
+    winner, turns = sample_duels(harmless, harmless, 10, rng, max_turns=5)
+    assert (winner == 0).all() and (turns == 0).all()
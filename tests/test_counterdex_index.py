@@ -0,0 +1,75 @@
+"""
+Tests for the parsed counterdex fields and counter graph
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import CounterdexClient, CounterdexIndex  # noqa: E402
+from revomonauto.data.gradex_clients.counterdex_index import (  # noqa: E402
+    parse_evs,
+    parse_metabuilds,
+    parse_metamoves,
+    parse_weaknesses,
+)
+
+
+def test_field_parsers():
+    assert parse_weaknesses("fire 2x\nice 4x\n") == [("fire", 2.0), ("ice", 4.0)]
+    assert parse_weaknesses(None) == []
+    assert parse_evs("252 atk / 4 sp.def/ spa 252, 4 speed") == {
+        "atk": 252, "spd": 4, "spa": 252, "spe": 4
+    }
+    assert parse_metamoves("(lead)\n- flamethrower/ fire blast\n- roost\n\n(set)\n- earthquake") == [
+        {"label": "lead", "slots": [["flamethrower", "fire blast"], ["roost"]]},
+        {"label": "set", "slots": [["earthquake"]]},
+    ]
+    assert parse_metabuilds("ability: blaze / drought\nevs: 252 hp / 4 def\nnature: timid\njolly") == [
+        {"label": None, "abilities": ["blaze", "drought"], "evs": {"hp": 252, "def": 4},
+         "natures": ["timid"], "notes": ["jolly"]}
+    ]
+
+
+def test_counter_graph_matches_counters_field():
+    records = [
+        {"name": "a", "counters": "b\nc (with insomnia)\nany fire type moves"},
+        {"name": "b", "counters": "a"},
+        {"name": "c", "counters": None},
+    ]
+    index = CounterdexIndex(records)
+    assert index.counters_of("a") == ["b", "c"]
+    assert index.countered_by("a") == ["b"]
+    assert index.countered_by("C") == ["a"]
+    assert index.counters_of("c") == []
+    assert sorted(index.edges()) == [("a", "b"), ("b", "a"), ("c", "a")]
+    assert index.entry("a")["counters"] == ["b", "c (with insomnia)", "any fire type moves"]
+
+
+def test_client_queries_match_string_scans():
+    client = CounterdexClient()
+    records = client.get_all()
+
+    def lines(text):
+        return [line.strip().lower() for line in (text or "").split("\n") if line.strip()]
+
+    for names in (["romanfrig"], ["Furnice", "opawan"], ["nobody"]):
+        wanted = [name.lower() for name in names]
+        assert client.get_revomon_with_specific_counters(names) == [
+            r for r in records if any(name in lines(r.get("counters")) for name in wanted)
+        ]
+    for count in (0, 4, 6):
+        assert client.get_revomon_by_weakness_count(count) == [
+            r for r in records if r.get("weakness") and len(lines(r["weakness"])) >= count
+        ]
+
+    for record in records:
+        for counter in client.get_counters_of(record["name"]):
+            assert any(line.split(" (")[0] == counter for line in lines(record.get("counters")))
+            assert record["name"] in client.get_countered_by(counter)
+
+    entry = client.get_parsed_entry("dekute")
+    assert entry["weaknesses"] == [("fire", 2.0), ("ice", 2.0), ("time", 2.0), ("sky", 2.0)]
+    assert entry["metabuilds"][0]["evs"] == {"hp": 252, "def": 4, "spd": 252}
+    entry["counters"].clear()
+    assert client.get_parsed_entry("dekute")["counters"]
@@ -0,0 +1,51 @@
+"""
+Tests for the batched damage calculator
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient  # noqa: E402
+from revomonauto.data.gradex_clients.damage_batch import weather_multiplier  # noqa: E402
+
+
+def test_weather_multiplier():
+    assert weather_multiplier("fire", "sunny") == 1.5
+    assert weather_multiplier("fire", "Rain") == 0.5
+    assert weather_multiplier("ice", "rain") == 1.0
+    assert weather_multiplier("fire", None) == 1.0
+
+
+def test_batch_matches_scalar_calculator():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    moves = client.moves_client.get_all()
+    attackers, defenders = list(revomon[:6]), list(revomon[-5:])
+    picked = list(moves[::40])
+    attacker_levels, defender_levels = [5, 20, 35, 50, 75, 100], [1, 30, 60, 90, 100]
+
+    for options in ({}, {"weather": "rain", "critical_hit": True, "burn": True}, {"stab": True, "other_modifiers": 1.3}):
+        tensor = client.calculate_damage_batch(
+            attackers, defenders, picked, attacker_levels, defender_levels, **options
+        )
+        assert tensor["max_damage"].shape == (len(attackers), len(defenders), len(picked))
+        for i, attacker in enumerate(attackers):
+            for j, defender in enumerate(defenders):
+                for k, move in enumerate(picked):
+                    stab = options.get("stab", client._calculate_stab(move, attacker))
+                    kwargs = dict(
+                        attacker_level=attacker_levels[i], defender_level=defender_levels[j],
+                        weather=options.get("weather"), critical_hit=options.get("critical_hit", False),
+                        burn=options.get("burn", False), stab=stab,
+                        other_modifiers=options.get("other_modifiers", 1.0),
+                    )
+                    rolls = [
+                        client.calculate_damage(attacker, defender, move, random_factor=roll / 100, **kwargs)["damage"]
+                        for roll in range(85, 101)
+                    ]
+                    assert tensor["min_damage"][i, j, k] == rolls[0]
+                    assert tensor["max_damage"][i, j, k] == rolls[-1]
+                    assert np.isclose(tensor["expected_damage"][i, j, k], np.mean(rolls))
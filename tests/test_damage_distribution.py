@@ -0,0 +1,70 @@
+"""
+Tests for exact damage distributions and knockout chances
+"""
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient  # noqa: E402
+from revomonauto.data.gradex_clients.damage_distribution import (  # noqa: E402
+    hit_distribution,
+    hits_to_ko,
+    ko_chances,
+    roll_damage,
+)
+
+
+def test_hit_distribution_sums_to_one():
+    pmf = hit_distribution((45.0, 90.0), 0.85, 0.0625)
+    assert np.isclose(pmf.sum(), 1.0)
+    assert np.isclose(pmf[0], 0.15)
+    assert len(pmf) == roll_damage(90.0).max() + 1
+
+
+def test_ko_chances_match_enumeration():
+    pmf = hit_distribution((30.0, 60.0), 0.9, 0.125)
+    outcomes = [(damage, chance) for damage, chance in enumerate(pmf) if chance]
+    hp = 70
+    for hits in (1, 2, 3):
+        exact = sum(
+            np.prod([chance for _, chance in combo])
+            for combo in itertools.product(outcomes, repeat=hits)
+            if sum(damage for damage, _ in combo) >= hp
+        )
+        assert np.isclose(ko_chances(pmf, hp, 3)[hits - 1], exact)
+
+
+def test_hits_to_ko():
+    pmf = hit_distribution((50.0, 100.0), 1.0, 0.0)
+    chances = ko_chances(pmf, 100, 4)
+    assert chances[0] == 0.0
+    assert hits_to_ko(chances) == 3
+    assert hits_to_ko(ko_chances(hit_distribution((50.0, 100.0), 0.5, 0.0), 100, 4)) == 0
+    assert (ko_chances(pmf, 0, 2) == 1.0).all()
+
+
+def test_client_distribution_matches_calculate_damage():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[10], revomon[20]
+    move = client.moves_client.get_move_by_name("mega punch")
+    stab = client._calculate_stab(move, attacker)
+    rolls = [
+        client.calculate_damage(attacker, defender, move, random_factor=roll / 100, stab=stab)["damage"]
+        for roll in range(85, 101)
+    ]
+
+    single = client.calculate_damage(attacker, defender, move, stab=stab)
+    assert (single["min_damage"], single["max_damage"]) == (rolls[0], rolls[-1])
+
+    result = client.calculate_damage_distribution(attacker, defender, move, defender_hp=rolls[8])
+    hit = client.moves_client.get_move_by_name("mega punch")["accuracy"]
+    assert np.isclose(sum(result["distribution"].values()), 1.0)
+    assert np.isclose(result["distribution"][0], 1 - hit)
+    for damage in set(rolls):
+        assert result["distribution"][damage] >= hit * (1 - 0.0625) * rolls.count(damage) / 16
+    assert np.isclose(result["ko_chances"][1], hit * (0.9375 * np.mean(np.array(rolls) >= rolls[8]) + 0.0625))
@@ -0,0 +1,76 @@
+"""
+Tests for the persisted species x species damage tables
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    BattleMechanicsClient,
+    DamageTables,
+    RevomonMovesClient,
+)
+from revomonauto.data.gradex_clients.damage_tables import (  # noqa: E402
+    NO_MOVE,
+    learnable_mask,
+    tables_key,
+)
+
+
+def test_learnable_mask():
+    species = [{"dex_id": 1}, {"dex_id": 2}]
+    moves = [{"name": "tackle"}, {"name": "ember"}]
+    learnsets = [
+        {"mon_dex_id": 1, "move_name": "ember"},
+        {"mon_dex_id": 2, "move_name": "tackle"},
+        {"mon_dex_id": 3, "move_name": "tackle"},
+    ]
+    assert learnable_mask(species, moves, learnsets).tolist() == [[False, True], [True, False]]
+
+
+def test_tables_key_follows_content(tmp_path):
+    source = tmp_path / "data.json"
+    source.write_text("[]")
+    key = tables_key([source])
+    assert tables_key([source]) == key
+    assert tables_key([source], (50, 100)) != key
+    source.write_text("[{}]")
+    assert tables_key([source]) != key
+
+
+def test_tables_match_batch_calculator(tmp_path):
+    client = BattleMechanicsClient()
+    directory = client.precompute_damage_tables(tables_dir=tmp_path)
+    assert directory.parent == tmp_path
+    assert client.precompute_damage_tables(tables_dir=tmp_path) == directory
+
+    tables = client.get_damage_tables(tables_dir=tmp_path, build=False)
+    assert isinstance(tables, DamageTables)
+    assert not tables.best_move.flags.writeable
+    assert client.get_damage_tables(tables_dir=tmp_path) is tables
+
+    revomon = client.revomon_client.get_all()
+    learnsets = RevomonMovesClient(read_only=True)
+    moves = client.moves_client.get_all()
+    for attacker in revomon[::20]:
+        names = {row["move_name"] for row in learnsets.get_moves_by_revomon_id(attacker["dex_id"])}
+        known = [move for move in moves if move["name"] in names and move["category"] != "status"]
+        for defender in revomon[::25]:
+            found = tables.lookup(attacker["name"], defender["name"], level=40)
+            if not known:
+                assert found is None
+                continue
+            expected = client.calculate_damage_batch([attacker], [defender], known, 50, 50)["expected_damage"][0, 0]
+            assert found is not None
+            assert np.isclose(found[1], expected.max())
+            assert found[0] in {move["name"] for move, value in zip(known, expected) if value == expected.max()}
+
+    defender = revomon[0]["name"]
+    ranked = tables.best_attackers(defender, top_k=3)
+    assert len(ranked) == 3
+    assert [entry[2] for entry in ranked] == sorted((entry[2] for entry in ranked), reverse=True)
+    assert tables.lookup("missing", defender) is None
+    assert (tables.best_move >= NO_MOVE).all()
@@ -0,0 +1,116 @@
+"""
+Tests for the weather and status effect tables
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    AbilitiesClient,
+    BaseDataClient,
+    EffectTable,
+    ItemsClient,
+    MovesClient,
+    StatusEffectsClient,
+    TypesClient,
+    WeatherClient,
+)
+from revomonauto.data.gradex_clients.effect_tables import (  # noqa: E402
+    ability_status_immunities,
+    item_status_cures,
+    move_weather_benefits,
+)
+
+
+def test_effect_table_rows_and_join():
+    records = [
+        {"name": "limber", "description": "Prevents paralysis."},
+        {"name": "insomnia", "description": "Prevents sleep."},
+        {"name": "blaze", "description": "Powers up fire moves."},
+    ]
+    table = EffectTable(records, ability_status_immunities)
+    assert table.get("paralysis") == [(0, {})]
+    assert table.get("sleep") == [(1, {})]
+    assert table.get("burn") == []
+
+    team = [
+        {"name": "x", "ability1": "blaze", "ability2": "limber"},
+        {"name": "y", "ability1": "limber", "abilityh": "limber"},
+    ]
+    assert [(member["name"], record["name"]) for member, record, _ in table.join(records, team, "paralysis")] == [
+        ("x", "limber")
+    ]
+    # A member holding the ability in several fields matches once
+    joined = table.join(records, team, "paralysis", first_only=False)
+    assert [member["name"] for member, _, _ in joined] == ["x", "y"]
+
+
+def test_restricted_table_follows_name_order():
+    records = [
+        {"name": "awakening", "description": ""},
+        {"name": "antidote", "description": ""},
+        {"name": "potion", "description": "removes poison"},
+        {"name": "burn heal", "description": ""},
+    ]
+    table = EffectTable(records, item_status_cures, names=("burn heal", "antidote", "awakening", "missing"))
+    assert table.get("poison") == [(3, {}), (1, {})]
+    assert table.get("sleep") == [(3, {}), (0, {})]
+
+
+def test_weather_ball_benefits_from_every_weather():
+    assert set(move_weather_benefits("weather ball", "")) == {"sunny", "rain", "sandstorm", "hail", "normal"}
+    assert move_weather_benefits("thunderbolt", "") == {"rain": {}}
+
+
+def test_tables_are_shared_per_dataset():
+    first = AbilitiesClient(read_only=True)
+    second = AbilitiesClient(read_only=True)
+    assert first.get_effect_table("ability_status_cures") is second.get_effect_table("ability_status_cures")
+
+
+def test_only_classified_clients_have_tables():
+    for client in (AbilitiesClient(read_only=True), MovesClient(read_only=True), ItemsClient(read_only=True)):
+        assert isinstance(client.get_effect_table("item_status_cures"), EffectTable)
+    assert not hasattr(BaseDataClient, "get_effect_table")
+    assert not hasattr(TypesClient(read_only=True), "get_effect_table")
+
+
+def test_weather_client_reads_tables():
+    client = WeatherClient(read_only=True)
+    sunny = client.get_weather_beneficiaries("sunny")
+    assert {ability["name"] for ability in sunny["abilities"]} >= {"chlorophyll", "solar power"}
+    assert [move["name"] for move in sunny["moves"]] == ["solar beam"]
+
+    generators = client.get_weather_generators("rain")
+    assert any(generator["type"] == "ability" and generator["name"] == "drizzle" for generator in generators)
+
+    team = [{"name": "member", "ability1": "drizzle"}]
+    analysis = client.analyze_weather_strategy(team)
+    assert [entry["revomon"] for entry in analysis["strategies"]["rain"]["generators"]] == ["member"]
+
+
+def test_status_strategy_joins_team():
+    client = StatusEffectsClient(read_only=True)
+    immunities = client.get_status_immunities("paralysis")
+    assert all("type" in immunity for immunity in immunities)
+
+    team = [
+        {"name": "a", "ability1": "static", "type1": "electric"},
+        {"name": "b", "ability1": "insomnia"},
+    ]
+    strategy = client.analyze_status_strategy(team)
+    assert [entry["revomon"] for entry in strategy["team_causers"]["paralysis"]] == ["a"]
+    assert [entry["revomon"] for entry in strategy["team_immunities"]["paralysis"]] == ["a"]
+    assert [entry["revomon"] for entry in strategy["team_immunities"]["sleep"]] == ["b"]
+
+
+def test_weather_records_follow_the_clients_mode():
+    beneficiaries = WeatherClient().get_weather_beneficiaries("rain")
+    records = beneficiaries["abilities"] + beneficiaries["moves"]
+    assert records and all(type(record) is dict for record in records)
+    records[0]["name"] = "changed"
+    assert WeatherClient().get_weather_beneficiaries("rain")["abilities"][0]["name"] != "changed"
+
+    shared = WeatherClient(read_only=True).get_weather_beneficiaries("rain")
+    assert all(type(record) is not dict for record in shared["abilities"] + shared["moves"])
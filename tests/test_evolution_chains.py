@@ -0,0 +1,47 @@
+"""
+Tests for the vectorized evolution chain scorer
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import EvolutionClient  # noqa: E402
+
+
+def test_chains_match_revomon_client():
+    client = EvolutionClient()
+    records = client.revomon_client.get_all()
+    chains = client.revomon_client.get_evolution_chains()
+    starts = [record for record in records if record.get("evo")]
+    assert len(chains) == len(starts)
+    for chain, start in zip(chains.chains, starts):
+        assert [records[position] for position in chain] == (
+            client.revomon_client.get_evolution_chain(start["dex_id"])
+        )
+
+
+def test_vectorized_scores_match_scalar_scorer():
+    client = EvolutionClient()
+    records = client.revomon_client.get_all()
+    chains = client.revomon_client.get_evolution_chains()
+    for target_stats, target_types in (
+        ({"atk": 1.0}, None),
+        (None, ["fire", "water"]),
+        ({"spe": 0.8}, ["neutral", "spirit"]),
+        ({"hp": 1.0}, [None, "toxic"]),
+    ):
+        scores = chains.scores(target_stats, target_types)
+        for chain, score in zip(chains.chains, scores):
+            members = [records[position] for position in chain]
+            assert score == client._score_evolution_chain(members, target_stats, target_types)
+
+
+def test_top_k_returns_best_paths_first():
+    client = EvolutionClient()
+    every = client.find_optimal_evolution_path({"atk": 1.0}, ["fire"], max_evolutions=3)
+    top = client.find_optimal_evolution_path({"atk": 1.0}, ["fire"], max_evolutions=3, top_k=5)
+    assert [path["chain"] for path in top] == [path["chain"] for path in every[:5]]
+    assert [path["score"] for path in every] == sorted((path["score"] for path in every), reverse=True)
+    assert all(len(path["chain"]) <= 3 and path["score"] > 0 for path in every)
+    assert client.find_optimal_evolution_path(None, ["fire"], top_k=0) == []
@@ -0,0 +1,56 @@
+"""
+Tests for the evolution graph
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import EvolutionClient, EvolutionGraph  # noqa: E402
+
+
+def test_graph_follows_evo_field():
+    records = [
+        {"dex_id": 1, "name": "a", "evo": "b", "evo_tree": "t1"},
+        {"dex_id": 2, "name": "b", "evo": "c", "evo_tree": "t1"},
+        {"dex_id": 3, "name": "c", "evo": None, "evo_tree": "t1"},
+        {"dex_id": 4, "name": "d", "evo": "c", "evo_tree": "t1"},
+        {"dex_id": 5, "name": "e", "evo": None, "evo_tree": "t2"},
+    ]
+    graph = EvolutionGraph(records)
+    assert graph.children == [(1,), (2,), (), (2,), ()]
+    assert graph.parents[2] == (1, 3)
+    assert graph.descendants(0) == (1, 2)
+    assert graph.ancestors(2) == (1, 3, 0)
+    assert graph.path(0, 2) == [0, 1, 2]
+    assert graph.path(2, 0) is None
+    assert graph.path(4, 4) == [4]
+    assert graph.trees == {"t1": [0, 1, 2, 3], "t2": [4]}
+    assert graph.position(4) == 3
+
+
+def test_client_trees_and_paths():
+    client = EvolutionClient()
+    records = client.revomon_client.get_all()
+    by_name = {record["name"]: record for record in records}
+
+    for record in records:
+        dex_id = record["dex_id"]
+        children = client._find_evolution_children(dex_id)
+        assert [child["name"] for child in children] == (
+            [record["evo"]] if record.get("evo") in by_name else []
+        )
+        for child in children:
+            assert record["name"] in [p["name"] for p in client._find_evolution_parents(child["dex_id"])]
+
+        # The tree holds the species and everything it can evolve into
+        chain = client.revomon_client.get_evolution_chain(dex_id)
+        tree = client.get_complete_evolution_tree(dex_id)
+        assert [m["name"] for m in tree["all_members"]] == [m["name"] for m in chain]
+        assert client.get_evolution_path(dex_id, chain[-1]["dex_id"]) == chain
+        for ancestor in client.get_evolution_ancestors(dex_id):
+            assert client.get_evolution_path(ancestor["dex_id"], dex_id)[-1] == record
+
+    assert client.get_evolution_path(3, 1) is None
+    assert client.get_evolution_path(1, 99999) is None
+    assert [r["name"] for r in client.get_evolution_descendants(1)] == ["desuke", "deksciple"]
@@ -0,0 +1,49 @@
+"""
+Tests for the RevomonMovesClient learnset index
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import RevomonMovesClient  # noqa: E402
+
+
+def test_learnset_queries_match_scans():
+    client = RevomonMovesClient()
+    records = client.get_all()
+
+    for dex_id in (1, 2, 77, 142, 9999):
+        assert client.get_moves_by_revomon_id(dex_id) == [
+            r for r in records if r["mon_dex_id"] == dex_id
+        ]
+        assert client.get_revomon_levelup_moves_by_level(dex_id, 1) == [
+            r for r in records
+            if r["mon_dex_id"] == dex_id and r["method"] == "levelup" and r["level"] == 1
+        ]
+
+    for move_name in ("swords dance", "earthquake", "not a move"):
+        assert client.get_revomon_with_move(move_name) == [
+            r for r in records if r["move_name"] == move_name
+        ]
+
+    assert client.get_moves_learned_at_level(15) == [
+        r for r in records if r["method"] == "levelup" and r["level"] == 15
+    ]
+    assert client.get_moves_by_learning_method("tutor") == [
+        r for r in records if r["method"] == "tutor"
+    ]
+    assert set(client.get_all_learnable_moves()) == {r["move_name"] for r in records}
+    assert sum(client.get_learning_method_distribution().values()) == len(records)
+
+
+def test_levelup_schedule_is_sorted_by_level():
+    client = RevomonMovesClient()
+    schedule = client.get_levelup_schedule(1)
+
+    assert [r["level"] for r in schedule] == sorted(r["level"] for r in schedule)
+    assert len(schedule) == len(
+        [r for r in client.get_moves_by_revomon_id(1) if r["method"] == "levelup"]
+    )
+    assert all(r["level"] <= 20 for r in client.get_levelup_schedule(1, max_level=20))
+    assert client.get_learnset_index() is RevomonMovesClient().get_learnset_index()
@@ -0,0 +1,63 @@
+"""
+Tests for fuzzy name resolution
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    BaseDataClient,
+    ItemsClient,
+    MovesClient,
+    NameResolver,
+    RevomonClient,
+)
+from revomonauto.data.gradex_clients.name_resolver import edit_distance, normalize  # noqa: E402
+
+
+def brute_force(names, text):
+    key = normalize(text)
+    distances = [edit_distance(key, normalize(name)) for name in names]
+    best = min(distances)
+    return names[distances.index(best)] if best <= max(1, len(key) // 3) else None
+
+
+def test_resolve_matches_brute_force_search():
+    names = [move["name"] for move in MovesClient().get_all()]
+    resolver = NameResolver(names)
+    queries = ["thunder punh", "f1re punch", "EARTHQUAKE", "earth quake", "surff", "hyper beem",
+               "ice", "x", "qwertyuiop", "swords dance!", "close combt", "0ragon claw"]
+    for query in queries:
+        match = resolver.resolve(query)
+        assert (match[0] if match else None) == brute_force(names, query), query
+
+
+def test_confidence_and_limits():
+    resolver = NameResolver(["fire punch", "ice punch", "thunder punch"])
+    assert resolver.resolve("Fire Punch") == ("fire punch", 1.0)
+    name, confidence = resolver.resolve("fire pnch")
+    assert name == "fire punch" and confidence == 0.9
+    assert resolver.resolve("fire pnch", max_distance=0) is None
+    assert resolver.resolve("") is None
+    assert resolver.resolve("zzzzzzzzzzzz") is None
+    assert resolver.candidates("ice punch", 4)[0] == ("ice punch", 0)
+    assert [name for name, _ in resolver.candidates("ice punch", 4)] == ["ice punch", "fire punch"]
+
+
+def test_clients_resolve_ocr_text_to_records():
+    revomon = RevomonClient(read_only=True)
+    record, confidence = revomon.resolve_name("Gor0x")
+    assert record is revomon.get_revomon_by_name("gorox")
+    assert confidence == 1.0
+    assert revomon.resolve_name("dekutte")[0]["name"] == "dekute"
+    assert revomon.resolve_name("dekutte", min_confidence=0.95) is None
+
+    moves = MovesClient()
+    assert moves.resolve_name("karate ch0p")[0] == moves.get_move_by_name("karate chop")
+    assert moves.get_name_resolver() is MovesClient().get_name_resolver()
+
+
+def test_only_screen_read_clients_resolve_names():
+    assert not hasattr(BaseDataClient, "resolve_name")
+    assert not hasattr(ItemsClient(read_only=True), "get_name_resolver")
@@ -0,0 +1,84 @@
+"""
+Tests for learnset-aware optimal move ranking
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient, RevomonMovesClient  # noqa: E402
+
+
+def test_ranks_the_attackers_learnset():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[0], revomon[20]
+    learnset = {row["move_name"] for row in RevomonMovesClient(read_only=True).get_moves_by_revomon_id(attacker["dex_id"])}
+
+    ranked = client.find_optimal_moves(attacker, defender)
+    assert ranked
+    assert {entry["move"]["name"] for entry in ranked} <= learnset
+    assert all(entry["move"]["category"] != "status" for entry in ranked)
+    scores = [entry["expected_damage"] for entry in ranked]
+    assert scores == sorted(scores, reverse=True)
+
+    for entry in ranked[:5]:
+        move = entry["move"]
+        exact = client.calculate_damage_distribution(attacker, defender, move)
+        assert np.isclose(entry["expected_damage"], exact["expected_damage"])
+        assert entry["damage"] == client.calculate_damage(attacker, defender, move, stab=entry["stab"])["damage"]
+
+
+def test_top_k_and_cache():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[0], revomon[20]
+
+    ranked = client.find_optimal_moves(attacker, defender, attacker_level=50, defender_level=60)
+    top = client.find_optimal_moves(attacker, defender, attacker_level=50, defender_level=60, top_k=3)
+    assert top == ranked[:3]
+    assert client.find_optimal_moves(attacker, defender, top_k=0) == []
+    assert len(client._optimal_moves) == 2
+
+    top[0]["damage"] = -1
+    assert client.find_optimal_moves(attacker, defender, attacker_level=50, defender_level=60, top_k=1)[0]["damage"] != -1
+
+
+def test_cache_follows_the_records_passed():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    attacker, defender = revomon[0], revomon[20]
+    base = client.find_optimal_moves(attacker, defender, top_k=1)[0]["expected_damage"]
+
+    boosted = dict(attacker, atk=attacker["atk"] * 3, spa=attacker["spa"] * 3)
+    stronger = client.find_optimal_moves(boosted, defender, top_k=1)[0]["expected_damage"]
+    assert stronger > base
+    assert stronger == BattleMechanicsClient().find_optimal_moves(boosted, defender, top_k=1)[0]["expected_damage"]
+
+
+def test_cache_is_bounded_and_dropped_on_reload(monkeypatch):
+    from revomonauto.data.gradex_clients import battle_mechanics_client
+
+    monkeypatch.setattr(battle_mechanics_client, "OPTIMAL_MOVES_CACHE_SIZE", 3)
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    for defender in revomon[20:25]:
+        client.find_optimal_moves(revomon[0], defender)
+    assert len(client._optimal_moves) == 3
+
+    client.moves_client.load_data(force_reload=True)
+    client.find_optimal_moves(revomon[0], revomon[20])
+    assert len(client._optimal_moves) == 1
+
+
+def test_returned_moves_are_mutable_copies():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    entry = client.find_optimal_moves(revomon[0], revomon[20], top_k=1)[0]
+    entry["move"]["power"] = -1
+    assert client.find_optimal_moves(revomon[0], revomon[20], top_k=1)[0]["move"]["power"] != -1
+
+    turn = client.simulate_battle_turn(revomon[0], revomon[20], entry["move"]["name"], rng=0)
+    assert type(turn["move_info"]) is dict
@@ -0,0 +1,109 @@
+"""
+Tests for process-pool execution of bulk analytics
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    BattleMechanicsClient,
+    ParallelRunner,
+    TeamBuilder,
+    shared_registry,
+)
+from revomonauto.data.gradex_clients.parallel import DATA_FILES, auto_chunk_size, item_seeds  # noqa: E402
+from revomonauto.data.gradex_clients.team_builder import OBJECTIVES, _team_block_values  # noqa: E402
+
+
+def _noisy_square(item, rng):
+    return item * item + rng.random()
+
+
+def _loaded_from_snapshot(data_file):
+    return shared_registry.get(data_file).snapshot_fields is not None
+
+
+def test_auto_chunk_size():
+    # Slow items go one at a time, fast ones fill the target time
+    assert auto_chunk_size(1.0, 100, 4) == 1
+    assert auto_chunk_size(0.001, 10000, 4) == 50
+    # Never fewer than MIN_CHUNKS_PER_WORKER chunks per worker
+    assert auto_chunk_size(0.0, 100, 5) == 5
+    assert auto_chunk_size(0.001, 0, 4) == 1
+
+
+def test_item_seeds_are_independent_of_splitting():
+    seeds = item_seeds(7, 10)
+    assert len(seeds) == 10
+    assert [seed.entropy for seed in seeds] == [seed.entropy for seed in item_seeds(7, 10)]
+    draws = [np.random.default_rng(seed).random() for seed in seeds]
+    assert draws == [np.random.default_rng(seed).random() for seed in item_seeds(7, 20)[:10]]
+
+
+def test_map_is_deterministic_for_any_split():
+    items = list(range(40))
+    serial = ParallelRunner(max_workers=1).map(_noisy_square, items, seed=3)
+    with ParallelRunner(max_workers=2) as runner:
+        chunked = runner.map(_noisy_square, items, chunk_size=3, seed=3)
+        tuned = runner.map(_noisy_square, items, seed=3)
+    assert serial == chunked == tuned
+    assert [int(value) for value in serial] == [item * item for item in items]
+    assert serial != ParallelRunner(max_workers=1).map(_noisy_square, items, seed=4)
+
+
+def test_simulate_matchups_matches_serial():
+    client = BattleMechanicsClient()
+    revomon = client.revomon_client.get_all()
+    move = client.find_optimal_moves(revomon[0], revomon[20], top_k=1)[0]["move"]["name"]
+    matchups = [(revomon[0]["name"], defender["name"], move) for defender in revomon[20:26]]
+    matchups.append((revomon[0]["name"], "not a revomon", move))
+
+    serial = client.simulate_matchups(matchups, samples=500, seed=11)
+    with ParallelRunner(max_workers=2) as runner:
+        parallel = client.simulate_matchups(matchups, samples=500, seed=11, runner=runner)
+    assert serial == parallel
+    assert serial[-1] == {"error": "Revomon 'not a revomon' not found"}
+    first = client.simulate_turns(revomon[0], revomon[20], move, samples=500, rng=item_seeds(11, 7)[0])
+    assert serial[0] == first
+
+
+def test_parallel_damage_tables_match_serial(tmp_path):
+    client = BattleMechanicsClient()
+    assert client._damage_table_inputs() is client._damage_table_inputs()
+    buckets = (50, 100)
+    serial = client.get_damage_tables(buckets, tables_dir=tmp_path / "serial")
+    with ParallelRunner(max_workers=2) as runner:
+        client.precompute_damage_tables(buckets, tables_dir=tmp_path / "parallel", runner=runner)
+    parallel = client.get_damage_tables(buckets, tables_dir=tmp_path / "parallel", build=False)
+    assert np.array_equal(parallel.best_move, serial.best_move)
+    assert np.array_equal(parallel.expected_damage, serial.expected_damage)
+
+
+def test_team_search_matches_serial():
+    builder = TeamBuilder()
+    rng = np.random.default_rng(0)
+    teams = np.sort(rng.integers(0, len(builder.get_features()), size=(6000, 6)), axis=1)
+
+    with ParallelRunner(max_workers=2) as runner:
+        # chunk_size forces the blocks onto the workers
+        blocks = runner.map(_team_block_values, [(OBJECTIVES, teams[:3000]), (OBJECTIVES, teams[3000:])], chunk_size=1)
+        parallel = builder.search(beam_width=64, time_budget=0.0, runner=runner)
+    assert np.array_equal(np.concatenate(blocks), builder._objective_values(teams, OBJECTIVES))
+    assert parallel == builder.search(beam_width=64, time_budget=0.0)
+
+
+@pytest.mark.parametrize("configured", [True, False])
+def test_spawned_workers_load_snapshots(snapshots, monkeypatch, configured):
+    if not configured:
+        monkeypatch.setattr(shared_registry, "snapshot_cache", None)
+    with ParallelRunner(max_workers=2, start_method="spawn") as runner:
+        loaded = runner.map(_loaded_from_snapshot, DATA_FILES, chunk_size=1)
+        snapshot_dir = snapshots if configured else runner._snapshot_dir.name
+        assert len(os.listdir(snapshot_dir)) == len(DATA_FILES)
+    assert loaded == [True] * len(DATA_FILES)
+    # The runner removes the snapshots it owns and leaves configured ones
+    assert os.path.isdir(snapshot_dir) == configured
@@ -0,0 +1,81 @@
+"""
+Tests for the composable query engine
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import Field, MovesClient, RevomonClient  # noqa: E402
+from revomonauto.data.gradex_clients.query import Predicate  # noqa: E402
+
+
+def test_indexed_and_scanned_queries_match_list_comprehensions():
+    client = MovesClient()
+    moves = client.get_all()
+
+    query = client.query().where(
+        (Field("type") == "fire") & (Field("category") == "special"),
+        Field("power") >= 90,
+        Field("accuracy") >= 0.9,
+    )
+    assert query.explain().startswith("hash index on 'type'")
+    assert query.all() == [
+        m for m in moves
+        if m["type"] == "fire" and m["category"] == "special"
+        and m["power"] >= 90 and m["accuracy"] >= 0.9
+    ]
+
+    ranged = client.query().where(Field("power").between(60, 80), Field("pp") < 20)
+    assert ranged.explain().startswith("sorted index on")
+    assert ranged.all() == [m for m in moves if 60 <= m["power"] <= 80 and m["pp"] < 20]
+
+    scanned = client.query().where(
+        Field("description").contains("BURN") | ~(Field("accuracy") >= 0.5)
+    )
+    assert scanned.explain().startswith("full scan")
+    assert scanned.all() == [
+        m for m in moves if "burn" in m["description"].lower() or not m["accuracy"] >= 0.5
+    ]
+    assert client.query().where(Field("type").isin(["fire", "water"])).count() == len(
+        [m for m in moves if m["type"] in ("fire", "water")]
+    )
+
+
+def test_order_by_limit_and_select():
+    client = MovesClient()
+    moves = client.get_all()
+
+    top = client.query().where(Field("type") == "water").order_by("power", descending=True)
+    expected = sorted(
+        (m for m in moves if m["type"] == "water"), key=lambda m: m["power"], reverse=True
+    )
+    assert top.limit(5).all() == expected[:5]
+    assert top.all() == expected
+    assert top.first() == expected[0]
+
+    multi = client.query().order_by("type").order_by("power", descending=True).select("name")
+    by_key = sorted(moves, key=lambda m: (m["type"], -m["power"]))
+    assert multi.all() == [{"name": m["name"]} for m in by_key]
+
+
+def test_missing_values_never_match_ranges_and_sort_last():
+    client = RevomonClient()
+    revomon = client.get_all()
+
+    assert client.query().where(Field("evo_lvl") < 20).all() == [
+        r for r in revomon if r["evo_lvl"] is not None and r["evo_lvl"] < 20
+    ]
+    ordered = client.query().order_by("evo_lvl").all()
+    assert all(r["evo_lvl"] is None for r in ordered[-10:])
+    assert client.query().where(Field("type2") == None).count() == len(  # noqa: E711
+        [r for r in revomon if r["type2"] is None]
+    )
+
+
+def test_predicates_must_implement_compile():
+    with pytest.raises(TypeError):
+        Predicate()
+    assert (Field("type1") == "fire")({"type1": "fire"})
@@ -0,0 +1,55 @@
+"""
+Tests for the columnar Revomon view
+"""
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    BattleMechanicsClient,
+    RevomonClient,
+)
+
+
+def test_columns_are_shared_per_dataset():
+    assert RevomonClient().get_columns() is RevomonClient(read_only=True).get_columns()
+
+
+def test_filters_match_record_scans():
+    client = RevomonClient()
+    records = client.get_all()
+    columns = client.get_columns()
+
+    mask = columns.has_type("water") & columns.between("stat_total", 300, 500)
+    expected = [
+        position
+        for position, record in enumerate(records)
+        if "water" in (record["type1"], record["type2"]) and 300 <= record["stat_total"] <= 500
+    ]
+    assert columns.positions(mask).tolist() == expected
+    assert not columns.equals("rarity", "not a rarity").any()
+    assert columns.positions(columns.equals("type2", None)).tolist() == [
+        position for position, record in enumerate(records) if record["type2"] is None
+    ]
+
+
+def test_top_k_matches_stable_sort():
+    client = RevomonClient()
+    records = client.get_all()
+
+    for limit in (0, 1, 10, 37, 500, -5):
+        highest = sorted(records, key=lambda x: x.get("stat_total", 0), reverse=True)[:limit]
+        lowest = sorted(records, key=lambda x: x.get("stat_total", 0))[:limit]
+        assert client.get_highest_stat_total(limit) == highest
+        assert client.get_lowest_stat_total(limit) == lowest
+
+
+def test_bulk_effective_stats_match_scalar_formula():
+    battle_client = BattleMechanicsClient()
+    all_stats = battle_client.get_all_effective_stats(level=37)
+
+    for record in battle_client.revomon_client.get_all():
+        assert all_stats[record["name"]] == battle_client._get_effective_stats(record, 37)
+    assert all_stats[record["name"]]["hp"] == math.floor(record["hp"] * 1.74 + 47)
@@ -0,0 +1,93 @@
+"""
+Tests for the compiled dataset snapshot cache
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients.dataset_registry import DatasetRegistry  # noqa: E402
+from revomonauto.data.gradex_clients.snapshot_cache import SnapshotCache  # noqa: E402
+
+NATURES_JSON = os.path.join(
+    os.path.dirname(__file__), "..", "src", "revomonauto", "data", "gradex_jsons", "natures.json"
+)
+
+
+def _registry_with_snapshot(tmp_path):
+    data_file = tmp_path / "natures.json"
+    shutil.copy(NATURES_JSON, data_file)
+    cache = SnapshotCache(tmp_path / "snapshots")
+
+    dataset = DatasetRegistry(cache).get(data_file)
+    dataset.indexes["name"] = {r["name"]: [i] for i, r in enumerate(dataset.records)}
+    DatasetRegistry(cache).save_snapshot(dataset)
+    return data_file, cache, dataset
+
+
+def test_snapshot_is_reused_with_its_indexes(tmp_path):
+    data_file, cache, dataset = _registry_with_snapshot(tmp_path)
+    assert cache.snapshot_path(data_file.resolve()).exists()
+
+    reloaded = DatasetRegistry(cache).get(data_file)
+    assert reloaded.records == dataset.records
+    assert reloaded.indexes == dataset.indexes
+    assert reloaded.snapshot_fields == frozenset({"name"})
+
+
+def test_touched_but_unchanged_source_keeps_snapshot(tmp_path):
+    data_file, cache, dataset = _registry_with_snapshot(tmp_path)
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.load(data_file.resolve()) is not None
+
+
+def test_changed_source_invalidates_snapshot(tmp_path):
+    data_file, cache, dataset = _registry_with_snapshot(tmp_path)
+    records = json.loads(data_file.read_text(encoding="utf-8"))
+    records[0]["name"] = "renamed"
+    data_file.write_text(json.dumps(records), encoding="utf-8")
+
+    assert cache.load(data_file.resolve()) is None
+    reloaded = DatasetRegistry(cache).get(data_file)
+    assert reloaded.records[0]["name"] == "renamed"
+    assert reloaded.indexes == {}
+
+
+def test_shared_registry_snapshots_are_on_by_default(tmp_path):
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    script = (
+        "from revomonauto.data.gradex_clients import shared_registry;"
+        "print(shared_registry.snapshot_cache and shared_registry.snapshot_cache.cache_dir)"
+    )
+    env = {key: value for key, value in os.environ.items() if not key.startswith("REVOMONAUTO_")}
+    env.update(PYTHONPATH=src, HOME=str(tmp_path))
+
+    def cache_dir(**overrides):
+        result = subprocess.run(
+            [sys.executable, "-c", script], env={**env, **overrides},
+            capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
+
+    assert cache_dir() == str(tmp_path / ".cache" / "revomonauto" / "snapshots")
+    assert cache_dir(REVOMONAUTO_CACHE_DIR=str(tmp_path / "cache")) == str(tmp_path / "cache")
+    assert cache_dir(REVOMONAUTO_NO_SNAPSHOTS="1") == "None"
+
+
+def test_enable_and_disable_snapshots(tmp_path):
+    data_file = tmp_path / "natures.json"
+    shutil.copy(NATURES_JSON, data_file)
+    registry = DatasetRegistry()
+    assert registry.snapshot_cache is None
+
+    registry.enable_snapshots(tmp_path / "snapshots")
+    registry.save_snapshot(registry.get(data_file))
+    assert registry.snapshot_cache.snapshot_path(data_file.resolve()).exists()
+
+    registry.disable_snapshots()
+    assert registry.snapshot_cache is None
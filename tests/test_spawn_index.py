@@ -0,0 +1,74 @@
+"""
+Tests for the spawn location and time-window indexes
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import LocationsClient  # noqa: E402
+from revomonauto.data.gradex_clients.spawn_index import (  # noqa: E402
+    IntervalIndex,
+    minute_of_day,
+    parse_window,
+)
+
+
+def covers(window, minute):
+    start, end = window
+    return start <= minute <= end if start <= end else minute >= start or minute <= end
+
+
+def test_time_parsing():
+    assert minute_of_day("14:30") == 870
+    assert minute_of_day("24:59") == 59
+    assert minute_of_day(1500) == 60
+    assert minute_of_day("noon") is None
+    assert parse_window("4:00 to 9:59") == (240, 599)
+    assert parse_window("20:00 to 3:59") == (1200, 239)
+    assert parse_window("3:60 to 4:00") == (240, 240)
+    assert parse_window(None) is None
+
+
+def test_interval_index_matches_brute_force():
+    windows = [(240, 599), (1200, 239), (600, 1199), (1200, 59), (660, 59), (300, 300)]
+    index = IntervalIndex([(start, end, i) for i, (start, end) in enumerate(windows)])
+    for minute in range(0, 1440):
+        assert index.at(minute) == tuple(
+            i for i, window in enumerate(windows) if covers(window, minute)
+        ), minute
+
+
+def test_spawns_at_location_and_time():
+    client = LocationsClient()
+    records = client.get_all()
+    for location in client.get_all_spawn_locations():
+        for time in ("0:30", "4:00", "9:59", "14:30", "23:59"):
+            minute = minute_of_day(time)
+            expected = []
+            for record in records:
+                for slot in (1, 2, 3):
+                    loc = record.get(f"spawn_loc{slot}")
+                    window = parse_window(record.get(f"spawn_time{slot}"))
+                    if loc and loc.lower() == location and window and covers(window, minute):
+                        expected.append((record["name"], record[f"spawn_time{slot}"]))
+            spawns = client.get_spawns_at(location, time)
+            assert [(s["name"], s["spawn_time"]) for s in spawns] == expected
+            assert all(s["spawn_location"].lower() == location for s in spawns)
+    assert "drassius town" in client.get_locations_at_time("5:00")
+
+
+def test_statistics_match_spawn_details():
+    client = LocationsClient()
+    stats = client.get_location_statistics()
+    for location, location_stats in stats["locations"].items():
+        details = client.get_spawn_details(location)
+        assert location_stats["total_revomon"] == details["revomon_count"]
+        assert location_stats["unique_revomon"] == details["unique_revomon"]
+        assert location_stats["spawn_times"] == details["spawn_times"]
+        assert location_stats["spawn_rates"] == details["spawn_rates"]
+        rates = [r.get("spawn_rate") for r in details["revomon"] if r.get("spawn_rate") != "Unknown"]
+        assert details["spawn_rates"] == list(dict.fromkeys(rates))
+    assert stats["total_spawn_entries"] == sum(
+        len(client.get_revomon_by_location(location)) for location in stats["locations"]
+    )
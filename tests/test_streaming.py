@@ -0,0 +1,81 @@
+"""
+Tests for incremental JSON parsing and streamed record iteration
+"""
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import BaseDataClient, shared_registry  # noqa: E402
+from revomonauto.data.gradex_clients.snapshot_cache import SnapshotCache  # noqa: E402
+from revomonauto.data.gradex_clients.streaming import iter_json_array  # noqa: E402
+
+JSON_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "revomonauto", "data", "gradex_jsons")
+
+
+class LearnsetFileClient(BaseDataClient):
+    indexed_fields = ("move_name",)
+
+    def get_primary_key_field(self) -> str:
+        return "mon_dex_id"
+
+
+def _copy_learnsets(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_registry, "snapshot_cache", SnapshotCache(tmp_path / "snapshots"))
+    data_file = tmp_path / "revomon_moves.json"
+    shutil.copy(os.path.join(JSON_DIR, "revomon_moves.json"), data_file)
+    return data_file
+
+
+def test_iter_json_array_matches_json_load(tmp_path):
+    for name in ("natures.json", "types.json", "revomon.json"):
+        path = os.path.join(JSON_DIR, name)
+        with open(path, encoding="utf-8") as f:
+            expected = json.load(f)
+        assert list(iter_json_array(path, chunk_size=7)) == expected
+
+    data_file = tmp_path / "numbers.json"
+    data_file.write_text(' [ 1, 22 ,333, "x", {"a": [1, 2]} ] ')
+    for chunk_size in (1, 2, 3, 64):
+        assert list(iter_json_array(data_file, chunk_size)) == [1, 22, 333, "x", {"a": [1, 2]}]
+
+
+def test_streaming_filters_and_projects_without_loading(tmp_path, monkeypatch):
+    data_file = _copy_learnsets(tmp_path, monkeypatch)
+    with open(data_file, encoding="utf-8") as f:
+        records = json.load(f)
+    client = LearnsetFileClient(data_file)
+
+    matches = client.iter_records(
+        where=lambda r: r["move_name"] == "earthquake", fields=("mon_name", "level"), limit=3
+    )
+    assert list(matches) == [
+        {"mon_name": r["mon_name"], "level": r["level"]}
+        for r in records if r["move_name"] == "earthquake"
+    ][:3]
+    assert not client.is_loaded()
+    assert shared_registry.get_current(data_file) is None
+
+
+def test_streaming_with_load_indexes_as_it_parses(tmp_path, monkeypatch):
+    data_file = _copy_learnsets(tmp_path, monkeypatch)
+    client = LearnsetFileClient(data_file)
+
+    assert sum(1 for _ in client.iter_records(load=True)) == 6374
+    assert client.is_loaded()
+    dataset = shared_registry.get_current(data_file)
+    assert dataset is not None and client._data is dataset.records
+    assert client._indexes["move_name"] == client._build_index("move_name")
+    assert client._indexes["mon_dex_id"] == client._build_index("mon_dex_id")
+    shared_registry.invalidate(data_file)
+
+
+def test_streaming_stops_at_malformed_json(tmp_path):
+    data_file = tmp_path / "broken.json"
+    data_file.write_text('{"mon_dex_id": 1}')
+    assert list(LearnsetFileClient(data_file).iter_records()) == []
+
+    data_file.write_text('[{"mon_dex_id": 1} {"mon_dex_id": 2}]')
+    assert list(LearnsetFileClient(data_file).iter_records()) == [{"mon_dex_id": 1}]
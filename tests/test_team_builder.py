@@ -0,0 +1,56 @@
+"""
+Tests for the team builder search
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient, TeamBuilder  # noqa: E402
+from revomonauto.data.gradex_clients.team_builder import OBJECTIVES, pareto_front  # noqa: E402
+
+
+def test_pareto_front():
+    values = np.array([[1, 1], [2, 0], [0, 2], [1, 0], [2, 0], [0.5, 0.5]])
+    assert pareto_front(values).tolist() == [True, True, True, False, True, False]
+
+
+def test_evaluate_matches_type_analysis():
+    builder = TeamBuilder()
+    revomon = builder.revomon_client.get_all()
+    team = [record["name"] for record in revomon[:6]]
+    result = builder.evaluate(team)
+    assert set(result["objectives"]) == set(OBJECTIVES)
+    assert np.isclose(result["score"], sum(result["objectives"].values()))
+
+    analysis = BattleMechanicsClient().analyze_type_coverage(list(revomon[:6]))
+    assert np.isclose(result["objectives"]["coverage"], analysis["overall_coverage"])
+    assert "error" in builder.evaluate(["not a revomon"])
+
+
+def test_search_returns_pareto_optimal_teams():
+    builder = TeamBuilder()
+    first = builder.search(beam_width=8, time_budget=0.0, include=["dekute"], exclude=["tidju"], max_results=None)
+    assert first == builder.search(beam_width=8, time_budget=0.0, include=["dekute"], exclude=["tidju"], max_results=None)
+
+    values = np.array([list(result["objectives"].values()) for result in first])
+    assert pareto_front(values).all()
+    scores = [result["score"] for result in first]
+    assert scores == sorted(scores, reverse=True)
+    for result in first:
+        assert len(set(result["team"])) == 6
+        assert "dekute" in result["team"] and "tidju" not in result["team"]
+
+
+def test_custom_objectives_and_weights():
+    builder = TeamBuilder()
+    objectives = {"stats": OBJECTIVES["stats"]}
+    best = builder.search(team_size=3, objectives=objectives, beam_width=4, time_budget=0.0)
+    totals = builder.get_features().stat_total
+    top = sorted(totals, reverse=True)[:3]
+    # Teams tied on the only objective are all on the front
+    for result in best:
+        assert set(result["objectives"]) == {"stats"}
+        assert np.isclose(result["objectives"]["stats"], np.mean(top) / totals.max())
@@ -0,0 +1,82 @@
+"""
+Tests for the inverted text index
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import (  # noqa: E402
+    AbilitiesClient,
+    CounterdexClient,
+    MovesClient,
+    TextIndex,
+)
+
+
+def test_contains_matches_substring_scan():
+    client = MovesClient()
+    moves = client.get_all()
+    index = client.get_text_index()
+
+    for keyword in ["burn", "BURN", "special attack", "use", "same-type", "the user's",
+                    "hp", "x", "", "no such phrase", "1/8"]:
+        expected = tuple(
+            position for position, move in enumerate(moves)
+            if keyword.lower() in (move.get("description") or "").lower()
+        )
+        assert index.contains(keyword) == expected, keyword
+        # Cached answers are the same
+        assert index.contains(keyword) == expected, keyword
+
+
+def test_search_and_phrase():
+    records = [
+        {"description": "Raises the user's Attack."},
+        {"description": "Lowers the target's Attack and Defense."},
+        {"description": "The user attacks first.", "tips": "Raises nothing"},
+    ]
+    index = TextIndex(records, ("description", "tips"))
+
+    assert index.search(["attack"]) == [0, 1]
+    assert index.search(["raises", "user"]) == [0, 2]
+    assert index.search(["raises", "defense"], match_all=False) == [0, 1, 2]
+    assert index.search(["missing"]) == []
+    assert index.phrase("the user's attack") == [0]
+    assert index.phrase("attack and defense") == [1]
+    assert index.phrase("attacks first") == [2]
+    # Phrases and substrings don't span fields
+    assert index.phrase("first raises") == []
+    assert index.contains("first.raises") == ()
+    assert index.contains("tack") == (0, 1, 2)
+    assert index.contains_any(["tack", "nothing"]) == (0, 1, 2)
+
+
+def test_find_by_keywords_across_fields():
+    abilities = AbilitiesClient()
+    keyword = "guard"
+    assert abilities.get_abilities_by_keyword(keyword) == [
+        a for a in abilities.get_all()
+        if keyword in a["name"].lower() or keyword in a["description"].lower()
+    ]
+
+    counterdex = CounterdexClient()
+    keywords = ["tank", "wall"]
+    assert counterdex.get_tank_revomon() == counterdex.find_by_keywords(
+        ["tank", "defensive", "defense", "bulky", "wall"], fields=("description", "tips")
+    )
+    assert counterdex.find_by_keywords(keywords, fields=("description", "tips")) == [
+        r for r in counterdex.get_all()
+        if any(
+            k in (r.get("description") or "").lower() or k in (r.get("tips") or "").lower()
+            for k in keywords
+        )
+    ]
+
+
+def test_cached_results_cant_be_changed_by_callers():
+    client = MovesClient()
+    count = len(client.find_by_keywords(["poison"]))
+    assert count
+    assert isinstance(client.get_text_index("description").contains("poison"), tuple)
+    assert len(MovesClient().find_by_keywords(["poison"])) == count
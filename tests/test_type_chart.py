@@ -0,0 +1,49 @@
+"""
+Tests for the dense type-effectiveness matrix
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient, TypesClient  # noqa: E402
+
+
+def test_chart_matches_type_records():
+    client = TypesClient()
+    chart = client.get_type_chart()
+
+    assert chart.matrix.shape == (60, 18)
+    for record in client.get_all():
+        for attacker in chart.attacking_types:
+            assert client.get_effectiveness_against(attacker, record["types_str"]) == record[attacker]
+            # Dual-type rows are the product of their single-type rows
+            assert chart.multiplier(attacker, record["type1"], record["type2"]) == record[attacker]
+    assert client.get_effectiveness_against("fire", "not a type") is None
+    assert client.get_effectiveness_against("not a type", "fire") == 1.0
+
+
+def test_vectorized_multipliers_match_scalar_lookups():
+    chart = TypesClient().get_type_chart()
+    names = list(chart.attacking_types) + [None, "not a type"]
+    attackers, type1, type2 = np.meshgrid(
+        chart.encode(names), chart.encode(names), chart.encode(names), indexing="ij"
+    )
+    grid = chart.multipliers(attackers, type1, type2)
+
+    for i, attacker in enumerate(names):
+        for j, first in enumerate(names):
+            for k, second in enumerate(names):
+                assert grid[i, j, k] == chart.multiplier(attacker, first, second)
+
+
+def test_damage_respects_type_immunity():
+    battle_client = BattleMechanicsClient()
+    chart = battle_client.types_client.get_type_chart()
+    attacker, defender = np.argwhere(chart.single.T == 0.0)[0]
+    move = {"type": chart.attacking_types[attacker]}
+    immune = {"type1": chart.attacking_types[defender], "type2": None}
+
+    assert battle_client._calculate_type_effectiveness(move, immune) == 0.0
@@ -0,0 +1,64 @@
+"""
+Tests for bitmask type profiles and team type scoring
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from revomonauto.data.gradex_clients import BattleMechanicsClient, TypesClient  # noqa: E402
+from revomonauto.data.gradex_clients.type_profiles import team_codes  # noqa: E402
+
+
+def test_profiles_match_the_chart():
+    profiles = TypesClient(read_only=True).get_type_profiles()
+    chart = profiles.chart
+    types = list(chart.attacking_types)
+    for type1 in types:
+        for type2 in [None] + types:
+            code1, code2 = chart.encode([type1, type2])
+            resist = profiles.names(profiles.resist[code1, code2])
+            immune = profiles.names(profiles.immune[code1, code2])
+            weak = profiles.names(profiles.weak[code1, code2])
+            assert resist == [a for a in types if chart.multiplier(a, type1, type2) < 1.0]
+            assert immune == [a for a in types if chart.multiplier(a, type1, type2) == 0.0]
+            assert weak == [
+                a for a in types
+                if chart.multiplier(a, type1) >= 2.0 or (type2 and chart.multiplier(a, type2) >= 2.0)
+            ]
+    assert TypesClient(read_only=True).get_type_profiles() is profiles
+
+
+def test_score_team_types_matches_per_team_analysis():
+    client = BattleMechanicsClient()
+    profiles = client.types_client.get_type_profiles()
+    revomon = list(client.revomon_client.get_all())
+    rng = random.Random(0)
+    teams = [rng.sample(revomon, rng.randint(1, 6)) for _ in range(50)] + [[]]
+
+    scores = client.score_team_types(teams)
+    for row, team in enumerate(teams):
+        analysis = client.analyze_type_coverage(team)
+        assert scores["coverage"][row] == analysis["covered_types"]
+        shared = [name for name, members in analysis["weaknesses"].items() if len(members) >= 2]
+        assert scores["shared_weaknesses"][row] == len(shared)
+        resisted = {
+            a for a in profiles.chart.attacking_types for revomon_ in team
+            if profiles.chart.multiplier(a, revomon_.get("type1"), revomon_.get("type2")) < 1.0
+        }
+        assert scores["unresisted"][row] == profiles.size - len(resisted)
+
+
+def test_team_codes_pad_with_empty_members():
+    profiles = TypesClient(read_only=True).get_type_profiles()
+    team = [{"type1": profiles.chart.attacking_types[0], "type2": None}]
+    type1, type2 = team_codes(profiles, [team, []], size=3)
+    assert type1.shape == (2, 3)
+    assert (type1[1] == -1).all() and (type2 == -1).all()
+    padded = profiles.score_teams(type1, type2)
+    alone = profiles.score_teams(*team_codes(profiles, [team]))
+    assert padded["coverage"][0] == alone["coverage"][0]
+    assert np.array_equal(padded["unresisted"], [alone["unresisted"][0], profiles.size])